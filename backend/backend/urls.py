@@ -19,6 +19,12 @@ from django.urls import path
 from django.conf import settings
 from django.conf.urls.static import static
 from core import views as core_views
+
+# Hot read endpoints can be served by native async views under ASGI
+if getattr(settings, "ASYNC_API", False):
+    from core import async_views as api_views
+else:
+    api_views = core_views
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -28,6 +34,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     # Simple API endpoint for frontend connectivity checks
     path('api/status/', core_views.status, name='api-status'),
+    path('api/bootstrap/', core_views.bootstrap, name='api-bootstrap'),
     path('api/whoami/', core_views.whoami, name='api-whoami'),
 
     # JWT auth endpoints
@@ -37,15 +44,23 @@ urlpatterns = [
     # User registration
     path('api/register/', core_views.register, name='api-register'),
     # Services (example Firestore-backed endpoints)
-    path('api/services/', core_views.services_list, name='api-services'),
-    path('api/bookings/', core_views.bookings, name='api-bookings'),
-    path('api/services/<str:service_id>/', core_views.service_detail, name='api-service-detail'),
+    path('api/services/', api_views.services_list, name='api-services'),
+    path('api/bookings/', api_views.bookings, name='api-bookings'),
+    path('api/services/batch/', core_views.services_batch, name='api-services-batch'),
+    path('api/services/<str:service_id>/', api_views.service_detail, name='api-service-detail'),
     path('api/bookings/<str:booking_id>/', core_views.booking_detail, name='api-booking-detail'),
-    path('api/admin/bookings/', core_views.admin_bookings, name='api-admin-bookings'),
-    path('api/me/', core_views.me, name='api-me'),
+    path('api/admin/bookings/', api_views.admin_bookings, name='api-admin-bookings'),
+    path('api/admin/bookings/bulk/', core_views.admin_bookings_bulk, name='api-admin-bookings-bulk'),
+    path('api/admin/bookings/export/', api_views.admin_bookings_export, name='api-admin-bookings-export'),
+    path('api/admin/services/bulk/', core_views.admin_services_bulk, name='api-admin-services-bulk'),
+    path('api/admin/users/roles/bulk/', core_views.admin_roles_bulk, name='api-admin-roles-bulk'),
+    path('api/me/', api_views.me, name='api-me'),
     path('api/me/stats/', core_views.me_stats, name='api-me-stats'),
-    path('api/admin/users/', core_views.admin_users, name='api-admin-users'),
+    path('api/admin/users/', api_views.admin_users, name='api-admin-users'),
+    path('api/admin/profiles/batch/', core_views.admin_profiles_batch, name='api-admin-profiles-batch'),
     path('api/admin/users/<str:user_id>/role/', core_views.admin_set_user_role, name='api-admin-set-user-role'),
+    path('api/admin/analytics/bookings/', core_views.admin_booking_analytics, name='api-admin-booking-analytics'),
+    path('api/admin/metrics/', core_views.admin_metrics, name='api-admin-metrics'),
     path('api/categories/', core_views.categories, name='api-categories'),
     path('api/uploads/service-image/', core_views.upload_service_image, name='api-upload-service-image'),
 ]
@@ -0,0 +1,4 @@
+"""Ad-hoc performance benchmarks. Run from the backend directory, e.g.
+`python -m benchmarks.streaming`. They use synthetic documents and need no
+Firebase credentials.
+"""
@@ -0,0 +1,82 @@
+"""Compare booking analytics computed row by row with core.analytics' NumPy frame.
+
+Usage: python -m benchmarks.analytics [--sizes 100000 1000000] [--repeat 5]
+
+Bookings are synthetic, spread over a year of booking dates, 300 services and
+all statuses. The row-by-row baseline is the dict loop the admin page used to
+run over list_all_bookings(). Reports the frame build time (what a full
+reload costs after the Firestore reads) and the best-of-N query time for each
+bucket.
+"""
+import argparse
+import random
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from core.analytics import BUCKETS, BookingFrame  # noqa: E402
+
+
+def fake_bookings(n, seed=1):
+    rng = random.Random(seed)
+    start = date(2026, 1, 1)
+    statuses = ("pending", "confirmed", "completed", "cancelled")
+    for i in range(n):
+        day = start + timedelta(days=rng.randrange(365))
+        service = rng.randrange(300)
+        yield {
+            "id": f"booking{i:08d}",
+            "service_id": f"service{service:03d}",
+            "service_title": f"Service {service}",
+            "booking_date": day.isoformat(),
+            "total_price": rng.choice((499, 999, 1499, 2499)),
+            "status": statuses[rng.randrange(4)],
+            "created_at": f"{day.isoformat()}T09:30:00.{i % 1000000:06d}Z",
+        }
+
+
+def row_by_row(bookings):
+    per_day, per_service, per_status = defaultdict(lambda: [0, 0.0]), defaultdict(lambda: [0, 0.0]), defaultdict(lambda: [0, 0.0])
+    for b in bookings:
+        revenue = 0.0 if b["status"] == "cancelled" else float(b["total_price"])
+        for table, key in ((per_day, b["booking_date"]), (per_service, b["service_id"]), (per_status, b["status"])):
+            table[key][0] += 1
+            table[key][1] += revenue
+    return per_day, per_service, per_status
+
+
+def best_of(repeat, fn, *args, **kwargs):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'bookings':>9} {'build s':>8} {'python ms':>10}" + "".join(f" {bucket + ' ms':>9}" for bucket in BUCKETS))
+    for n in args.sizes:
+        bookings = list(fake_bookings(n))
+        start = time.perf_counter()
+        frame = BookingFrame.build(bookings)
+        build = time.perf_counter() - start
+        row = f"{n:>9} {build:>8.2f} {best_of(args.repeat, row_by_row, bookings) * 1000:>10.1f}"
+        for bucket in BUCKETS:
+            row += f" {best_of(args.repeat, frame.aggregate, bucket=bucket) * 1000:>9.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
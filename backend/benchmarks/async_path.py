@@ -0,0 +1,94 @@
+"""Measure the two costs the ASGI path used to pay for its sync fallbacks.
+
+Usage: python -m benchmarks.async_path [--concurrency 50] [--latency-ms 25] [--docs 100000]
+
+1. Delegated sync work (writes, auth and role checks): `--concurrency`
+   simultaneous calls of a sync function that waits `--latency-ms` (one
+   Firestore round trip), through sync_to_async's default thread_sensitive=True
+   and through core.async_views._off_thread. Reports per-call latency and wall time.
+2. Streamed listings: time-to-first-byte and peak traced memory for an NDJSON
+   body of `--docs` bookings served to an async consumer, as Django does for a
+   sync iterator (sync_to_async(list) first) and through core.streaming.async_streaming.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import tracemalloc
+import warnings
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+django.setup()
+
+from asgiref.sync import sync_to_async  # noqa: E402
+from django.http import StreamingHttpResponse  # noqa: E402
+
+from benchmarks.streaming import fake_bookings  # noqa: E402
+from core.async_views import _off_thread  # noqa: E402
+from core.streaming import async_streaming, ndjson_chunks  # noqa: E402
+
+
+async def delegate(wrap, concurrency, latency):
+    def round_trip():
+        time.sleep(latency)
+
+    async def one():
+        start = time.perf_counter()
+        await wrap(round_trip)()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(one() for _ in range(concurrency)))
+    return sorted(latencies), time.perf_counter() - start
+
+
+async def consume(response):
+    start = time.perf_counter()
+    ttfb = None
+    size = 0
+    async for chunk in response:
+        if ttfb is None:
+            ttfb = time.perf_counter() - start
+        size += len(chunk)
+    return ttfb, time.perf_counter() - start, size
+
+
+def stream(n, wrap):
+    response = wrap(StreamingHttpResponse(ndjson_chunks(fake_bookings(n))))
+    tracemalloc.start()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # Django warns when it buffers a sync iterator
+            ttfb, elapsed, size = asyncio.run(consume(response))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return ttfb, elapsed, size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=25)
+    parser.add_argument("--docs", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{args.concurrency} concurrent delegated calls of {args.latency_ms:g} ms each")
+    print(f"{'mode':<24} {'p50 ms':>8} {'p99 ms':>8} {'wall ms':>8}")
+    for mode, wrap in (("thread_sensitive=True", sync_to_async), ("_off_thread", _off_thread)):
+        latencies, wall = asyncio.run(delegate(wrap, args.concurrency, args.latency_ms / 1000))
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"{mode:<24} {statistics.median(latencies) * 1000:>8.1f} {p99 * 1000:>8.1f} {wall * 1000:>8.1f}")
+
+    print(f"\nNDJSON stream of {args.docs} bookings to an async consumer")
+    print(f"{'mode':<24} {'ttfb ms':>8} {'total ms':>9} {'MB out':>7} {'peak MB':>8}")
+    for mode, wrap in (("sync iterator", lambda r: r), ("async_streaming", async_streaming)):
+        ttfb, elapsed, size, peak = stream(args.docs, wrap)
+        print(f"{mode:<24} {ttfb * 1000:>8.1f} {elapsed * 1000:>9.1f} {size / 1e6:>7.1f} {peak / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Minimal concurrent HTTP load generator for comparing WSGI and ASGI deployments.
+
+Usage: python -m benchmarks.http_load http://127.0.0.1:8000/api/services/ \
+           --requests 2000 --concurrency 200 [--header "Authorization: Bearer <token>"]
+
+Start the server once as WSGI (gunicorn backend.wsgi --threads N) and once as
+ASGI (ASYNC_API=True gunicorn backend.asgi:application -k uvicorn.workers.UvicornWorker)
+with the same worker count, then compare requests/s and latency percentiles.
+Uses only the standard library.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+async def fetch(host, port, path, headers):
+    reader, writer = await asyncio.open_connection(host, port)
+    lines = [f"GET {path} HTTP/1.1", f"Host: {host}:{port}", "Connection: close", *headers, "", ""]
+    writer.write("\r\n".join(lines).encode("latin-1"))
+    await writer.drain()
+    status_line = await reader.readline()
+    await reader.read()  # drain body until the server closes
+    writer.close()
+    return int(status_line.split()[1])
+
+
+async def run(url, total, concurrency, headers):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    latencies, statuses = [], {}
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                code = await fetch(host, port, path, headers)
+            except OSError:
+                code = "error"
+            latencies.append(time.perf_counter() - started)
+            statuses[code] = statuses.get(code, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, sorted(latencies), statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent GET load test")
+    parser.add_argument("url")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--header", action="append", default=[], help="Extra request header, repeatable")
+    args = parser.parse_args()
+
+    elapsed, latencies, statuses = asyncio.run(run(args.url, args.requests, args.concurrency, args.header))
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    print(f"requests:    {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.1f} req/s)")
+    print(f"latency ms:  p50 {pct(0.50):.1f}  p95 {pct(0.95):.1f}  p99 {pct(0.99):.1f}  mean {statistics.mean(latencies) * 1000:.1f}")
+    print(f"statuses:    {statuses}")
+
+
+if __name__ == "__main__":
+    main()
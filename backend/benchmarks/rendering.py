@@ -0,0 +1,84 @@
+"""Compare JSON renderers and response compression on admin listing payloads.
+
+Usage: python -m benchmarks.rendering [--sizes 500 5000] [--repeat 5]
+
+Renders synthetic /api/admin/bookings/ and /api/admin/users/ bodies with DRF's
+JSONRenderer and core.renderers.FastJSONRenderer, then compresses the result
+the way core.middleware does. Reports the best-of-N encode/compress time and
+the bytes sent for each.
+"""
+import argparse
+import gzip
+import time
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from benchmarks.streaming import fake_bookings  # noqa: E402
+from core import encoding  # noqa: E402
+from core.renderers import FastJSONRenderer  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def fake_admin_users(n):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": f"uid{i:08d}",
+            "name": f"Customer {i}",
+            "email": f"customer{i}@example.com",
+            "phone": f"+44 7700 {i % 1000000:06d}",
+            "address": "221B Baker Street, Marylebone, London NW1 6XE",
+            # Firestore hands back timestamps, not strings
+            "created_at": base + timedelta(minutes=i),
+            "roles": ["admin"] if i % 50 == 0 else ["user"],
+        }
+        for i in range(n)
+    ]
+
+
+def best_of(repeat, fn, *args):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    renderers = [("drf", JSONRenderer()), (f"fast/{encoding.backend_name()}", FastJSONRenderer())]
+    compressors = [("gzip", lambda body: gzip.compress(body, compresslevel=6, mtime=0))]
+    if brotli is not None:
+        compressors.append(("br", lambda body: brotli.compress(body, quality=5)))
+
+    print(f"{'endpoint':<16} {'docs':>6} {'renderer':<12} {'encode ms':>10} {'KB':>8}" + "".join(f" {name + ' ms':>9} {name + ' KB':>8}" for name, _ in compressors))
+    for n in args.sizes:
+        payloads = [("admin/bookings", list(fake_bookings(n))), ("admin/users", fake_admin_users(n))]
+        for endpoint, data in payloads:
+            for name, renderer in renderers:
+                encode_time, body = best_of(args.repeat, renderer.render, data)
+                row = f"{endpoint:<16} {n:>6} {name:<12} {encode_time * 1000:>10.2f} {len(body) / 1024:>8.1f}"
+                for _, compress in compressors:
+                    compress_time, packed = best_of(args.repeat, compress, body)
+                    row += f" {compress_time * 1000:>9.2f} {len(packed) / 1024:>8.1f}"
+                print(row)
+
+
+if __name__ == "__main__":
+    main()
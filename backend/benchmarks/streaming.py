@@ -0,0 +1,78 @@
+"""Compare buffered vs streamed JSON encoding of large admin listings.
+
+Usage: python -m benchmarks.streaming [--sizes 10000 100000]
+
+Documents come from a generator that mimics Firestore's `.stream()`, so the
+buffered path pays for materializing the list exactly like admin_bookings did.
+Reports peak traced memory and time-to-first-byte for each mode.
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from core.streaming import json_array_chunks, ndjson_chunks
+
+
+def fake_bookings(n):
+    for i in range(n):
+        yield {
+            "id": f"booking{i:08d}",
+            "user_id": f"user{i % 5000:05d}",
+            "service_id": f"service{i % 200:03d}",
+            "service_title": "Deep home cleaning",
+            "booking_date": "2026-10-17",
+            "booking_time": "09:30",
+            "address": "221B Baker Street, Marylebone, London NW1 6XE",
+            "total_price": 1499,
+            "status": ("pending", "confirmed", "completed", "cancelled")[i % 4],
+            "created_at": "2026-10-17T09:30:00.000000Z",
+        }
+
+
+def run_buffered(n):
+    start = time.perf_counter()
+    body = json.dumps(list(fake_bookings(n)), default=str).encode("utf-8")
+    ttfb = time.perf_counter() - start
+    return ttfb, time.perf_counter() - start, len(body)
+
+
+def run_streamed(n, encoder):
+    start = time.perf_counter()
+    ttfb = None
+    total = 0
+    for chunk in encoder(fake_bookings(n)):
+        if ttfb is None:
+            ttfb = time.perf_counter() - start
+        total += len(chunk)
+    return ttfb, time.perf_counter() - start, total
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    try:
+        ttfb, elapsed, size = fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return ttfb, elapsed, size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'docs':>8} {'mode':<10} {'ttfb ms':>9} {'total ms':>9} {'MB out':>7} {'peak MB':>8}")
+    for n in args.sizes:
+        rows = [
+            ("buffered", measure(run_buffered, n)),
+            ("json", measure(run_streamed, n, json_array_chunks)),
+            ("ndjson", measure(run_streamed, n, ndjson_chunks)),
+        ]
+        for mode, (ttfb, elapsed, size, peak) in rows:
+            print(f"{n:>8} {mode:<10} {ttfb * 1000:>9.1f} {elapsed * 1000:>9.1f} {size / 1e6:>7.1f} {peak / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,17 @@
 from django.contrib import admin
 
+from .models import FirebaseIdentity
+
 # Customize Django admin branding
 admin.site.site_header = "QuickServe Admin"
 admin.site.site_title = "QuickServe Admin"
 admin.site.index_title = "QuickServe Administration"
 
 # Register your models here.
+
+
+@admin.register(FirebaseIdentity)
+class FirebaseIdentityAdmin(admin.ModelAdmin):
+    list_display = ("uid", "user", "created_at")
+    search_fields = ("uid", "user__email")
+    raw_id_fields = ("user",)
@@ -0,0 +1,355 @@
+"""Booking analytics: volume and revenue per period, service and status.
+
+Bookings are held per process in a columnar BookingFrame: NumPy arrays of
+price, status code, service code and the booking/creation days, loaded with
+projected, cursor-paged reads of ANALYTICS_FIELDS. The frame is refreshed
+incrementally: after ANALYTICS_REFRESH seconds only bookings created since the
+newest one seen are read and appended. Edits to existing bookings (status,
+price) are picked up by a full reload: on request (?refresh=1), or every
+ANALYTICS_FULL_REFRESH seconds when that is set. Periodic full reloads are off
+by default because every worker would re-read the whole collection.
+Loads run in a background thread, one at a time per process, so requests
+never wait on Firestore: they are served from the current frame while a
+refresh builds the next one, and get AnalyticsNotReady until the first load
+has finished.
+
+Group-bys are bincounts over small integer codes and time buckets are integer
+arithmetic on datetime64 days, so a query over a million bookings is a handful
+of vector passes. Results are cached per frame version.
+
+Revenue is the total_price of bookings that were not cancelled.
+"""
+import itertools
+import logging
+import threading
+import time
+from datetime import date, datetime, timezone
+
+import numpy as np
+from django.conf import settings
+
+from .cache import TTLCache
+from .firestore_client import BOOKING_STAT_STATUSES, MAX_PAGE_SIZE, iter_all_bookings, iter_collection
+
+ANALYTICS_FIELDS = ("total_price", "status", "service_id", "service_title", "booking_date", "created_at")
+STATUSES = BOOKING_STAT_STATUSES + ("other",)
+DATE_FIELDS = ("booking_date", "created_at")
+BUCKETS = ("day", "week", "month")
+
+_STATUS_CODES = {status: code for code, status in enumerate(BOOKING_STAT_STATUSES)}
+_OTHER = len(BOOKING_STAT_STATUSES)
+_CANCELLED = _STATUS_CODES["cancelled"]
+_DAY_COLUMNS = {"booking_date": "booking_day", "created_at": "created_day"}
+
+logger = logging.getLogger(__name__)
+
+# Keyed by frame version, so the TTL only ages out results of replaced frames
+_results = TTLCache(maxsize=256, ttl=900)
+# Seconds a client is told to wait (Retry-After) while the first load runs
+RETRY_AFTER = 5
+
+_frame = None
+_loading = None  # the background load in progress, if any
+_failed_at = None  # monotonic time of the last failed load
+_state_lock = threading.Lock()
+_stats = {"full_loads": 0, "incremental_loads": 0, "refresh_errors": 0, "last_load_seconds": None}
+
+
+def _price(value) -> float:
+    if isinstance(value, bool):
+        return 0.0
+    try:
+        price = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return price if np.isfinite(price) else 0.0
+
+
+def _day_text(value):
+    # YYYY-MM-DD for numpy to parse; "NaT" for anything without a date
+    if isinstance(value, str) and len(value) >= 10:
+        return value[:10]
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return "NaT"
+
+
+def _days(values) -> np.ndarray:
+    """datetime64[D] array for `values` (ISO strings, datetimes or dates)."""
+    texts = [_day_text(v) for v in values]
+    try:
+        return np.array(texts, dtype="datetime64[D]")
+    except ValueError:
+        # A malformed date somewhere: parse one by one so it alone becomes NaT
+        days = np.empty(len(texts), dtype="datetime64[D]")
+        for i, text in enumerate(texts):
+            try:
+                days[i] = np.datetime64(text, "D")
+            except ValueError:
+                days[i] = np.datetime64("NaT")
+        return days
+
+
+class BookingFrame:
+    """Row-aligned NumPy columns for a set of bookings. Immutable once built;
+    extend() returns a new frame with more rows."""
+
+    _versions = itertools.count(1)
+
+    def __init__(self, columns: dict, services: dict, titles: list, newest=None, newest_ids=frozenset(), loaded_at=None, full_loaded_at=None):
+        self.columns = columns
+        self.services = services  # service_id -> code
+        self.titles = titles  # code -> service title
+        # Newest created_at seen, and the ids that carry it: the next refresh
+        # reads created_at >= newest and skips those ids
+        self.newest = newest
+        self.newest_ids = newest_ids
+        self.loaded_at = loaded_at or time.monotonic()
+        self.full_loaded_at = full_loaded_at or self.loaded_at
+        self.version = next(self._versions)
+
+    @classmethod
+    def build(cls, bookings, services: dict = None, titles: list = None, newest=None, newest_ids=frozenset()):
+        """Collect `bookings` (dicts with ANALYTICS_FIELDS and id) into columns."""
+        services = dict(services or {})
+        titles = list(titles or [])
+        newest_ids = set(newest_ids)
+        prices, statuses, codes, booking_dates, created = [], [], [], [], []
+        for booking in bookings:
+            if booking.get("id") in newest_ids and booking.get("created_at") == newest:
+                continue  # already loaded at the previous watermark
+            prices.append(_price(booking.get("total_price")))
+            statuses.append(_STATUS_CODES.get(booking.get("status"), _OTHER))
+            service_id = booking.get("service_id") or ""
+            code = services.get(service_id)
+            if code is None:
+                code = services[service_id] = len(titles)
+                titles.append(booking.get("service_title") or "")
+            codes.append(code)
+            booking_dates.append(booking.get("booking_date"))
+            created_at = booking.get("created_at")
+            created.append(created_at)
+            if created_at is not None and (newest is None or type(created_at) is type(newest)):
+                if newest is None or created_at > newest:
+                    newest, newest_ids = created_at, {booking.get("id")}
+                elif created_at == newest:
+                    newest_ids.add(booking.get("id"))
+
+        price = np.array(prices, dtype=np.float64)
+        status = np.array(statuses, dtype=np.int8)
+        columns = {
+            "price": price,
+            "revenue": np.where(status == _CANCELLED, 0.0, price),
+            "status": status,
+            "service": np.array(codes, dtype=np.int32),
+            "booking_day": _days(booking_dates),
+            "created_day": _days(created),
+        }
+        return cls(columns, services, titles, newest, frozenset(newest_ids))
+
+    def __len__(self):
+        return len(self.columns["price"])
+
+    def extend(self, bookings):
+        """A new frame with `bookings` appended (rows at the watermark are skipped)."""
+        extra = BookingFrame.build(bookings, self.services, self.titles, self.newest, self.newest_ids)
+        if not len(extra):
+            return BookingFrame(self.columns, self.services, self.titles, self.newest, self.newest_ids, full_loaded_at=self.full_loaded_at)
+        columns = {name: np.concatenate([column, extra.columns[name]]) for name, column in self.columns.items()}
+        return BookingFrame(columns, extra.services, extra.titles, extra.newest, extra.newest_ids, full_loaded_at=self.full_loaded_at)
+
+    def aggregate(self, date_field: str = "booking_date", date_from: str = None, date_to: str = None,
+                  bucket: str = "day", statuses=None, service_id: str = None, top: int = 20) -> dict:
+        """Totals, per-status, per-service (top `top` by revenue) and per-period
+        volume and revenue for the bookings matching the filters."""
+        cols = self.columns
+        days = cols[_DAY_COLUMNS[date_field]]
+        mask = np.ones(len(self), dtype=bool)
+        if date_from:
+            mask &= days >= np.datetime64(date_from, "D")
+        if date_to:
+            mask &= days <= np.datetime64(date_to, "D")
+        if statuses:
+            mask &= np.isin(cols["status"], [_STATUS_CODES.get(s, _OTHER) for s in statuses])
+        if service_id is not None:
+            mask &= cols["service"] == self.services.get(service_id, -1)
+
+        revenue = cols["revenue"][mask]
+        status = cols["status"][mask]
+        service = cols["service"][mask]
+        days = days[mask]
+
+        status_counts = np.bincount(status, minlength=len(STATUSES))
+        status_revenue = np.bincount(status, weights=revenue, minlength=len(STATUSES))
+        service_counts = np.bincount(service, minlength=len(self.titles))
+        service_revenue = np.bincount(service, weights=revenue, minlength=len(self.titles))
+        ranked = np.lexsort((-service_counts, -service_revenue))
+        ranked = ranked[service_counts[ranked] > 0][:max(0, int(top))]
+        service_ids = list(self.services)  # insertion order == code order
+
+        dated = ~np.isnat(days)
+        periods = _periods(days[dated], bucket)
+        series = []
+        if periods.size:
+            first = periods.min()
+            offsets = periods - first
+            counts = np.bincount(offsets)
+            totals = np.bincount(offsets, weights=revenue[dated])
+            labels = _labels(np.arange(first, first + counts.size), bucket)
+            series = [
+                {"period": label, "bookings": int(count), "revenue": round(float(total), 2)}
+                for label, count, total in zip(labels, counts.tolist(), totals.tolist())
+            ]
+
+        return {
+            "totals": {"bookings": int(mask.sum()), "revenue": round(float(revenue.sum()), 2), "undated": int((~dated).sum())},
+            "by_status": [
+                {"status": name, "bookings": int(count), "revenue": round(float(total), 2)}
+                for name, count, total in zip(STATUSES, status_counts.tolist(), status_revenue.tolist())
+            ],
+            "by_service": [
+                {
+                    "service_id": service_ids[code] or None,
+                    "service_title": self.titles[code],
+                    "bookings": int(service_counts[code]),
+                    "revenue": round(float(service_revenue[code]), 2),
+                }
+                for code in ranked.tolist()
+            ],
+            "series": series,
+        }
+
+
+def _periods(days: np.ndarray, bucket: str) -> np.ndarray:
+    """Integer period numbers: days since the epoch, Monday-based weeks since
+    the epoch, or months since the epoch."""
+    if bucket == "month":
+        return days.astype("datetime64[M]").astype(np.int64)
+    numbers = days.astype(np.int64)
+    if bucket == "week":
+        return (numbers + 3) // 7  # 1970-01-01 was a Thursday
+    return numbers
+
+
+def _labels(periods: np.ndarray, bucket: str) -> list:
+    """ISO labels for period numbers: the day, the week's Monday, or YYYY-MM."""
+    if bucket == "month":
+        return periods.astype("datetime64[M]").astype(str).tolist()
+    if bucket == "week":
+        periods = periods * 7 - 3
+    return periods.astype("datetime64[D]").astype(str).tolist()
+
+
+def _load_full() -> BookingFrame:
+    # Walk by document id so bookings without created_at are included too
+    return BookingFrame.build(iter_collection("bookings", MAX_PAGE_SIZE, fields=ANALYTICS_FIELDS))
+
+
+def _load_new(frame: BookingFrame) -> BookingFrame:
+    if frame.newest is None:
+        return _load_full()
+    bookings = iter_all_bookings(
+        chunk_size=MAX_PAGE_SIZE,
+        fields=ANALYTICS_FIELDS,
+        filters=(("created_at", ">=", frame.newest),),
+        sort="created_at",
+    )
+    return frame.extend(bookings)
+
+
+class AnalyticsNotReady(Exception):
+    """No frame has been loaded in this process yet; one is loading in the background."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Booking analytics are still loading")
+        self.retry_after = retry_after
+
+
+def _refresh(full: bool):
+    global _frame, _loading, _failed_at
+    started = time.perf_counter()
+    try:
+        frame = _frame
+        if full or frame is None:
+            _frame = _load_full()
+            _stats["full_loads"] += 1
+        else:
+            _frame = _load_new(frame)
+            _stats["incremental_loads"] += 1
+        _stats["last_load_seconds"] = round(time.perf_counter() - started, 3)
+        _failed_at = None
+    except Exception:
+        # Keep serving the last good frame; retried after ANALYTICS_REFRESH
+        _stats["refresh_errors"] += 1
+        _failed_at = time.monotonic()
+        logger.warning("Booking analytics refresh failed", exc_info=True)
+    finally:
+        with _state_lock:
+            _loading = None
+
+
+def _start_refresh(full: bool) -> bool:
+    """Start a background load unless one is already running."""
+    global _loading
+    with _state_lock:
+        if _loading is not None:
+            return False
+        _loading = threading.Thread(target=_refresh, args=(full,), name="booking-analytics", daemon=True)
+        _loading.start()
+        return True
+
+
+def booking_frame():
+    """The current frame, or None until the first load finishes. A refresh that
+    is due is started in the background; the caller never waits for it."""
+    frame = _frame
+    now = time.monotonic()
+    refresh = getattr(settings, "ANALYTICS_REFRESH", 60)
+    full_every = getattr(settings, "ANALYTICS_FULL_REFRESH", 0)
+    full_due = frame is None or (full_every > 0 and now - frame.full_loaded_at >= full_every)
+    due = full_due or now - frame.loaded_at >= refresh
+    if due and (_failed_at is None or now - _failed_at >= refresh):
+        _start_refresh(full_due)
+    return frame
+
+
+def request_full_refresh() -> bool:
+    """Start a full reload in the background, at most once per ANALYTICS_REFRESH
+    seconds. Returns whether a reload was started."""
+    frame = _frame
+    if frame is not None and time.monotonic() - frame.full_loaded_at < getattr(settings, "ANALYTICS_REFRESH", 60):
+        return False
+    return _start_refresh(True)
+
+
+def booking_analytics(date_field: str = "booking_date", date_from: str = None, date_to: str = None,
+                      bucket: str = "day", statuses=None, service_id: str = None, top: int = 20) -> dict:
+    """Aggregate the current frame (see BookingFrame.aggregate). `statuses` is a
+    tuple of status names; results are cached until the frame changes. Raises
+    AnalyticsNotReady while the first load is running."""
+    frame = booking_frame()
+    if frame is None:
+        raise AnalyticsNotReady(RETRY_AFTER)
+    key = (frame.version, date_field, date_from, date_to, bucket, statuses, service_id, top)
+    result = _results.get(key)
+    if result is None:
+        result = frame.aggregate(date_field, date_from, date_to, bucket, statuses, service_id, top)
+        result = {"date_field": date_field, "bucket": bucket, "bookings_loaded": len(frame), **result}
+        _results.set(key, result)
+    return result
+
+
+def analytics_stats():
+    frame = _frame
+    return {
+        **_stats,
+        "loading": _loading is not None,
+        "rows": len(frame) if frame is not None else 0,
+        "services": len(frame.titles) if frame is not None else 0,
+        "age_seconds": round(time.monotonic() - frame.loaded_at, 1) if frame is not None else None,
+        "results_cache": _results.stats(),
+    }
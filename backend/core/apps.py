@@ -1,6 +1,50 @@
+import os
+import sys
+import threading
+
 from django.apps import AppConfig
+from django.conf import settings
+
+# Programs whose processes serve requests once the app is loaded. Gunicorn is
+# not listed: with --preload ready() runs in its master, before the workers are
+# forked, so gunicorn.conf.py warms each worker from post_worker_init instead.
+_SERVER_PROGRAMS = {"uvicorn", "daphne", "hypercorn"}
+
+
+def is_server_process(argv=None, environ=None):
+    """True when this process will serve requests without forking again:
+    runserver's serving child (not the autoreloader parent) or a standalone
+    ASGI server. False for every other manage.py command."""
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    if not argv:
+        return False
+    # `uvicorn ...` and `python -m uvicorn ...` (argv[0] is uvicorn/__main__.py)
+    program = os.path.normpath(argv[0]).split(os.sep)
+    if _SERVER_PROGRAMS & {os.path.splitext(program[-1])[0], *program[-2:-1]}:
+        return True
+    if len(argv) > 1 and argv[1] == "runserver":
+        return environ.get("RUN_MAIN") == "true" or "--noreload" in argv
+    return False
+
+
+def start_firestore_warmup():
+    """Open the Firestore channel in a daemon thread so a slow or unreachable
+    backend never blocks boot. Must run in the process that will use the
+    client, after any fork: a gRPC channel does not survive fork()."""
+    from .firestore_client import warm_firestore_client
+    threading.Thread(target=warm_firestore_client, name="firestore-warmup", daemon=True).start()
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # Open the Firestore channel once per server process instead of on the
+        # first request. Never for migrate/shell/etc., and never in a process
+        # that forks workers afterwards (see _SERVER_PROGRAMS).
+        if getattr(settings, "FIRESTORE_WARMUP", True) and is_server_process():
+            start_firestore_warmup()
+        # The catalog mirror is not started here: ready() also runs for every
+        # manage.py command. core.catalog subscribes on the first catalog read.
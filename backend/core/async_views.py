@@ -0,0 +1,229 @@
+"""Async versions of the hot read endpoints for ASGI deployments.
+
+Enabled with ASYNC_API=True (see backend/urls.py). GET requests are served
+natively with core.firestore_async; other methods and streamed listings are
+handed to the sync DRF views in core.views so behaviour stays identical.
+
+Sync work (delegated views, authentication, role checks) runs on the
+thread pool with thread_sensitive=False: the default would put every such
+call of the process on one shared thread, so concurrent requests would
+queue behind each other's Firestore round trips. Streamed bodies from the
+sync views are handed to Django as async iterators (core.streaming) so they
+are sent as they are produced rather than collected first.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.settings import api_settings
+
+from . import catalog
+from . import encoding
+from . import firestore_async as fs
+from . import views as sync_views
+from .firestore_client import list_auth_users
+from .conditional import conditional_response
+from .streaming import async_streaming, stream_format
+
+
+def _json(data, status=200):
+	# Same encoder as the DRF renderer (core.encoding)
+	return HttpResponse(encoding.dumps(data), status=status, content_type="application/json")
+
+
+def _off_thread(fn):
+	"""`fn` as a coroutine function run on a pool thread (not the shared
+	thread-sensitive one). Database connections that thread opened are
+	released afterwards as at the end of a request."""
+	def call(*args, **kwargs):
+		try:
+			return fn(*args, **kwargs)
+		finally:
+			close_old_connections()
+	return sync_to_async(call, thread_sensitive=False)
+
+
+def _authenticate(request):
+	"""Run the DRF authentication classes against a plain HttpRequest (sync)."""
+	for auth_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+		result = auth_class().authenticate(request)
+		if result is not None:
+			request.user = result[0]
+			return request.user
+	return None
+
+
+async def _auth(request):
+	"""Authenticate and return (user, error_response)."""
+	try:
+		user = await _off_thread(_authenticate)(request)
+	except exceptions.AuthenticationFailed as exc:
+		return None, _json({"detail": str(exc.detail)}, status=401)
+	if user is None or not user.is_authenticated:
+		return None, _json({"detail": "Authentication required"}, status=401)
+	return user, None
+
+
+async def _require_admin(request):
+	user, error = await _auth(request)
+	if error:
+		return error
+	if not await _off_thread(sync_views._is_request_admin)(request):
+		return _json({"detail": "Admin privileges required"}, status=403)
+	return None
+
+
+def _delegate(view):
+	"""Call the sync DRF view for methods the async path does not handle."""
+	async def call(request, *args, **kwargs):
+		return async_streaming(await _off_thread(view)(request, *args, **kwargs))
+	return call
+
+
+def _fields(request):
+	"""Return (fields, error_response) for the `?fields=` projection."""
+	try:
+		return sync_views._field_params(request), None
+	except ValueError as exc:
+		return None, _json({"detail": str(exc)}, status=400)
+
+
+async def _paged(request, fetch, default_size, policy=None):
+	try:
+		paging = sync_views._page_params(request, default_size=default_size)
+	except ValueError as exc:
+		return None, _json({"detail": str(exc)}, status=400)
+	if not paging:
+		return None, None
+	try:
+		items, next_token = await fetch(*paging)
+	except ValueError as exc:
+		return None, _json({"detail": str(exc)}, status=400)
+	payload = {"results": items, "next_page_token": next_token}
+	if policy:
+		return conditional_response(request, _json(payload), policy, data=payload), None
+	return _json(payload), None
+
+
+@csrf_exempt
+async def services_list(request):
+	if request.method != "GET":
+		return await _delegate(sync_views.services_list)(request)
+	fields, error = _fields(request)
+	if error:
+		return error
+	try:
+		response, error = await _paged(request, lambda size, token: fs.list_services_page(size, token, fields=fields), 50, policy="services")
+		if error or response:
+			return error or response
+		data = await catalog.alist_services(fields=fields)
+		return conditional_response(request, _json(data), "services", data=data)
+	except Exception as exc:
+		# Same graceful degradation as the sync view
+		return _json({"services": [], "error": f"Failed to load services: {exc.__class__.__name__}"})
+
+
+@csrf_exempt
+async def service_detail(request, service_id: str):
+	if request.method != "GET":
+		return await _delegate(sync_views.service_detail)(request, service_id)
+	service = await catalog.aget_service(service_id)
+	if not service:
+		return _json({"detail": "Not found"}, status=404)
+	return conditional_response(request, _json(service), "service_detail", data=service)
+
+
+@csrf_exempt
+async def bookings(request):
+	if request.method != "GET":
+		return await _delegate(sync_views.bookings)(request)
+	user, error = await _auth(request)
+	if error:
+		return error
+	uid = getattr(user, "firebase_uid", None)
+	fields, error = _fields(request)
+	if error:
+		return error
+	response, error = await _paged(request, lambda size, token: fs.list_bookings_for_user_page(uid, size, token, fields=fields), 100)
+	if error or response:
+		return error or response
+	return _json(await fs.list_bookings_for_user(uid, fields=fields))
+
+
+@csrf_exempt
+async def me(request):
+	if request.method != "GET":
+		return await _delegate(sync_views.me)(request)
+	user, error = await _auth(request)
+	if error:
+		return error
+	prof = await fs.get_profile(getattr(user, "firebase_uid", None)) or {}
+	email = getattr(user, "email", None)
+	if email:
+		prof.setdefault("email", email)
+	return conditional_response(request, _json(prof), "me", data=prof, last_modified=prof.get("updated_at"), vary=["Authorization"])
+
+
+@csrf_exempt
+async def admin_bookings(request):
+	if request.method != "GET" or stream_format(request):
+		return await _delegate(sync_views.admin_bookings)(request)
+	error = await _require_admin(request)
+	if error:
+		return error
+	fields, error = _fields(request)
+	if error:
+		return error
+	try:
+		filters, sort = sync_views._booking_filter_params(request)
+	except ValueError as exc:
+		return _json({"detail": str(exc)}, status=400)
+	query = {"fields": fields, "filters": filters, "sort": sort}
+	response, error = await _paged(request, lambda size, token: fs.list_all_bookings_page(size, token, **query), 100)
+	if error or response:
+		return error or response
+	return _json(await fs.list_all_bookings(**query))
+
+
+@csrf_exempt
+async def admin_bookings_export(request):
+	# Always streamed: the sync view builds the body, the rows are read as it is sent
+	return await _delegate(sync_views.admin_bookings_export)(request)
+
+
+@csrf_exempt
+async def admin_users(request):
+	if request.method != "GET" or stream_format(request):
+		return await _delegate(sync_views.admin_users)(request)
+	error = await _require_admin(request)
+	if error:
+		return error
+
+	# Firebase Auth listing has no async client; run it on a thread alongside
+	# the async Firestore reads.
+	timeout = getattr(settings, "ADMIN_USERS_SOURCE_TIMEOUT", 15)
+	names = ("auth_users", "profiles", "roles")
+	results = await asyncio.gather(
+		asyncio.wait_for(asyncio.to_thread(list_auth_users), timeout),
+		asyncio.wait_for(fs.list_profiles_map(), timeout),
+		asyncio.wait_for(fs.list_roles_map(), timeout),
+		return_exceptions=True,
+	)
+	failed = [name for name, value in zip(names, results) if isinstance(value, BaseException)]
+	if len(failed) == len(names):
+		return _json({"detail": "Failed to load users", "failed_sources": failed}, status=503)
+	auth_users, profiles_map, roles_map = [
+		default if isinstance(value, BaseException) else value
+		for value, default in zip(results, ([], {}, {}))
+	]
+
+	enriched = list(sync_views._merge_admin_users(auth_users, profiles_map, roles_map))
+	enriched.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+	response = _json(enriched)
+	if failed:
+		response["X-Partial-Result"] = ",".join(sorted(failed))
+	return response
@@ -1,12 +1,22 @@
 from rest_framework.authentication import BaseAuthentication
 from rest_framework import exceptions
-from django.contrib.auth import get_user_model
 import firebase_admin
 from firebase_admin import credentials
 from django.conf import settings
+import hashlib
+import time
+
+from .cache import TTLCache
 
 _firebase_app = None
 
+# Verified ID tokens -> decoded claims. The SPA resends the same token for up to
+# an hour, so this skips RSA verification on every request after the first.
+_token_cache = TTLCache(
+    maxsize=getattr(settings, "FIREBASE_TOKEN_CACHE_SIZE", 10000),
+    ttl=getattr(settings, "FIREBASE_TOKEN_CACHE_TTL", 3600),
+)
+
 def get_firebase_app():
     """Lazy initialize firebase-admin app.
     Returns the app or None if config is missing/invalid so the server can still boot.
@@ -14,6 +24,10 @@ def get_firebase_app():
     global _firebase_app
     if _firebase_app:
         return _firebase_app
+    # Reuse the default app if core.firebase (e.g. the Firestore warm-up) created it first
+    if firebase_admin._apps:
+        _firebase_app = firebase_admin.get_app()
+        return _firebase_app
     cfg = getattr(settings, "FIREBASE_CONFIG", None)
     if not cfg:
         return None
@@ -34,6 +48,37 @@ def get_firebase_app():
     return _firebase_app
 
 
+def verify_id_token_cached(id_token: str):
+    """Verify a Firebase ID token, reusing claims from earlier verifications.
+
+    Entries expire at the token's `exp` or after FIREBASE_TOKEN_CACHE_TTL,
+    whichever comes first. With FIREBASE_CHECK_REVOKED enabled, verification
+    also checks revocation (one Auth API call) and entries are kept for at
+    most FIREBASE_REVOKED_TOKEN_CACHE_TTL seconds instead, so a revoked token
+    is rejected within that window; set it to 0 to check on every request.
+    """
+    key = hashlib.sha256(id_token.encode("utf-8")).hexdigest()
+    decoded = _token_cache.get(key)
+    if decoded is not None:
+        return decoded
+
+    from firebase_admin import auth as fb_auth
+    check_revoked = bool(getattr(settings, "FIREBASE_CHECK_REVOKED", False))
+    decoded = fb_auth.verify_id_token(id_token, check_revoked=check_revoked)
+
+    exp = decoded.get("exp")
+    if exp:
+        ttl = float(exp) - time.time()
+        if check_revoked:
+            ttl = min(ttl, getattr(settings, "FIREBASE_REVOKED_TOKEN_CACHE_TTL", 60))
+        _token_cache.set(key, decoded, ttl=ttl)
+    return decoded
+
+
+def token_cache_stats():
+    return _token_cache.stats()
+
+
 class FirebaseAuthentication(BaseAuthentication):
     """DRF authentication class that accepts Firebase ID tokens in the
     Authorization header: "Authorization: Bearer <id_token>".
@@ -60,25 +105,16 @@ class FirebaseAuthentication(BaseAuthentication):
             return None
 
         try:
-            from firebase_admin import auth as fb_auth
-            decoded = fb_auth.verify_id_token(id_token)
+            decoded = verify_id_token_cached(id_token)
         except Exception as exc:
             raise exceptions.AuthenticationFailed(f"Invalid Firebase ID token: {exc}")
 
         uid = decoded.get("uid")
         email = decoded.get("email")
-        User = get_user_model()
-
-        # Create or get a lightweight Django user backing the Firebase identity
-        if email:
-            username = email.split("@")[0]
-        else:
-            username = uid
-
-        user, _ = User.objects.get_or_create(email=email or f"{uid}@firebase.local", defaults={
-            "username": username,
-            "is_active": True,
-        })
+
+        # Map the Firebase identity to a lightweight Django user (cached per uid)
+        from .identity import resolve_user
+        user = resolve_user(uid, email)
 
         # Attach firebase uid to user instance (non-persistent attribute)
         setattr(user, "firebase_uid", uid)
@@ -0,0 +1,143 @@
+"""Read-through cache for the public catalog (services and categories).
+
+Reads are served from the live snapshot mirror (core.catalog_mirror) when it
+is healthy. Otherwise they go through a TTL cache that the write helpers in
+core.firestore_client invalidate, so edits are visible immediately in the
+process that made them and within CATALOG_CACHE_TTL everywhere else.
+"""
+from django.conf import settings
+
+from . import firestore_client
+from .cache import TTLCache
+from .catalog_mirror import categories_mirror, ensure_catalog_mirror, services_mirror
+from .singleflight import firestore_flight
+
+_MISSING = object()
+_NOT_FOUND = object()  # cached marker for get_service() misses
+
+_catalog_cache = TTLCache(
+    maxsize=getattr(settings, "CATALOG_CACHE_SIZE", 1024),
+    ttl=getattr(settings, "CATALOG_CACHE_TTL", 30),
+)
+_generation = 0  # bumped on invalidation so in-flight loads don't repopulate stale data
+
+
+def _copy(value):
+    # Hand out shallow copies so callers can't mutate the cached documents
+    if isinstance(value, list):
+        return [dict(item) for item in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def _unwrap(value):
+    return None if value is _NOT_FOUND else _copy(value)
+
+
+def _cached(key):
+    value = _catalog_cache.get(key, _MISSING)
+    return None if value is _NOT_FOUND else value
+
+
+def _store(key, generation, value):
+    if generation == _generation:
+        _catalog_cache.set(key, _NOT_FOUND if value is None else value)
+    return value
+
+
+def _read_through(key, loader):
+    value = _catalog_cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return _unwrap(value)
+    # A cold key is loaded once while concurrent callers wait for that load;
+    # single-flight keeps no per-key state once it ends
+    generation = _generation
+
+    def fill():
+        value = _cached(key)  # filled just before this flight started
+        return _store(key, generation, loader()) if value is _MISSING else value
+
+    return _copy(firestore_flight.do((__name__, key), fill))
+
+
+async def _read_through_async(key, loader):
+    value = _catalog_cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return _unwrap(value)
+    generation = _generation
+
+    async def fill():
+        value = _cached(key)
+        return _store(key, generation, await loader()) if value is _MISSING else value
+
+    return _copy(await firestore_flight.ado((__name__, key), fill))
+
+
+def list_services(limit: int = 50, fields=None):
+    ensure_catalog_mirror()
+    if services_mirror.healthy:
+        return services_mirror.list(limit, fields)
+    return _read_through(("services", limit, fields), lambda: firestore_client.list_services(limit, fields=fields))
+
+
+def get_service(service_id: str):
+    ensure_catalog_mirror()
+    if services_mirror.healthy:
+        return services_mirror.get(service_id)
+    return _read_through(("service", service_id), lambda: firestore_client.get_service(service_id))
+
+
+def get_services(service_ids):
+    """Return {id: service} for the ids that exist, from the mirror or one batched read."""
+    ensure_catalog_mirror()
+    if services_mirror.healthy:
+        found = {}
+        for service_id in service_ids:
+            item = services_mirror.get(service_id)
+            if item is not None:
+                found[service_id] = item
+        return found
+    return firestore_client.get_services(service_ids)
+
+
+def list_categories(limit: int = 200):
+    ensure_catalog_mirror()
+    if categories_mirror.healthy:
+        return categories_mirror.list(limit)
+    return _read_through(("categories", limit), lambda: firestore_client.list_categories(limit))
+
+
+async def alist_services(limit: int = 50, fields=None):
+    ensure_catalog_mirror()
+    if services_mirror.healthy:
+        return services_mirror.list(limit, fields)
+    from . import firestore_async
+    return await _read_through_async(("services", limit, fields), lambda: firestore_async.list_services(limit, fields=fields))
+
+
+async def aget_service(service_id: str):
+    ensure_catalog_mirror()
+    if services_mirror.healthy:
+        return services_mirror.get(service_id)
+    from . import firestore_async
+    return await _read_through_async(("service", service_id), lambda: firestore_async.get_service(service_id))
+
+
+def mirrored(collection: str) -> bool:
+    """Whether reads of `collection` ("services" or "categories") are served
+    from the in-memory mirror right now, i.e. need no Firestore I/O."""
+    ensure_catalog_mirror()
+    mirror = services_mirror if collection == "services" else categories_mirror
+    return mirror.healthy
+
+
+def invalidate_catalog():
+    """Drop every cached catalog entry (the catalog is small; partial invalidation isn't worth it)."""
+    global _generation
+    _generation += 1
+    _catalog_cache.clear()
+
+
+def catalog_cache_stats():
+    return _catalog_cache.stats()
@@ -0,0 +1,313 @@
+"""Bulk import and export of the catalog (services, categories) as JSONL or CSV.
+
+Backs the import_catalog and export_catalog management commands. Both sides
+stream: rows are read, validated and written a batch at a time, and exports
+walk the collection in cursor-paged chunks, so memory stays flat however large
+the file or collection is.
+
+Imports write WriteBatches of up to MAX_BATCH_WRITES documents from a pool of
+threads. Batches finish in submission order as far as the checkpoint is
+concerned, so "rows done" is always a prefix of the input and an interrupted
+import resumes from it. Set FIRESTORE_EMULATOR_HOST to load the local emulator.
+"""
+import csv
+import hashlib
+import json
+import math
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from . import encoding
+from .firestore_client import (
+    MAX_BATCH_WRITES,
+    MAX_PAGE_SIZE,
+    _invalidate_catalog,
+    get_firestore_client,
+    iter_collection,
+)
+from .streaming import csv_cell
+
+# Columns per collection, in CSV order (the document id comes first)
+CATALOG_FIELDS = {
+    "services": ("title", "price", "category", "description", "duration", "image_url", "is_active", "created_by"),
+    "categories": ("name",),
+}
+FORMATS = ("jsonl", "csv")
+_SUFFIX_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "jsonl", ".csv": "csv"}
+_TRUE = {"true", "1", "yes", "y", "t"}
+_FALSE = {"false", "0", "no", "n", "f"}
+_COMMIT_ATTEMPTS = 5
+
+
+def detect_format(path: str, fmt: str = None) -> str:
+    """The explicit `fmt`, else the one implied by `path`'s suffix ("-" means JSONL)."""
+    if fmt:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format '{fmt}' (expected one of {', '.join(FORMATS)})")
+        return fmt
+    if path == "-":
+        return "jsonl"
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix not in _SUFFIX_FORMATS:
+        raise ValueError(f"Cannot tell the format of '{path}'; pass --format")
+    return _SUFFIX_FORMATS[suffix]
+
+
+# Reading and validation
+
+def read_rows(stream, fmt: str):
+    """Yield (line_number, raw_row) from a text stream.
+
+    JSONL rows are yielded as their undecoded line so one bad line is reported
+    by clean_row rather than aborting the read; blank lines are skipped.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, {k: v for k, v in row.items() if k is not None}
+        return
+    for number, line in enumerate(stream, 1):
+        if line.strip():
+            yield number, line
+
+
+def _text(value, field):
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise ValueError(f"'{field}' must be a string")
+
+
+def _price(value):
+    if isinstance(value, bool):
+        raise ValueError("'price' must be a number")
+    if isinstance(value, str):
+        try:
+            value = float(value.strip())
+        except ValueError:
+            raise ValueError(f"'price' must be a number, got '{value}'") from None
+    if not isinstance(value, (int, float)) or not math.isfinite(value) or value < 0:
+        raise ValueError("'price' must be a non-negative number")
+    return int(value) if float(value).is_integer() else value
+
+
+def _flag(value, field):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError(f"'{field}' must be true or false, got '{value}'")
+
+
+def _content_id(data: dict) -> str:
+    # Rows without an id get one derived from their content, so re-running an
+    # import (or resuming one) overwrites the same documents instead of
+    # duplicating them. 20 hex characters, the length of a Firestore auto id.
+    return hashlib.blake2b(encoding.dumps(data, sort_keys=True), digest_size=10).hexdigest()
+
+
+def _doc_id(value):
+    doc_id = str(value).strip()
+    if "/" in doc_id or doc_id in (".", "..") or len(doc_id.encode("utf-8")) > 1500 or doc_id.startswith("__"):
+        raise ValueError(f"Invalid document id '{doc_id}'")
+    return doc_id
+
+
+def clean_row(collection: str, raw):
+    """Validate one input row and return (doc_id, data) ready to write.
+
+    Unknown columns are dropped and empty values treated as missing. Services
+    need a title and a non-negative price (is_active defaults to true, as in
+    the API); categories need a name. Raises ValueError describing the problem.
+    """
+    if isinstance(raw, str):
+        try:
+            raw = encoding.loads(raw)
+        except ValueError as exc:
+            raise ValueError(f"Invalid JSON: {exc}") from None
+    if not isinstance(raw, dict):
+        raise ValueError("Row must be a JSON object")
+
+    data = {}
+    for field in CATALOG_FIELDS[collection]:
+        value = raw.get(field)
+        if value is None or value == "":
+            continue
+        if field == "price":
+            data[field] = _price(value)
+        elif field == "is_active":
+            data[field] = _flag(value, field)
+        else:
+            data[field] = _text(value, field)
+
+    if collection == "services":
+        if not data.get("title"):
+            raise ValueError("'title' is required")
+        if "price" not in data:
+            raise ValueError("'price' is required")
+        data.setdefault("is_active", True)
+    elif not data.get("name"):
+        raise ValueError("'name' is required")
+
+    raw_id = raw.get("id")
+    doc_id = _doc_id(raw_id) if raw_id not in (None, "") else _content_id(data)
+    return doc_id, data
+
+
+# Checkpoints
+
+def load_checkpoint(path: str, source: str, collection: str) -> int:
+    """Rows already imported from `source` according to the checkpoint at `path`
+    (0 when there is none). Raises ValueError if it belongs to another import."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            state = json.load(fh)
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"Unreadable checkpoint {path}: {exc}") from exc
+    if state.get("source") != source or state.get("collection") != collection:
+        raise ValueError(
+            f"Checkpoint {path} is for {state.get('collection')} from {state.get('source')}, not {collection} from {source}"
+        )
+    return int(state.get("rows", 0))
+
+
+def save_checkpoint(path: str, source: str, collection: str, rows: int):
+    # Write then rename, so a crash mid-write never leaves a truncated checkpoint
+    state = {"source": source, "collection": collection, "rows": rows, "updated_at": datetime.now(timezone.utc).isoformat()}
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(state, fh)
+    os.replace(tmp, path)
+
+
+# Writing
+
+def _retryable(exc) -> bool:
+    try:
+        from google.api_core import exceptions
+    except ImportError:
+        return False
+    return isinstance(exc, (exceptions.ServiceUnavailable, exceptions.DeadlineExceeded, exceptions.Aborted, exceptions.ResourceExhausted, exceptions.InternalServerError))
+
+
+def _commit(collection: str, docs: list, merge: bool):
+    """Commit one batch of (doc_id, data) sets, backing off on transient errors."""
+    db = get_firestore_client()
+    col = db.collection(collection)
+    for attempt in range(_COMMIT_ATTEMPTS):
+        batch = db.batch()
+        for doc_id, data in docs:
+            batch.set(col.document(doc_id), data, merge=merge)
+        try:
+            batch.commit()
+            return len(docs)
+        except Exception as exc:
+            if attempt == _COMMIT_ATTEMPTS - 1 or not _retryable(exc):
+                raise
+            time.sleep(min(8.0, 0.25 * 2 ** attempt) * (1 + random.random()))
+
+
+def import_rows(collection: str, rows, batch_size: int = MAX_BATCH_WRITES, workers: int = 8, skip: int = 0,
+                merge: bool = False, dry_run: bool = False, max_errors: int = None, on_invalid=None, on_checkpoint=None):
+    """Validate and write `rows` ((line_number, raw_row) pairs, see read_rows).
+
+    The first `skip` rows are passed over (resuming from a checkpoint). Invalid
+    rows are reported through on_invalid(line_number, message) and skipped;
+    more than `max_errors` of them aborts the import with ValueError.
+    on_checkpoint(rows_done) is called whenever another prefix of the input is
+    safely written. Returns a summary dict of row counts.
+    """
+    if collection not in CATALOG_FIELDS:
+        raise ValueError(f"Unknown collection '{collection}'")
+    batch_size = max(1, min(int(batch_size), MAX_BATCH_WRITES))
+    workers = max(1, int(workers))
+    summary = {"read": 0, "skipped": 0, "invalid": 0, "written": 0}
+    position = 0  # input rows consumed, valid or not
+    pending = []
+    in_flight = deque()  # (future, rows_done once it lands), oldest first
+
+    def land_oldest():
+        future, rows_done = in_flight.popleft()
+        summary["written"] += future.result()
+        if on_checkpoint:
+            on_checkpoint(rows_done)
+
+    def flush():
+        if dry_run:
+            summary["written"] += len(pending)
+        else:
+            # Bound the queue so memory doesn't grow with the input
+            while len(in_flight) >= workers * 2:
+                land_oldest()
+            in_flight.append((pool.submit(_commit, collection, list(pending), merge), position))
+        pending.clear()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            for line_number, raw in rows:
+                position += 1
+                if position <= skip:
+                    summary["skipped"] += 1
+                    continue
+                summary["read"] += 1
+                try:
+                    pending.append(clean_row(collection, raw))
+                except ValueError as exc:
+                    summary["invalid"] += 1
+                    if on_invalid:
+                        on_invalid(line_number, str(exc))
+                    if max_errors is not None and summary["invalid"] > max_errors:
+                        raise ValueError(f"Aborted after {summary['invalid']} invalid rows") from None
+                    continue
+                if len(pending) >= batch_size:
+                    flush()
+            if pending:
+                flush()
+            while in_flight:
+                land_oldest()
+        except BaseException:
+            # Don't start queued batches past the failure; running ones finish
+            for future, _ in in_flight:
+                future.cancel()
+            raise
+    if on_checkpoint and not dry_run:
+        on_checkpoint(position)
+    if summary["written"] and not dry_run:
+        _invalidate_catalog()
+    return summary
+
+
+# Export
+
+def export_rows(stream, collection: str, fmt: str, page_size: int = MAX_PAGE_SIZE) -> int:
+    """Write every document of `collection` to the text `stream`; returns the count.
+
+    JSONL carries whole documents; CSV has the catalog columns (and only those
+    are read from Firestore). Both re-import with import_rows.
+    """
+    if collection not in CATALOG_FIELDS:
+        raise ValueError(f"Unknown collection '{collection}'")
+    count = 0
+    if fmt == "csv":
+        fields = CATALOG_FIELDS[collection]
+        writer = csv.DictWriter(stream, fieldnames=("id",) + fields, extrasaction="ignore")
+        writer.writeheader()
+        for item in iter_collection(collection, page_size, fields=fields):
+            writer.writerow({k: csv_cell(v) for k, v in item.items()})
+            count += 1
+        return count
+    for item in iter_collection(collection, page_size):
+        stream.write(encoding.dumps(item).decode("utf-8"))
+        stream.write("\n")
+        count += 1
+    return count
@@ -0,0 +1,251 @@
+"""Live in-memory mirror of the services and categories collections.
+
+Each worker subscribes to both collections with Firestore snapshot listeners
+and applies the change events to an id-indexed copy, so catalog reads need no
+round trip and no TTL re-reads. core.catalog serves from the mirror while it
+is healthy and falls back to direct (cached) reads otherwise.
+
+Cost: every worker process holds two open listener streams and a full copy of
+both collections, and each (re)subscription is billed one read per document.
+That suits a catalog of up to a few thousand small documents; for larger ones
+set CATALOG_MIRROR=False and rely on the read-through cache.
+"""
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+
+from .firestore_client import get_firestore_client
+
+logger = logging.getLogger(__name__)
+
+
+def _doc_id_key(item):
+    return item["id"]
+
+
+def _name_key(item):
+    return (item.get("name"), item["id"])
+
+
+class CollectionMirror:
+    """An ordered, id-indexed copy of one collection kept current by on_snapshot.
+
+    `sort_key` must reproduce the order of the equivalent direct query, and
+    `include` drops documents the query would not return (e.g. a missing
+    order_by field).
+    """
+
+    def __init__(self, collection: str, sort_key=_doc_id_key, include=None):
+        self.collection = collection
+        self._sort_key = sort_key
+        self._include = include
+        self._docs = {}  # id -> document dict
+        self._ordered = []  # documents in query order; None until re-sorted after a change
+        self._lock = threading.Lock()
+        self._watch = None
+        self._ready = False
+        self._error = None
+        self._last_event = None
+        self.events = 0
+        self.subscriptions = 0
+
+    def start(self):
+        """Subscribe to the collection (no-op while a listener is active)."""
+        with self._lock:
+            if self._watch is not None and self._listener_active():
+                return
+            self._stop_locked()
+            # The new listener's first snapshot re-adds every current document
+            self._docs = {}
+            self._ordered = []
+            self._ready = False
+            self._error = None
+            query = get_firestore_client().collection(self.collection)
+            self._watch = query.on_snapshot(self._on_snapshot)
+            self.subscriptions += 1
+
+    def stop(self):
+        with self._lock:
+            self._stop_locked()
+            self._ready = False
+
+    def _stop_locked(self):
+        watch, self._watch = self._watch, None
+        if watch is not None:
+            try:
+                watch.unsubscribe()
+            except Exception:
+                logger.debug("Failed to unsubscribe %s listener", self.collection, exc_info=True)
+
+    def _listener_active(self):
+        # Watch.is_active turns False once the stream has closed on an error
+        return getattr(self._watch, "is_active", True)
+
+    def _on_snapshot(self, docs, changes, read_time):
+        try:
+            with self._lock:
+                # Apply just the changed documents; the order is rebuilt lazily
+                # by the next list(), once per burst of events
+                for change in changes:
+                    doc = change.document
+                    if change.type.name == "REMOVED":
+                        self._docs.pop(doc.id, None)
+                        continue
+                    item = doc.to_dict() or {}
+                    item["id"] = doc.id
+                    self._docs[doc.id] = item
+                if changes:
+                    self._ordered = None
+                self._ready = True
+                self._last_event = time.monotonic()
+                self.events += 1
+        except Exception as exc:
+            # Never raise into the listener thread; mark the mirror unhealthy instead
+            self._error = exc.__class__.__name__
+            self._ready = False
+            logger.exception("Failed to apply %s snapshot", self.collection)
+
+    @property
+    def healthy(self):
+        return self._ready and self._watch is not None and self._listener_active()
+
+    @property
+    def failed(self):
+        """Subscribing or applying a snapshot failed, or the listener's stream closed."""
+        return self._error is not None or (self._watch is not None and not self._listener_active())
+
+    def list(self, limit: int, fields=None):
+        """Copies of the first `limit` documents, projected to `fields` when given."""
+        with self._lock:
+            ordered = self._ordered
+            if ordered is None:
+                events, items = self.events, list(self._docs.values())
+        if ordered is None:
+            # Sort outside the lock so the listener thread is never held up
+            if self._include is not None:
+                items = filter(self._include, items)
+            ordered = sorted(items, key=self._sort_key)
+            with self._lock:
+                if self.events == events:
+                    self._ordered = ordered
+        items = ordered[:limit]
+        if fields is None:
+            return [dict(item) for item in items]
+        keep = set(fields) | {"id"}
+        return [{k: v for k, v in item.items() if k in keep} for item in items]
+
+    def get(self, doc_id: str):
+        with self._lock:
+            item = self._docs.get(doc_id)
+        return dict(item) if item is not None else None
+
+    def status(self):
+        return {
+            "ready": self.healthy,
+            "documents": len(self._docs),
+            "events": self.events,
+            "subscriptions": self.subscriptions,
+            "last_event_age": self.age(),
+            "error": self._error,  # exception class only; details are logged
+        }
+
+    def age(self):
+        """Seconds since the last snapshot event, or None before the first."""
+        return round(time.monotonic() - self._last_event, 3) if self._last_event else None
+
+
+services_mirror = CollectionMirror("services")
+# list_categories() orders by name, which also skips documents without one
+categories_mirror = CollectionMirror("categories", sort_key=_name_key, include=lambda item: item.get("name") is not None)
+_MIRRORS = (services_mirror, categories_mirror)
+
+_start_lock = threading.Lock()
+_last_start_attempt = None
+_start_pid = None
+
+
+def _reset_after_fork():
+    # Listener threads do not survive fork; the child subscribes on first use
+    global _start_lock, _last_start_attempt, _start_pid
+    _start_lock = threading.Lock()
+    _last_start_attempt = None
+    _start_pid = None
+    for mirror in _MIRRORS:
+        mirror._lock = threading.Lock()
+        mirror._watch = None
+        mirror._ready = False
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def mirror_enabled():
+    return getattr(settings, "CATALOG_MIRROR", True)
+
+
+def start_catalog_mirror():
+    """Subscribe both mirrors in this process. Returns True on success."""
+    global _start_pid
+    try:
+        for mirror in _MIRRORS:
+            mirror.start()
+    except Exception as exc:
+        for mirror in _MIRRORS:
+            mirror._error = exc.__class__.__name__
+        logger.warning("Catalog mirror failed to start: %s", exc, exc_info=True)
+        return False
+    _start_pid = os.getpid()
+    return True
+
+
+def ensure_catalog_mirror():
+    """(Re)start listeners that are down, at most once per CATALOG_MIRROR_RETRY seconds."""
+    global _last_start_attempt
+    if not mirror_enabled():
+        return
+    if _start_pid == os.getpid() and all(m._watch is not None and m._listener_active() for m in _MIRRORS):
+        return
+    now = time.monotonic()
+    retry = getattr(settings, "CATALOG_MIRROR_RETRY", 30)
+    if _last_start_attempt is not None and now - _last_start_attempt < retry:
+        return
+    # Subscribe in the background so a request never waits on it
+    if not _start_lock.acquire(blocking=False):
+        return
+    _last_start_attempt = now
+    threading.Thread(target=_start_and_release, name="catalog-mirror-start", daemon=True).start()
+
+
+def _start_and_release():
+    try:
+        start_catalog_mirror()
+    finally:
+        _start_lock.release()
+
+
+def catalog_mirror_health():
+    """Public summary for /api/status/: a state and the age of the oldest mirror."""
+    if not mirror_enabled():
+        state = "disabled"
+    elif all(m.healthy for m in _MIRRORS):
+        state = "ready"
+    elif any(m.failed for m in _MIRRORS):
+        state = "down"
+    else:
+        state = "starting"
+    ages = [m.age() for m in _MIRRORS]
+    return {"state": state, "age_seconds": None if None in ages else max(ages)}
+
+
+def catalog_mirror_status():
+    """Per-mirror counters for /api/admin/metrics/."""
+    return {
+        "enabled": mirror_enabled(),
+        "ready": mirror_enabled() and all(m.healthy for m in _MIRRORS),
+        "services": services_mirror.status(),
+        "categories": categories_mirror.status(),
+    }
@@ -0,0 +1,56 @@
+"""Conditional GET (ETag / Last-Modified / 304) for read endpoints.
+
+Validators are a hash of the response data, plus Last-Modified where the
+document carries an update time. A client whose copy is current gets a 304
+with no body. Cache-Control comes from settings.HTTP_CACHE_CONTROL per endpoint.
+"""
+import hashlib
+from datetime import datetime
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+from . import encoding
+
+
+def etag_for(data) -> str:
+    """A strong ETag for JSON-serializable `data` (stable across key order)."""
+    payload = encoding.dumps(data, sort_keys=True)
+    return '"%s"' % hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _timestamp(value):
+    # Accepts a datetime or the ISO strings stored in profile documents
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return int(value.timestamp())
+
+
+def conditional_response(request, response, policy: str, data=None, last_modified=None, vary=None):
+    """Add validators and the `policy` Cache-Control to a 200 response, or
+    return 304 Not Modified when the request's If-None-Match/If-Modified-Since
+    says the client already has it.
+
+    `data` defaults to the DRF response's `.data`; pass it for plain JsonResponses.
+    """
+    if request.method not in ("GET", "HEAD") or response.status_code != 200:
+        return response
+    etag = etag_for(response.data if data is None else data)
+    timestamp = _timestamp(last_modified)
+    response["ETag"] = etag
+    if timestamp:
+        response["Last-Modified"] = http_date(timestamp)
+    control = getattr(settings, "HTTP_CACHE_CONTROL", {}).get(policy)
+    if control:
+        response["Cache-Control"] = control
+    if vary:
+        patch_vary_headers(response, vary)
+    return get_conditional_response(request, etag=etag, last_modified=timestamp, response=response)
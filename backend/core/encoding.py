@@ -0,0 +1,79 @@
+"""JSON encoding shared by the API renderer, async views and streamed listings.
+
+Uses orjson when it is installed and the standard library otherwise; both
+produce compact UTF-8 output. Firestore values are encoded the way DRF encodes
+their Python equivalents: timestamps as ISO 8601 (UTC as "Z"), GeoPoints as
+{"latitude", "longitude"} and document references as their path.
+"""
+import datetime
+import decimal
+import json
+import uuid
+
+from django.utils.functional import Promise
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def _isoformat(value):
+    text = value.isoformat()
+    if text.endswith("+00:00"):
+        text = text[:-6] + "Z"
+    return text
+
+
+def default(obj):
+    """Encode the non-JSON types found in API data (Firestore and Python)."""
+    if isinstance(obj, datetime.datetime):
+        # Includes Firestore's DatetimeWithNanoseconds
+        return _isoformat(obj)
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, (uuid.UUID, Promise)):
+        # Promise: lazy translations such as gettext_lazy() messages
+        return str(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "latitude") and hasattr(obj, "longitude"):
+        # google.cloud.firestore GeoPoint
+        return {"latitude": obj.latitude, "longitude": obj.longitude}
+    if hasattr(obj, "path") and hasattr(obj, "parent"):
+        # google.cloud.firestore DocumentReference
+        return obj.path
+    if type(obj).__module__.startswith("google."):
+        # Other Firestore values: readable rather than a 500
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    # Route every datetime through default() so subclasses and naive values
+    # are encoded exactly like the stdlib path
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj, sort_keys: bool = False) -> bytes:
+        options = _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=default, option=options)
+
+    def loads(data):
+        return orjson.loads(data)
+else:
+    def dumps(obj, sort_keys: bool = False) -> bytes:
+        text = json.dumps(obj, default=default, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+        return text.encode("utf-8")
+
+    def loads(data):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+
+def backend_name():
+    return "orjson" if orjson is not None else "json"
@@ -0,0 +1,93 @@
+"""Full booking exports (CSV or NDJSON) for finance and ops.
+
+Shared by /api/admin/bookings/export/ and the export_bookings management
+command. Bookings are read in cursor-paged chunks of MAX_PAGE_SIZE, projected
+to the exported columns, and encoded into ~64 KB byte chunks as they arrive. A
+consumer that stops reading stops the Firestore reads too, so memory stays
+flat whatever the size of the export.
+"""
+from datetime import date
+
+from .firestore_client import BOOKING_SORTS, BOOKING_STAT_STATUSES, DEFAULT_BOOKING_SORT, MAX_PAGE_SIZE, iter_all_bookings
+from .streaming import csv_chunks, ndjson_chunks
+
+EXPORT_FORMATS = ("csv", "ndjson")
+# The fields the bookings view writes; bookings carry no updated_at of their own
+BOOKING_EXPORT_COLUMNS = (
+    "id", "created_at", "booking_date", "booking_time", "status", "user_id",
+    "service_id", "service_title", "total_price", "address",
+)
+
+
+def booking_filters(params):
+    """Return (filters, sort) from string `params` (a QueryDict or dict).
+
+    Supports status (comma-separated for several), service_id, user_id,
+    booking_date (exact) or booking_date_from/booking_date_to (YYYY-MM-DD,
+    inclusive), and sort (one of BOOKING_SORTS). Raises ValueError for bad input.
+    """
+    filters = []
+    statuses = [s.strip() for s in (params.get("status") or "").split(",") if s.strip()]
+    for value in statuses:
+        if value not in BOOKING_STAT_STATUSES:
+            raise ValueError(f"Unknown status: {value!r}")
+    if len(statuses) == 1:
+        filters.append(("status", "==", statuses[0]))
+    elif statuses:
+        filters.append(("status", "in", tuple(dict.fromkeys(statuses))))
+    for field in ("service_id", "user_id"):
+        if params.get(field):
+            filters.append((field, "==", params[field]))
+
+    dates = {}
+    for name in ("booking_date", "booking_date_from", "booking_date_to"):
+        value = params.get(name)
+        if value:
+            try:
+                dates[name] = date.fromisoformat(value).isoformat()
+            except ValueError:
+                raise ValueError(f"{name} must be a YYYY-MM-DD date")
+    ranged = "booking_date_from" in dates or "booking_date_to" in dates
+    if "booking_date" in dates:
+        if ranged:
+            raise ValueError("Use either booking_date or booking_date_from/booking_date_to")
+        filters.append(("booking_date", "==", dates["booking_date"]))
+    if "booking_date_from" in dates:
+        filters.append(("booking_date", ">=", dates["booking_date_from"]))
+    if "booking_date_to" in dates:
+        filters.append(("booking_date", "<=", dates["booking_date_to"]))
+
+    sort = params.get("sort") or ("booking_date" if ranged else DEFAULT_BOOKING_SORT)
+    if sort not in BOOKING_SORTS:
+        raise ValueError(f"sort must be one of: {', '.join(BOOKING_SORTS)}")
+    if ranged and BOOKING_SORTS[sort][0] != "booking_date":
+        # Firestore requires the range field to be the first sort key
+        raise ValueError("A booking_date range requires sort=booking_date or sort=-booking_date")
+    return tuple(filters), sort
+
+
+def export_filename(fmt: str, filters=()) -> str:
+    """A download name such as bookings-2026-01-01_2026-01-31.csv."""
+    bounds = {op: value for field, op, value in filters if field == "booking_date"}
+    if "==" in bounds:
+        span = bounds["=="]
+    elif bounds:
+        span = f"{bounds.get('>=', 'start')}_{bounds.get('<=', date.today().isoformat())}"
+    else:
+        span = f"all-{date.today().isoformat()}"
+    return f"bookings-{span}.{fmt}"
+
+
+def booking_export_chunks(fmt: str, filters=(), sort: str = DEFAULT_BOOKING_SORT, columns=BOOKING_EXPORT_COLUMNS):
+    """Yield the export of every matching booking as byte chunks.
+
+    CSV has one column per entry of `columns`; NDJSON has one object per
+    booking with those fields. Only `columns` are read from Firestore.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    fields = tuple(c for c in columns if c != "id")
+    bookings = iter_all_bookings(chunk_size=MAX_PAGE_SIZE, fields=fields, filters=filters, sort=sort)
+    if fmt == "csv":
+        return csv_chunks(bookings, columns)
+    return ndjson_chunks(bookings)
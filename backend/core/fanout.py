@@ -0,0 +1,115 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+
+from django.conf import settings
+
+
+# Shared pool for views that gather data from several remote sources at once.
+# Created lazily per process (and again after fork) like the Firestore client.
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+# A running future cannot be cancelled, so a source that overruns its budget
+# keeps its worker thread until the call returns. Those futures are tracked,
+# and once they hold half the pool it is replaced so new requests do not queue
+# behind them. The old pool's threads exit as their calls finish.
+_overdue = set()
+_stats = {"timeouts": 0, "recycled": 0}
+
+
+def _max_workers():
+    return getattr(settings, "FANOUT_MAX_WORKERS", 16)
+
+
+def _get_executor():
+    global _executor, _executor_pid
+    pid = os.getpid()
+    if _executor is not None and _executor_pid == pid:
+        return _executor
+    with _executor_lock:
+        if _executor is None or _executor_pid != pid:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers(), thread_name_prefix="fanout")
+            _executor_pid = pid
+            _overdue.clear()
+    return _executor
+
+
+def _track_overdue(executor, future):
+    """Record a timed-out future still holding a worker; recycle the pool when
+    overdue calls occupy half of it."""
+    global _executor
+    with _executor_lock:
+        if executor is not _executor:
+            return
+        _overdue.add(future)
+        if len(_overdue) * 2 < _max_workers():
+            recycle = False
+        else:
+            _executor = None
+            _overdue.clear()
+            _stats["recycled"] += 1
+            recycle = True
+    if recycle:
+        # Queued work still runs; nothing waits for the stuck calls
+        executor.shutdown(wait=False)
+    else:
+        future.add_done_callback(_overdue.discard)
+
+
+def fanout_stats():
+    """Per-process counters: sources that timed out, pools replaced, and
+    overdue calls currently holding a worker of the active pool."""
+    return {**_stats, "overdue": len(_overdue)}
+
+
+class FanoutResult:
+    """Outcome of gather(): values by source name plus per-source failures."""
+
+    def __init__(self):
+        self.results = {}
+        self.errors = {}
+
+    def get(self, name, default=None):
+        return self.results.get(name, default)
+
+    @property
+    def failed(self):
+        return sorted(self.errors)
+
+    @property
+    def partial(self):
+        return bool(self.errors)
+
+
+def gather(sources: dict, timeout: float = None, timeouts: dict = None):
+    """Run each callable in `sources` concurrently and collect the results.
+
+    `timeout` is the default budget per source in seconds (measured from the
+    start of the call) and `timeouts` overrides it per name. A source that
+    raises or runs out of time is recorded in `errors` instead of failing the
+    whole call, so views can answer with partial data. A source that runs out
+    of time is not interrupted; see _overdue.
+    """
+    if timeout is None:
+        timeout = getattr(settings, "FANOUT_TIMEOUT", 15)
+    timeouts = timeouts or {}
+    executor = _get_executor()
+    started = time.monotonic()
+    futures = {name: executor.submit(fn) for name, fn in sources.items()}
+
+    outcome = FanoutResult()
+    for name, future in futures.items():
+        budget = timeouts.get(name, timeout)
+        remaining = None if budget is None else max(0.0, started + budget - time.monotonic())
+        try:
+            outcome.results[name] = future.result(timeout=remaining)
+        except FuturesTimeout:
+            _stats["timeouts"] += 1
+            if not future.cancel() and not future.done():
+                _track_overdue(executor, future)
+            outcome.errors[name] = TimeoutError(f"{name} did not finish within {budget}s")
+        except Exception as exc:
+            outcome.errors[name] = exc
+    return outcome
@@ -0,0 +1,197 @@
+"""Async counterparts of the read helpers in core.firestore_client.
+
+Built on the async Firestore client so an ASGI worker can keep many Firestore
+calls in flight on one event loop instead of parking a thread per call. The
+helpers return the same shapes as their sync twins.
+"""
+import asyncio
+import os
+
+from .firebase import init_firebase_app
+from .firestore_client import (
+    BOOKING_SORTS,
+    DEFAULT_BOOKING_SORT,
+    MAX_PAGE_SIZE,
+    PROFILE_LIST_FIELDS,
+    decode_page_token,
+    encode_page_token,
+    filter_query,
+    project,
+)
+from .singleflight import coalesce
+
+
+# One async client per (process, event loop): grpc.aio channels are bound to
+# the loop that created them.
+_clients = {}
+_client_stats = {"creations": 0}
+
+
+def get_async_firestore_client():
+    loop = asyncio.get_running_loop()
+    key = (os.getpid(), id(loop))
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    init_firebase_app()
+    try:
+        from firebase_admin import firestore_async
+    except Exception as exc:
+        raise RuntimeError("firebase_admin is not installed or could not be imported") from exc
+    # Drop clients that belonged to a parent process or a closed loop
+    for stale in [k for k in _clients if k[0] != key[0]]:
+        _clients.pop(stale, None)
+    client = firestore_async.client()
+    _clients[key] = client
+    _client_stats["creations"] += 1
+    return client
+
+
+def get_async_client_stats():
+    return {"pid": os.getpid(), "clients": len(_clients), **_client_stats}
+
+
+def _doc_to_dict(d):
+    item = d.to_dict() or {}
+    item["id"] = d.id
+    return item
+
+
+async def _collect(query):
+    return [_doc_to_dict(d) async for d in query.stream()]
+
+
+async def _get_doc(collection: str, doc_id: str):
+    db = get_async_firestore_client()
+    doc = await db.collection(collection).document(doc_id).get()
+    if not doc.exists:
+        return None
+    return _doc_to_dict(doc)
+
+
+async def _paged_query(query, page_size: int, page_token: str = None, order_field: str = None, direction: str = "ASCENDING", fields=None):
+    """Async twin of firestore_client._paged_query (same page tokens)."""
+    page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+    query = project(query, fields, order_field)
+    if order_field:
+        query = query.order_by(order_field, direction=direction)
+    query = query.order_by("__name__", direction=direction)
+    if page_token:
+        query = query.start_after(decode_page_token(page_token, order_field))
+
+    items = await _collect(query.limit(page_size + 1))
+    has_more = len(items) > page_size
+    items = items[:page_size]
+
+    next_token = None
+    if has_more and items:
+        cursor = {"__name__": items[-1]["id"]}
+        if order_field:
+            cursor[order_field] = items[-1].get(order_field)
+        next_token = encode_page_token(cursor)
+    return items, next_token
+
+
+@coalesce
+async def list_services(limit: int = 50, fields=None):
+    db = get_async_firestore_client()
+    return await _collect(project(db.collection("services"), fields).limit(limit))
+
+
+@coalesce
+async def list_services_page(page_size: int = 50, page_token: str = None, fields=None):
+    db = get_async_firestore_client()
+    return await _paged_query(db.collection("services"), page_size, page_token, fields=fields)
+
+
+@coalesce
+async def get_service(service_id: str):
+    return await _get_doc("services", service_id)
+
+
+@coalesce
+async def list_bookings_for_user(user_uid: str, limit: int = 100, fields=None):
+    db = get_async_firestore_client()
+    return await _collect(project(db.collection("bookings").where("user_id", "==", user_uid), fields).limit(limit))
+
+
+@coalesce
+async def list_bookings_for_user_page(user_uid: str, page_size: int = 100, page_token: str = None, fields=None):
+    db = get_async_firestore_client()
+    q = db.collection("bookings").where("user_id", "==", user_uid)
+    return await _paged_query(q, page_size, page_token, fields=fields)
+
+
+@coalesce
+async def get_booking(booking_id: str):
+    return await _get_doc("bookings", booking_id)
+
+
+@coalesce
+async def list_all_bookings(limit: int = 500, fields=None, filters=None, sort: str = DEFAULT_BOOKING_SORT):
+    db = get_async_firestore_client()
+    order_field, direction = BOOKING_SORTS[sort]
+    q = project(filter_query(db.collection("bookings"), filters), fields, order_field)
+    return await _collect(q.order_by(order_field, direction=direction).limit(limit))
+
+
+@coalesce
+async def list_all_bookings_page(page_size: int = 100, page_token: str = None, fields=None, filters=None, sort: str = DEFAULT_BOOKING_SORT):
+    db = get_async_firestore_client()
+    order_field, direction = BOOKING_SORTS[sort]
+    q = filter_query(db.collection("bookings"), filters)
+    return await _paged_query(q, page_size, page_token, order_field=order_field, direction=direction, fields=fields)
+
+
+@coalesce
+async def get_profile(uid: str):
+    db = get_async_firestore_client()
+    doc = await db.collection("user_profiles").document(uid).get()
+    if not doc.exists:
+        return None
+    data = _doc_to_dict(doc)
+    try:
+        if getattr(doc, "create_time", None):
+            data.setdefault("created_at", doc.create_time.isoformat())
+        if getattr(doc, "update_time", None):
+            data.setdefault("updated_at", doc.update_time.isoformat())
+    except Exception:
+        pass
+    return data
+
+
+@coalesce
+async def list_profiles_map(limit: int = 10000):
+    db = get_async_firestore_client()
+    results = {}
+    async for d in db.collection("user_profiles").select(list(PROFILE_LIST_FIELDS)).limit(limit).stream():
+        item = _doc_to_dict(d)
+        try:
+            if getattr(d, "create_time", None):
+                item.setdefault("created_at", d.create_time.isoformat())
+        except Exception:
+            pass
+        results[d.id] = item
+    return results
+
+
+@coalesce
+async def get_user_role(uid: str):
+    return await _get_doc("user_roles", uid)
+
+
+@coalesce
+async def list_roles_map(limit: int = 10000):
+    db = get_async_firestore_client()
+    roles = {}
+    async for d in db.collection("user_roles").select(["role"]).limit(limit).stream():
+        role = (d.to_dict() or {}).get("role")
+        if role:
+            roles[d.id] = role
+    return roles
+
+
+@coalesce
+async def list_categories(limit: int = 200):
+    db = get_async_firestore_client()
+    return await _collect(db.collection("categories").order_by("name").limit(limit))
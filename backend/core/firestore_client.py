@@ -1,16 +1,82 @@
+import base64
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
 from .firebase import init_firebase_app
+from .singleflight import coalesce
+
+
+# Process-wide Firestore client. firestore.client() opens a gRPC channel and
+# loads credentials, so it is built once per worker and shared by all threads.
+# The pid is recorded so a forked child (gunicorn --preload) never reuses the
+# parent's channel.
+_client = None
+_client_pid = None
+_client_lock = threading.Lock()
+_client_stats = {"creations": 0, "warmups": 0, "warmup_errors": 0, "resets": 0}
+
+
+def _reset_client_after_fork():
+    global _client, _client_pid, _client_lock
+    _client = None
+    _client_pid = None
+    # A lock held by another thread at fork time would stay held forever in the child
+    _client_lock = threading.Lock()
+    _client_stats["resets"] += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_client_after_fork)
 
 
 def get_firestore_client():
-    # Lazy import firebase_admin.firestore so the module can be imported even
-    # if firebase-admin is not installed in the environment.
-    init_firebase_app()
+    """Return the process-wide Firestore client, creating it on first use."""
+    global _client, _client_pid
+    pid = os.getpid()
+    client = _client
+    if client is not None and _client_pid == pid:
+        return client
+
+    with _client_lock:
+        if _client is not None and _client_pid == pid:
+            return _client
+        # Lazy import firebase_admin.firestore so the module can be imported even
+        # if firebase-admin is not installed in the environment.
+        init_firebase_app()
+        try:
+            from firebase_admin import firestore
+        except Exception as exc:
+            raise RuntimeError("firebase_admin is not installed or could not be imported") from exc
+
+        _client = firestore.client()
+        _client_pid = pid
+        _client_stats["creations"] += 1
+        return _client
+
+
+def warm_firestore_client():
+    """Create the client and issue a cheap read so the gRPC channel is open and
+    credentials are loaded before the first real request arrives.
+    Returns True on success; failures are counted and swallowed.
+    """
     try:
-        from firebase_admin import firestore
-    except Exception as exc:
-        raise RuntimeError("firebase_admin is not installed or could not be imported") from exc
+        db = get_firestore_client()
+        # Reading a missing document costs one lookup and no payload
+        db.collection("services").document("__warmup__").get()
+        _client_stats["warmups"] += 1
+        return True
+    except Exception:
+        _client_stats["warmup_errors"] += 1
+        return False
 
-    return firestore.client()
+
+def get_client_stats():
+    """Return counters for the process-wide client (creations should stay at 1)."""
+    return {"pid": os.getpid(), "active": _client is not None and _client_pid == os.getpid(), **_client_stats}
 
 
 def get_firebase_auth_client():
@@ -23,10 +89,137 @@ def get_firebase_auth_client():
     return fb_auth
 
 
+# Cursor pagination. Page tokens are opaque base64 JSON holding the order-by
+# values of the last document returned; the next page starts after them, so
+# every page costs page_size reads no matter how deep the client has paged.
+MAX_PAGE_SIZE = 500
+
+
+def encode_page_token(cursor: dict) -> str:
+    values = {}
+    for key, value in cursor.items():
+        if isinstance(value, datetime):
+            value = {"$ts": value.isoformat()}
+        values[key] = value
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_page_token(token: str, order_field: str = None) -> dict:
+    """Decode a page token for a query ordered by `order_field` (then id).
+    Raises ValueError when it is malformed or was issued for another ordering,
+    so a forged token is a 400 rather than a Firestore error.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as exc:
+        raise ValueError("Invalid page token") from exc
+    if not isinstance(values, dict) or not isinstance(values.get("__name__"), str) or not values["__name__"]:
+        raise ValueError("Invalid page token")
+    if set(values) != {"__name__"} | ({order_field} if order_field else set()):
+        raise ValueError("Invalid page token")
+    for key, value in values.items():
+        if isinstance(value, dict) and "$ts" in value:
+            try:
+                values[key] = datetime.fromisoformat(value["$ts"])
+            except (TypeError, ValueError) as exc:
+                raise ValueError("Invalid page token") from exc
+    return values
+
+
+def project(query, fields, order_field: str = None):
+    """Limit `query` to `fields` (a Firestore select() projection) when given.
+    The order-by field is always kept so page cursors can be built from results.
+    """
+    if fields is None:
+        return query
+    fields = list(fields)
+    if order_field and order_field not in fields:
+        fields.append(order_field)
+    return query.select(fields)
+
+
+def _paged_query(query, page_size: int, page_token: str = None, order_field: str = None, direction: str = "ASCENDING", fields=None):
+    """Run `query` with a stable order (order_field, then document id) from a cursor.
+    Returns (items, next_page_token); next_page_token is None on the last page.
+    `fields` projects documents to those fields (the id is always included).
+    """
+    page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+    query = project(query, fields, order_field)
+    if order_field:
+        query = query.order_by(order_field, direction=direction)
+    query = query.order_by("__name__", direction=direction)
+    if page_token:
+        query = query.start_after(decode_page_token(page_token, order_field))
+
+    # One extra document tells us whether another page exists
+    docs = list(query.limit(page_size + 1).stream())
+    has_more = len(docs) > page_size
+    docs = docs[:page_size]
+
+    items = []
+    for d in docs:
+        item = d.to_dict() or {}
+        item["id"] = d.id
+        items.append(item)
+
+    next_token = None
+    if has_more and docs:
+        cursor = {"__name__": docs[-1].id}
+        if order_field:
+            cursor[order_field] = items[-1].get(order_field)
+        next_token = encode_page_token(cursor)
+    return items, next_token
+
+
+def iter_collection(collection: str, page_size: int = MAX_PAGE_SIZE, fields=None):
+    """Yield every document of `collection` in id order, one cursor page at a time."""
+    db = get_firestore_client()
+    token = None
+    while True:
+        items, token = _paged_query(db.collection(collection), page_size, token, fields=fields)
+        yield from items
+        if not token:
+            return
+
+
+# Multi-document reads: get_all fetches a chunk of documents in one round trip,
+# so N lookups cost ceil(N / GET_ALL_CHUNK_SIZE) calls instead of N.
+GET_ALL_CHUNK_SIZE = 100
+
+
+def _valid_doc_id(doc_id) -> bool:
+    return bool(doc_id) and isinstance(doc_id, str) and "/" not in doc_id
+
+
+def _get_many(collection: str, ids, decorate=None):
+    """Return {id: document} for those `ids` that exist in `collection`.
+
+    Duplicate, empty and path-like ids are dropped. `decorate(item, snapshot)`
+    may add fields taken from the snapshot.
+    """
+    db = get_firestore_client()
+    unique = [i for i in dict.fromkeys(ids) if _valid_doc_id(i)]
+    results = {}
+    for start in range(0, len(unique), GET_ALL_CHUNK_SIZE):
+        refs = [db.collection(collection).document(i) for i in unique[start:start + GET_ALL_CHUNK_SIZE]]
+        for snap in db.get_all(refs):
+            if not snap.exists:
+                continue
+            item = snap.to_dict() or {}
+            item["id"] = snap.id
+            if decorate:
+                decorate(item, snap)
+            results[snap.id] = item
+    return results
+
+
 # Example helpers for a `services` collection
-def list_services(limit: int = 50):
+@coalesce
+def list_services(limit: int = 50, fields=None):
     db = get_firestore_client()
-    docs = db.collection("services").limit(limit).stream()
+    docs = project(db.collection("services"), fields).limit(limit).stream()
     results = []
     for d in docs:
         item = d.to_dict()
@@ -35,6 +228,13 @@ def list_services(limit: int = 50):
     return results
 
 
+@coalesce
+def list_services_page(page_size: int = 50, page_token: str = None, fields=None):
+    db = get_firestore_client()
+    return _paged_query(db.collection("services"), page_size, page_token, fields=fields)
+
+
+@coalesce
 def get_service(service_id: str):
     db = get_firestore_client()
     doc = db.collection("services").document(service_id).get()
@@ -45,28 +245,66 @@ def get_service(service_id: str):
     return data
 
 
+def _invalidate_catalog():
+    # Keep the read-through catalog cache (core.catalog) in step with writes
+    from .catalog import invalidate_catalog
+    invalidate_catalog()
+
+
+def get_services(service_ids):
+    """Return {id: service} for the services that exist (see _get_many)."""
+    return _get_many("services", service_ids)
+
+
+def _merged(doc_id: str, current, data: dict):
+    """The document as it stands after writing `data` over `current`, built
+    without reading it back. Without `current` only the written fields are known.
+    """
+    return {**(current or {}), **data, "id": doc_id}
+
+
+def _not_found_error():
+    from google.api_core.exceptions import NotFound
+    return NotFound
+
+
 def create_service(data: dict):
     db = get_firestore_client()
     doc_ref = db.collection("services").add(data)
+    _invalidate_catalog()
     return {"id": doc_ref[1].id, **data}
 
 
-def update_service(service_id: str, data: dict):
+def update_service(service_id: str, data: dict, current: dict = None, strict: bool = False):
+    """Apply `data` and return the updated service, or None if it doesn't exist.
+
+    The result is merged from `current` (the caller's copy of the document) and
+    `data`; pass strict=True to re-read it from Firestore instead.
+    """
     db = get_firestore_client()
-    db.collection("services").document(service_id).update(data)
-    return get_service(service_id)
+    try:
+        db.collection("services").document(service_id).update(data)
+    except _not_found_error():
+        return None
+    _invalidate_catalog()
+    if strict:
+        # Bypass coalescing: a read already in flight may predate this write
+        return get_service.__wrapped__(service_id)
+    return _merged(service_id, current, data)
 
 
 def delete_service(service_id: str):
     db = get_firestore_client()
     db.collection("services").document(service_id).delete()
+    _invalidate_catalog()
     return True
 
 
 # Bookings helpers
-def list_bookings_for_user(user_uid: str, limit: int = 100):
+@coalesce
+def list_bookings_for_user(user_uid: str, limit: int = 100, fields=None):
     db = get_firestore_client()
-    q = db.collection("bookings").where("user_id", "==", user_uid).limit(limit)
+    q = project(db.collection("bookings").where("user_id", "==", user_uid), fields).limit(limit)
     docs = q.stream()
     results = []
     for d in docs:
@@ -76,14 +314,30 @@ def list_bookings_for_user(user_uid: str, limit: int = 100):
     return results
 
 
+@coalesce
+def list_bookings_for_user_page(user_uid: str, page_size: int = 100, page_token: str = None, fields=None):
+    db = get_firestore_client()
+    q = db.collection("bookings").where("user_id", "==", user_uid)
+    return _paged_query(q, page_size, page_token, fields=fields)
+
+
 def create_booking(data: dict):
+    """Create a booking and bump the owner's stats counters in one atomic batch."""
     db = get_firestore_client()
-    doc_ref = db.collection("bookings").add(data)
-    return {"id": doc_ref[1].id, **data}
+    from firebase_admin import firestore
+
+    doc_ref = db.collection("bookings").document()
+    batch = db.batch()
+    batch.set(doc_ref, data)
+    if data.get("user_id"):
+        batch.set(_booking_stats_ref(db, data["user_id"]), _stats_delta(None, data.get("status"), firestore), merge=True)
+    batch.commit()
+    return {"id": doc_ref.id, **data}
 
 
 # Additional helpers to support profiles, roles, admin operations
 
+@coalesce
 def get_booking(booking_id: str):
     db = get_firestore_client()
     doc = db.collection("bookings").document(booking_id).get()
@@ -94,15 +348,166 @@ def get_booking(booking_id: str):
     return data
 
 
-def update_booking(booking_id: str, data: dict):
+def get_bookings(booking_ids):
+    return _get_many("bookings", booking_ids)
+
+
+def update_booking(booking_id: str, data: dict, current: dict = None, strict: bool = False):
+    """Apply `data` and return the updated booking, or None if it doesn't exist.
+
+    Like update_service, the result is merged from `current` and `data` unless
+    strict=True. Status changes read the document inside their transaction, so
+    that snapshot is used as the prior state.
+    """
     db = get_firestore_client()
-    db.collection("bookings").document(booking_id).update(data)
-    return get_booking(booking_id)
+    ref = db.collection("bookings").document(booking_id)
+    if "status" not in data:
+        try:
+            ref.update(data)
+        except _not_found_error():
+            return None
+        if strict:
+            return get_booking.__wrapped__(booking_id)
+        return _merged(booking_id, current, data)
+
+    # Status changes move one count between stats buckets; doing it in a
+    # transaction keeps the counters exact under concurrent edits.
+    from firebase_admin import firestore
+
+    @firestore.transactional
+    def _apply(transaction):
+        snap = ref.get(transaction=transaction)
+        if not snap.exists:
+            return None
+        current = snap.to_dict() or {}
+        transaction.update(ref, data)
+        old_status, new_status = current.get("status"), data.get("status")
+        if current.get("user_id") and old_status != new_status:
+            delta = _stats_delta(old_status, new_status, firestore, count_total=False)
+            transaction.set(_booking_stats_ref(db, current["user_id"]), delta, merge=True)
+        return current
+
+    prior = _apply(db.transaction())
+    if prior is None:
+        return None
+    if strict:
+        return get_booking.__wrapped__(booking_id)
+    return _merged(booking_id, prior, data)
+
+
+# Per-user booking counters (collection `user_booking_stats`, doc id = uid).
+# Maintained by create_booking/update_booking so /api/me/stats/ is one read.
+BOOKING_STAT_STATUSES = ("pending", "confirmed", "completed", "cancelled")
+
+
+def _booking_stats_ref(db, uid: str):
+    return db.collection("user_booking_stats").document(uid)
+
+
+def _stats_delta(old_status, new_status, firestore, count_total: bool = True):
+    delta = {"updated_at": firestore.SERVER_TIMESTAMP}
+    if count_total:
+        delta["total"] = firestore.Increment(1)
+    if old_status in BOOKING_STAT_STATUSES:
+        delta[old_status] = firestore.Increment(-1)
+    if new_status in BOOKING_STAT_STATUSES:
+        delta[new_status] = firestore.Increment(1)
+    return delta
+
 
+def _empty_stats():
+    return {"total": 0, **{k: 0 for k in BOOKING_STAT_STATUSES}}
 
-def list_all_bookings(limit: int = 500):
+
+def get_booking_stats(uid: str):
+    """Return the maintained counters for a user, or None if they were never
+    built by a full count. Increments alone (from create_booking/update_booking
+    before the first count) leave a partial document without `initialized`.
+    """
     db = get_firestore_client()
-    docs = db.collection("bookings").order_by("created_at", direction="DESCENDING").limit(limit).stream()
+    doc = _booking_stats_ref(db, uid).get()
+    if not doc.exists:
+        return None
+    data = doc.to_dict() or {}
+    if not data.get("initialized"):
+        return None
+    stats = _empty_stats()
+    for key in stats:
+        stats[key] = int(data.get(key) or 0)
+    return stats
+
+
+def rebuild_booking_stats(uid: str):
+    """Recount one user's bookings (all of them, no truncation) and store the counters.
+
+    The counters document is read inside the transaction before the bookings
+    are counted, so an increment from a concurrent create_booking/update_booking
+    either lands before the count (and is part of it) or conflicts with the
+    transaction; it is never overwritten.
+    """
+    db = get_firestore_client()
+    from firebase_admin import firestore
+    query = db.collection("bookings").where("user_id", "==", uid).select(["status"])
+    ref = _booking_stats_ref(db, uid)
+
+    @firestore.transactional
+    def _apply(transaction):
+        ref.get(transaction=transaction)
+        stats = _empty_stats()
+        for d in transaction.get(query):
+            stats["total"] += 1
+            status = (d.to_dict() or {}).get("status")
+            if status in stats:
+                stats[status] += 1
+        transaction.set(ref, {**stats, "initialized": True, "updated_at": firestore.SERVER_TIMESTAMP})
+        return stats
+
+    return _apply(db.transaction())
+
+
+def rebuild_all_booking_stats(workers: int = 8):
+    """Recount every user's bookings, one rebuild_booking_stats transaction per
+    user, so it is safe while bookings are being made. Returns the number of
+    users written.
+    """
+    db = get_firestore_client()
+    uids = set()
+    for d in db.collection("bookings").select(["user_id"]).stream():
+        uid = (d.to_dict() or {}).get("user_id")
+        if uid:
+            uids.add(uid)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(rebuild_booking_stats, uids))
+    return len(uids)
+
+
+# Admin booking listings: `filters` is a tuple of (field, op, value) Firestore
+# filters on status, service_id, user_id and booking_date, and `sort` one of
+# BOOKING_SORTS. firestore.indexes.json ships an index for each filter field
+# and sort key; Firestore merges them when several equality filters combine.
+# A range on booking_date needs booking_date as the sort key.
+BOOKING_SORTS = {
+    "-created_at": ("created_at", "DESCENDING"),
+    "created_at": ("created_at", "ASCENDING"),
+    "-booking_date": ("booking_date", "DESCENDING"),
+    "booking_date": ("booking_date", "ASCENDING"),
+}
+DEFAULT_BOOKING_SORT = "-created_at"
+
+
+def filter_query(query, filters):
+    for field, op, value in filters or ():
+        # Multi-value filters ("in") arrive as tuples so they can be cache keys
+        query = query.where(field, op, list(value) if isinstance(value, tuple) else value)
+    return query
+
+
+@coalesce
+def list_all_bookings(limit: int = 500, fields=None, filters=None, sort: str = DEFAULT_BOOKING_SORT):
+    db = get_firestore_client()
+    order_field, direction = BOOKING_SORTS[sort]
+    q = project(filter_query(db.collection("bookings"), filters), fields, order_field)
+    docs = q.order_by(order_field, direction=direction).limit(limit).stream()
     results = []
     for d in docs:
         item = d.to_dict()
@@ -111,7 +516,27 @@ def list_all_bookings(limit: int = 500):
     return results
 
 
+@coalesce
+def list_all_bookings_page(page_size: int = 100, page_token: str = None, fields=None, filters=None, sort: str = DEFAULT_BOOKING_SORT):
+    """Bookings in `sort` order (newest first by default), ties broken by document id."""
+    db = get_firestore_client()
+    order_field, direction = BOOKING_SORTS[sort]
+    q = filter_query(db.collection("bookings"), filters)
+    return _paged_query(q, page_size, page_token, order_field=order_field, direction=direction, fields=fields)
+
+
+def iter_all_bookings(chunk_size: int = 500, fields=None, filters=None, sort: str = DEFAULT_BOOKING_SORT):
+    """Yield every matching booking, walking Firestore in cursor-paged chunks."""
+    token = None
+    while True:
+        items, token = list_all_bookings_page(chunk_size, token, fields=fields, filters=filters, sort=sort)
+        yield from items
+        if not token:
+            return
+
+
 # Profiles helpers (stored in collection `user_profiles` with doc id = uid)
+@coalesce
 def get_profile(uid: str):
     db = get_firestore_client()
     doc = db.collection("user_profiles").document(uid).get()
@@ -119,6 +544,11 @@ def get_profile(uid: str):
         return None
     data = doc.to_dict()
     data["id"] = doc.id
+    _add_profile_times(data, doc)
+    return data
+
+
+def _add_profile_times(data: dict, doc):
     # Expose Firestore create/update times if present
     try:
         # google.cloud.firestore_v1.base_document.DocumentSnapshot
@@ -128,10 +558,15 @@ def get_profile(uid: str):
             data.setdefault("updated_at", doc.update_time.isoformat())
     except Exception:
         pass
-    return data
 
 
-def upsert_profile(uid: str, data: dict):
+def get_profiles(uids):
+    return _get_many("user_profiles", uids, decorate=_add_profile_times)
+
+
+def upsert_profile(uid: str, data: dict, current: dict = None, strict: bool = False):
+    """Merge `data` into the profile and return it (see update_service for
+    `current` and `strict`)."""
     db = get_firestore_client()
     # ensure created_at if not present
     from datetime import datetime, timezone
@@ -139,9 +574,12 @@ def upsert_profile(uid: str, data: dict):
     data = {**data}
     data.setdefault("updated_at", now_iso)
     db.collection("user_profiles").document(uid).set(data, merge=True)
-    return get_profile(uid)
+    if strict:
+        return get_profile.__wrapped__(uid)
+    return _merged(uid, current, data)
 
 
+@coalesce
 def list_profiles(limit: int = 1000):
     db = get_firestore_client()
     docs = db.collection("user_profiles").limit(limit).stream()
@@ -160,10 +598,21 @@ def list_profiles(limit: int = 1000):
     return results
 
 
+@coalesce
+def list_profiles_page(page_size: int = 100, page_token: str = None):
+    db = get_firestore_client()
+    return _paged_query(db.collection("user_profiles"), page_size, page_token)
+
+
+# The profile fields admin user listings render; list_profiles_map fetches only these
+PROFILE_LIST_FIELDS = ("name", "email", "phone", "address", "created_at")
+
+
+@coalesce
 def list_profiles_map(limit: int = 10000):
-    """Return a dict of uid -> profile fields from user_profiles."""
+    """Return a dict of uid -> profile fields (PROFILE_LIST_FIELDS) from user_profiles."""
     db = get_firestore_client()
-    docs = db.collection("user_profiles").limit(limit).stream()
+    docs = db.collection("user_profiles").select(list(PROFILE_LIST_FIELDS)).limit(limit).stream()
     results = {}
     for d in docs:
         item = d.to_dict() or {}
@@ -178,6 +627,7 @@ def list_profiles_map(limit: int = 10000):
 
 
 # Roles helpers (collection `user_roles`, doc id = uid, field `role`)
+@coalesce
 def get_user_role(uid: str):
     db = get_firestore_client()
     doc = db.collection("user_roles").document(uid).get()
@@ -188,16 +638,39 @@ def get_user_role(uid: str):
     return data
 
 
-def set_user_role(uid: str, role: str):
+def get_user_roles(uids):
+    """Return {uid: role document} for the uids that have one."""
+    return _get_many("user_roles", uids)
+
+
+def set_user_role(uid: str, role: str, sync_claims: bool = True, strict: bool = False):
     db = get_firestore_client()
     db.collection("user_roles").document(uid).set({"role": role}, merge=True)
-    return get_user_role(uid)
+    # Role documents hold nothing but the role, so the written value is the document
+    doc = get_user_role.__wrapped__(uid) if strict else {"role": role, "id": uid}
+    # Keep the shared role cache in step with the write (see core.roles)
+    from .roles import mark_claims_stale, prime_role
+    prime_role(uid, (doc or {}).get("role"))
+    if not sync_claims:
+        # The user's tokens still carry the old role claim
+        mark_claims_stale(uid)
+        return doc
+    # Mirror into custom claims so future tokens carry the role (core.role_claims)
+    from .role_claims import sync_role_claims
+    try:
+        sync_role_claims(uid, role)
+    except Exception as exc:
+        # Role checks for this user read user_roles until a sync succeeds
+        mark_claims_stale(uid)
+        logging.getLogger(__name__).warning("Custom claims sync failed for %s: %s", uid, exc)
+    return doc
 
 
+@coalesce
 def list_roles_map(limit: int = 10000):
     """Return a dict of uid -> role string from user_roles."""
     db = get_firestore_client()
-    docs = db.collection("user_roles").limit(limit).stream()
+    docs = db.collection("user_roles").select(["role"]).limit(limit).stream()
     roles = {}
     for d in docs:
         data = d.to_dict() or {}
@@ -207,44 +680,78 @@ def list_roles_map(limit: int = 10000):
     return roles
 
 
-def list_auth_users(limit: int = 1000):
-    """List Firebase Auth users. Returns minimal user entries with id, email, name, created_at.
-    Note: Iterates using paging; limit is a soft cap to prevent extremely large lists.
+def _auth_user_record(user):
+    """Compact entry for a Firebase Auth user: id, email, name, created_at."""
+    created_at = None
+    try:
+        # user.user_metadata.creation_timestamp is in milliseconds
+        creation_ms = getattr(user.user_metadata, "creation_timestamp", None)
+        if creation_ms:
+            created_at = datetime.fromtimestamp(creation_ms / 1000.0, tz=timezone.utc).isoformat()
+    except Exception:
+        created_at = None
+    return {
+        "id": user.uid,
+        "email": user.email or "",
+        "name": user.display_name or "",
+        "created_at": created_at,
+    }
+
+
+def iter_auth_user_pages(page_token: str = None, page_size: int = 1000, limit: int = None):
+    """Yield (records, next_page_token) for each page of Firebase Auth users.
+
+    Page N+1 is requested in the background while page N is converted and
+    consumed, so network wait overlaps with the caller's work. With `limit`,
+    no page is prefetched once the pages fetched so far cover it. Pass a saved
+    next_page_token to resume a listing where it stopped.
     """
     fb_auth = get_firebase_auth_client()
-    from datetime import datetime, timezone
+    page_size = max(1, min(int(page_size), 1000))  # Auth API maximum
 
-    results = []
+    def fetch(token):
+        return fb_auth.list_users(page_token=token, max_results=page_size)
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auth-prefetch")
+    try:
+        fetched = 0
+        pending = pool.submit(fetch, page_token)
+        while pending is not None:
+            page = pending.result()
+            fetched += len(page.users)
+            next_token = getattr(page, "next_page_token", None) or None
+            wanted = next_token and (limit is None or fetched < limit)
+            pending = pool.submit(fetch, next_token) if wanted else None
+            yield [_auth_user_record(u) for u in page.users], next_token
+    finally:
+        # A caller that stops early must not wait for a prefetch it won't use
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_auth_users(limit: int = 1000, page_token: str = None):
+    """Yield Firebase Auth users as minimal entries with id, email, name, created_at.
+    Note: Iterates using prefetched paging; limit is a soft cap to prevent extremely large lists.
+    """
     count = 0
-    page = fb_auth.list_users()
-    while page and count < limit:
-        for user in page.users:
+    pages = iter_auth_user_pages(page_token, page_size=min(max(limit, 1), 1000), limit=limit)
+    try:
+        for records, _ in pages:
+            for record in records[:limit - count]:
+                yield record
+            count += len(records)
             if count >= limit:
-                break
-            creation_ms = None
-            try:
-                # user.user_metadata.creation_timestamp is in milliseconds
-                creation_ms = getattr(user.user_metadata, "creation_timestamp", None)
-            except Exception:
-                creation_ms = None
-            created_at = None
-            if creation_ms:
-                try:
-                    created_at = datetime.fromtimestamp(creation_ms / 1000.0, tz=timezone.utc).isoformat()
-                except Exception:
-                    created_at = None
-            results.append({
-                "id": user.uid,
-                "email": user.email or "",
-                "name": user.display_name or "",
-                "created_at": created_at,
-            })
-            count += 1
-        page = page.get_next_page() if hasattr(page, "get_next_page") else None
-    return results
+                return
+    finally:
+        pages.close()
+
+
+def list_auth_users(limit: int = 1000):
+    """List Firebase Auth users (see iter_auth_users)."""
+    return list(iter_auth_users(limit))
 
 
 # Categories helpers (collection `categories` with doc fields: name)
+@coalesce
 def list_categories(limit: int = 200):
     db = get_firestore_client()
     docs = db.collection("categories").order_by("name").limit(limit).stream()
@@ -260,10 +767,161 @@ def create_category(name: str):
     db = get_firestore_client()
     data = {"name": name}
     doc_ref = db.collection("categories").add(data)
+    _invalidate_catalog()
     return {"id": doc_ref[1].id, **data}
 
 
 def delete_category(category_id: str):
     db = get_firestore_client()
     db.collection("categories").document(category_id).delete()
+    _invalidate_catalog()
     return True
+
+
+# Bulk writes. A WriteBatch holds at most MAX_BATCH_WRITES operations and
+# commits atomically, so bulk helpers split their work into chunks below that
+# limit and report an outcome per item: None on success, otherwise an error code.
+MAX_BATCH_WRITES = 500
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _error_code(exc):
+    return f"error: {exc.__class__.__name__}"
+
+
+def bulk_update_bookings(updates: dict):
+    """Apply {booking_id: data} with one get_all and one batch per chunk.
+
+    Status changes keep user_booking_stats exact: each update is conditioned on
+    the update_time seen by the read, and per-user counter deltas are folded
+    into the same batch. If a booking changed in between, the chunk's batch
+    fails as a whole and those bookings are retried one at a time through
+    update_booking's transaction.
+    """
+    db = get_firestore_client()
+    from firebase_admin import firestore
+
+    results = {}
+    ids = []
+    for booking_id in updates:
+        if _valid_doc_id(booking_id):
+            ids.append(booking_id)
+        else:
+            results[booking_id] = "not_found"
+
+    # Up to two writes per booking (the booking and its owner's counters)
+    for chunk in _chunks(ids, MAX_BATCH_WRITES // 2):
+        snaps = {snap.id: snap for snap in db.get_all([db.collection("bookings").document(i) for i in chunk])}
+        batch = db.batch()
+        deltas = {}  # uid -> {bucket: change}
+        pending = []
+        for booking_id in chunk:
+            snap = snaps.get(booking_id)
+            if snap is None or not snap.exists:
+                results[booking_id] = "not_found"
+                continue
+            data = updates[booking_id]
+            current = snap.to_dict() or {}
+            batch.update(snap.reference, data, option=db.write_option(last_update_time=snap.update_time))
+            pending.append(booking_id)
+            old_status, new_status = current.get("status"), data.get("status", current.get("status"))
+            if current.get("user_id") and old_status != new_status:
+                user_delta = deltas.setdefault(current["user_id"], {})
+                if old_status in BOOKING_STAT_STATUSES:
+                    user_delta[old_status] = user_delta.get(old_status, 0) - 1
+                if new_status in BOOKING_STAT_STATUSES:
+                    user_delta[new_status] = user_delta.get(new_status, 0) + 1
+        for uid, user_delta in deltas.items():
+            changes = {k: firestore.Increment(v) for k, v in user_delta.items() if v}
+            if changes:
+                batch.set(_booking_stats_ref(db, uid), {**changes, "updated_at": firestore.SERVER_TIMESTAMP}, merge=True)
+        if not pending:
+            continue
+        try:
+            batch.commit()
+            results.update({booking_id: None for booking_id in pending})
+        except Exception:
+            for booking_id in pending:
+                try:
+                    results[booking_id] = None if update_booking(booking_id, updates[booking_id]) else "not_found"
+                except Exception as exc:
+                    results[booking_id] = _error_code(exc)
+    return results
+
+
+def bulk_write_services(operations: list):
+    """Apply [(op, service_id, data)] where op is "update" or "delete".
+
+    Existence is checked with one get_all so a missing service is reported
+    instead of failing its whole batch. The catalog cache is invalidated once.
+    """
+    db = get_firestore_client()
+    existing = _get_many("services", [service_id for _, service_id, _ in operations])
+    results = {}
+    live = []
+    for op, service_id, data in operations:
+        if service_id not in existing:
+            results[service_id] = "not_found"
+        else:
+            live.append((op, service_id, data))
+
+    for chunk in _chunks(live, MAX_BATCH_WRITES):
+        batch = db.batch()
+        for op, service_id, data in chunk:
+            ref = db.collection("services").document(service_id)
+            if op == "delete":
+                batch.delete(ref)
+            else:
+                batch.update(ref, data)
+        try:
+            batch.commit()
+            outcome = None
+        except Exception as exc:
+            outcome = _error_code(exc)
+        results.update({service_id: outcome for _, service_id, _ in chunk})
+    if live:
+        _invalidate_catalog()
+    return results
+
+
+def bulk_set_user_roles(roles: dict, sync_claims: bool = True):
+    """Write {uid: role} in batches, then prime the role cache and push custom
+    claims for the written users in parallel (see set_user_role).
+
+    Returns (results, claim_errors): claim failures don't fail the write, as in
+    set_user_role, and are reported separately as {uid: message}.
+    """
+    db = get_firestore_client()
+    from .roles import prime_role
+
+    results = {}
+    valid = [uid for uid in roles if _valid_doc_id(uid)]
+    results.update({uid: "not_found" for uid in roles if uid not in valid})
+    written = {}
+    for chunk in _chunks(valid, MAX_BATCH_WRITES):
+        batch = db.batch()
+        for uid in chunk:
+            batch.set(db.collection("user_roles").document(uid), {"role": roles[uid]}, merge=True)
+        try:
+            batch.commit()
+        except Exception as exc:
+            results.update({uid: _error_code(exc) for uid in chunk})
+            continue
+        for uid in chunk:
+            results[uid] = None
+            written[uid] = roles[uid]
+            prime_role(uid, roles[uid])
+
+    claim_errors = {}
+    if sync_claims and written:
+        from .role_claims import sync_many
+        claim_errors = sync_many(written)["errors"]
+    elif written:
+        from .roles import mark_claims_stale
+        for uid in written:
+            mark_claims_stale(uid)
+    return results, claim_errors
@@ -0,0 +1,67 @@
+import copy
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+
+from .cache import TTLCache
+from .models import FirebaseIdentity
+
+
+# uid -> Django user. Only the first request for an identity touches the DB;
+# changes made to the user in Django admin (e.g. is_staff) show up after the TTL.
+_identity_cache = TTLCache(
+    maxsize=getattr(settings, "IDENTITY_CACHE_SIZE", 10000),
+    ttl=getattr(settings, "IDENTITY_CACHE_TTL", 300),
+)
+
+
+def resolve_user(uid: str, email: str = None):
+    """Return the Django user for a Firebase identity, creating it on first sight.
+
+    A fresh copy is returned each time so per-request attributes set by the
+    authentication class never leak between concurrent requests.
+    """
+    user = _identity_cache.get(uid)
+    if user is None:
+        user = _load_user(uid) or _create_user(uid, email)
+        _identity_cache.set(uid, user)
+    return copy.copy(user)
+
+
+def forget_identity(uid: str):
+    _identity_cache.delete(uid)
+
+
+def identity_cache_stats():
+    return _identity_cache.stats()
+
+
+def _load_user(uid: str):
+    # Plain indexed SELECT on the unique uid column; no write locks on the read path
+    identity = FirebaseIdentity.objects.select_related("user").filter(uid=uid).first()
+    return identity.user if identity else None
+
+
+def _create_user(uid: str, email: str = None):
+    User = get_user_model()
+    user_email = email or f"{uid}@firebase.local"
+    username = email.split("@")[0] if email else uid
+    try:
+        with transaction.atomic():
+            # Link accounts created before the uid mapping existed (matched by
+            # email). A user already mapped to another uid (a recreated Firebase
+            # account, or several accounts sharing an email) is left alone and
+            # this uid gets a user of its own.
+            user = User.objects.filter(email=user_email, firebase_identity__isnull=True).order_by("pk").first()
+            if user is None:
+                if User.objects.filter(username=username).exists():
+                    username = uid
+                user = User.objects.create(email=user_email, username=username, is_active=True)
+            FirebaseIdentity.objects.create(uid=uid, user=user)
+    except IntegrityError:
+        # Another worker mapped this uid concurrently; use its row
+        user = _load_user(uid)
+        if user is None:
+            raise
+    return user
@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.exports import BOOKING_EXPORT_COLUMNS, EXPORT_FORMATS, booking_export_chunks, booking_filters
+from core.firestore_client import BOOKING_SORTS
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream every booking (or a filtered date range) from Firestore to a CSV or NDJSON file. "
+        "The file is written under a temporary name and renamed when complete, so scheduled jobs never pick up a partial export."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Output file (.csv or .ndjson), or - for stdout")
+        parser.add_argument("--format", choices=EXPORT_FORMATS, help="Output format (default: from the file extension, else csv)")
+        parser.add_argument("--from", dest="booking_date_from", help="First booking_date to include (YYYY-MM-DD)")
+        parser.add_argument("--to", dest="booking_date_to", help="Last booking_date to include (YYYY-MM-DD)")
+        parser.add_argument("--status", help="Only these statuses (comma-separated)")
+        parser.add_argument("--service-id", dest="service_id", help="Only bookings of this service")
+        parser.add_argument("--user-id", dest="user_id", help="Only bookings of this user")
+        parser.add_argument("--sort", choices=sorted(BOOKING_SORTS), help="Row order (default: newest first, or by booking_date for a range)")
+        parser.add_argument("--columns", help=f"Comma-separated columns (default: {','.join(BOOKING_EXPORT_COLUMNS)})")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or ("ndjson" if path.lower().endswith((".ndjson", ".jsonl")) else "csv")
+        params = {k: options[k] for k in ("booking_date_from", "booking_date_to", "status", "service_id", "user_id", "sort") if options[k]}
+        columns = BOOKING_EXPORT_COLUMNS
+        if options["columns"]:
+            columns = ("id",) + tuple(c.strip() for c in options["columns"].split(",") if c.strip() and c.strip() != "id")
+        try:
+            filters, sort = booking_filters(params)
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        started = time.monotonic()
+        written = 0
+        tmp = None
+        try:
+            chunks = booking_export_chunks(fmt, filters, sort, columns)
+            if path == "-":
+                for chunk in chunks:
+                    sys.stdout.buffer.write(chunk)
+                    written += len(chunk)
+                sys.stdout.buffer.flush()
+            else:
+                tmp = f"{path}.partial"
+                with open(tmp, "wb") as fh:
+                    for chunk in chunks:
+                        fh.write(chunk)
+                        written += len(chunk)
+                os.replace(tmp, path)
+        except Exception as exc:
+            if tmp and os.path.exists(tmp):
+                os.remove(tmp)
+            raise CommandError(f"Failed to export bookings: {exc}") from exc
+
+        # Keep stdout clean for the data when exporting to it
+        out = self.stderr if path == "-" else self.stdout
+        out.write(self.style.SUCCESS(f"Exported bookings to {path} ({written / 1024:.0f} KB) in {time.monotonic() - started:.1f}s."))
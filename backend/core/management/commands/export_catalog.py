@@ -0,0 +1,40 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.catalog_io import CATALOG_FIELDS, FORMATS, detect_format, export_rows
+from core.firestore_client import MAX_PAGE_SIZE
+
+
+class Command(BaseCommand):
+    help = "Stream services or categories from Firestore to a JSONL or CSV file that import_catalog can load back."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Output file, or - for stdout")
+        parser.add_argument("--collection", choices=sorted(CATALOG_FIELDS), default="services", help="Collection to export (default services)")
+        parser.add_argument("--format", choices=FORMATS, help="Output format (default: from the file extension)")
+        parser.add_argument("--page-size", type=int, default=MAX_PAGE_SIZE, help=f"Documents read per query (default {MAX_PAGE_SIZE})")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        collection = options["collection"]
+        try:
+            fmt = detect_format(path, options["format"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        started = time.monotonic()
+        try:
+            stream = sys.stdout if path == "-" else open(path, "w", encoding="utf-8", newline="")
+            try:
+                count = export_rows(stream, collection, fmt, page_size=options["page_size"])
+            finally:
+                if stream is not sys.stdout:
+                    stream.close()
+        except Exception as exc:
+            raise CommandError(f"Failed to export {collection}: {exc}") from exc
+
+        # Keep stdout clean for the data when exporting to it
+        out = self.stderr if path == "-" else self.stdout
+        out.write(self.style.SUCCESS(f"Exported {count} {collection} to {path} in {time.monotonic() - started:.1f}s."))
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.catalog_io import CATALOG_FIELDS, FORMATS, detect_format, import_rows, load_checkpoint, read_rows, save_checkpoint
+from core.firestore_client import MAX_BATCH_WRITES
+
+
+class Command(BaseCommand):
+    help = (
+        "Load services or categories from a JSONL or CSV file into Firestore using parallel batched writes. "
+        "Rows with an id overwrite that document; rows without one get an id derived from their content."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="JSONL or CSV file to import, or - for JSONL on stdin")
+        parser.add_argument("--collection", choices=sorted(CATALOG_FIELDS), default="services", help="Target collection (default services)")
+        parser.add_argument("--format", choices=FORMATS, help="Input format (default: from the file extension)")
+        parser.add_argument("--batch-size", type=int, default=MAX_BATCH_WRITES, help=f"Documents per batch write (default {MAX_BATCH_WRITES})")
+        parser.add_argument("--workers", type=int, default=8, help="Batches committed in parallel (default 8)")
+        parser.add_argument("--merge", action="store_true", help="Merge into existing documents instead of replacing them")
+        parser.add_argument("--resume", action="store_true", help="Skip the rows recorded in the checkpoint of an earlier run")
+        parser.add_argument("--checkpoint", help="Checkpoint file (default: <path>.checkpoint)")
+        parser.add_argument("--max-errors", type=int, default=100, help="Abort after this many invalid rows (default 100)")
+        parser.add_argument("--dry-run", action="store_true", help="Validate the file without writing anything")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        collection = options["collection"]
+        try:
+            fmt = detect_format(path, options["format"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        checkpoint = None
+        skip = 0
+        if path != "-" and not options["dry_run"]:
+            checkpoint = options["checkpoint"] or f"{path}.checkpoint"
+        if options["resume"]:
+            if checkpoint is None:
+                raise CommandError("--resume needs a file path (stdin can't be resumed) and no --dry-run")
+            try:
+                skip = load_checkpoint(checkpoint, os.path.abspath(path), collection)
+            except ValueError as exc:
+                raise CommandError(str(exc)) from exc
+            self.stdout.write(f"Resuming after {skip} rows.")
+        elif checkpoint and os.path.exists(checkpoint):
+            raise CommandError(f"Checkpoint {checkpoint} exists from an earlier run; pass --resume or delete it")
+
+        def on_invalid(line_number, message):
+            self.stderr.write(self.style.WARNING(f"line {line_number}: {message}"))
+
+        def on_checkpoint(rows_done):
+            save_checkpoint(checkpoint, os.path.abspath(path), collection, rows_done)
+
+        started = time.monotonic()
+        try:
+            stream = sys.stdin if path == "-" else open(path, encoding="utf-8-sig", newline="")
+            try:
+                summary = import_rows(
+                    collection,
+                    read_rows(stream, fmt),
+                    batch_size=options["batch_size"],
+                    workers=options["workers"],
+                    skip=skip,
+                    merge=options["merge"],
+                    dry_run=options["dry_run"],
+                    max_errors=options["max_errors"],
+                    on_invalid=on_invalid,
+                    on_checkpoint=on_checkpoint if checkpoint else None,
+                )
+            finally:
+                if stream is not sys.stdin:
+                    stream.close()
+        except Exception as exc:
+            hint = f" Re-run with --resume to continue from {checkpoint}." if checkpoint and os.path.exists(checkpoint) else ""
+            raise CommandError(f"Failed to import {collection}: {exc}.{hint}") from exc
+
+        if checkpoint and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        elapsed = time.monotonic() - started
+        verb = "Validated" if options["dry_run"] else "Imported"
+        rate = summary["written"] / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {summary['written']} {collection} in {elapsed:.1f}s ({rate:.0f}/s); "
+            f"invalid: {summary['invalid']}, skipped: {summary['skipped']}"
+        ))
@@ -14,7 +14,8 @@ class Command(BaseCommand):
         if not uid:
             raise CommandError("UID is required")
         try:
-            role_doc = set_user_role(uid, "admin")
+            # strict: read the document back so the check below sees what Firestore stored
+            role_doc = set_user_role(uid, "admin", strict=True)
         except Exception as exc:
             raise CommandError(f"Failed to set role for UID {uid}: {exc}") from exc
 
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.firestore_client import rebuild_all_booking_stats, rebuild_booking_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-user booking counters in user_booking_stats from the bookings collection."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--uid", type=str, help="Only rebuild counters for this Firebase UID")
+        parser.add_argument("--workers", type=int, default=8, help="Users recounted in parallel (default 8)")
+
+    def handle(self, *args, **options):
+        uid = options.get("uid")
+        try:
+            if uid:
+                stats = rebuild_booking_stats(uid)
+                self.stdout.write(self.style.SUCCESS(f"Rebuilt booking stats for {uid}: {stats}"))
+                return
+            written = rebuild_all_booking_stats(workers=options["workers"])
+        except Exception as exc:
+            raise CommandError(f"Failed to rebuild booking stats: {exc}") from exc
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt booking stats for {written} users."))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.firestore_client import list_roles_map
+from core.role_claims import sync_many
+
+
+class Command(BaseCommand):
+    help = "Reconcile Firebase custom claims with the roles stored in the Firestore user_roles collection."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=8, help="Parallel Firebase Auth calls (default 8)")
+        parser.add_argument("--batch-size", type=int, default=100, help="Users per batch (default 100)")
+        parser.add_argument("--dry-run", action="store_true", help="Only count the roles that would be synced")
+
+    def handle(self, *args, **options):
+        try:
+            roles = list_roles_map(limit=1000000)
+        except Exception as exc:
+            raise CommandError(f"Failed to read user_roles: {exc}") from exc
+
+        self.stdout.write(f"Found {len(roles)} role documents.")
+        if options["dry_run"]:
+            return
+
+        summary = sync_many(roles, workers=options["workers"], batch_size=options["batch_size"])
+        for uid, err in summary["errors"].items():
+            self.stderr.write(self.style.WARNING(f"{uid}: {err}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"Claims updated: {summary['updated']}, unchanged: {summary['unchanged']}, failed: {summary['failed']}"
+        ))
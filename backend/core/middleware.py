@@ -0,0 +1,108 @@
+import gzip
+import re
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_sequence
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+_ACCEPT_ENCODING = re.compile(r"\s*([a-z*]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?")
+
+
+def _accepted_encodings(header: str) -> dict:
+    """Parse Accept-Encoding into {coding: q}."""
+    accepted = {}
+    for part in header.lower().split(","):
+        match = _ACCEPT_ENCODING.match(part)
+        if not match:
+            continue
+        try:
+            accepted[match.group(1)] = float(match.group(2)) if match.group(2) else 1.0
+        except ValueError:
+            continue
+    return accepted
+
+
+def choose_encoding(header: str, candidates=None):
+    """Return the best of `candidates` (default: "br" when available, then
+    "gzip") for an Accept-Encoding header, or None if none is acceptable."""
+    accepted = _accepted_encodings(header or "")
+    if candidates is None:
+        candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_q = None, 0.0
+    for coding in candidates:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+async def acompress_sequence(chunks, level: int = 6):
+    """Async counterpart of django.utils.text.compress_sequence: gzip an async
+    byte stream, flushing after every chunk so nothing waits in the compressor."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class APICompressionMiddleware(MiddlewareMixin):
+    """Compress API responses with brotli or gzip as negotiated by the client.
+
+    Only paths under API_COMPRESSION_PATH_PREFIX are touched (WhiteNoise already
+    serves precompressed static files), and buffered bodies smaller than
+    API_COMPRESSION_MIN_SIZE are sent as-is since compressing them costs more
+    than it saves. Streamed listings are gzipped chunk by chunk.
+    """
+
+    def process_response(self, request, response):
+        if not request.path.startswith(getattr(settings, "API_COMPRESSION_PATH_PREFIX", "/api/")):
+            return response
+        # An encoded body differs byte-for-byte, so a strong validator no longer
+        # applies. Weaken every API ETag, not just compressed ones: a 304 must
+        # repeat the validator of the 200 it stands for.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        if response.has_header("Content-Encoding") or response.status_code in (204, 304):
+            return response
+        if not response.streaming and len(response.content) < getattr(settings, "API_COMPRESSION_MIN_SIZE", 1024):
+            return response
+
+        # Whatever we decide, caches must key on Accept-Encoding
+        patch_vary_headers(response, ("Accept-Encoding",))
+        header = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if response.streaming:
+            # Streams are gzipped chunk by chunk (Django has no brotli equivalent)
+            if choose_encoding(header, ["gzip"]) is None:
+                return response
+            encoding = "gzip"
+            if getattr(response, "is_async", False):
+                response.streaming_content = acompress_sequence(response.streaming_content)
+            else:
+                response.streaming_content = compress_sequence(response.streaming_content)
+            if response.has_header("Content-Length"):
+                del response.headers["Content-Length"]
+        else:
+            encoding = choose_encoding(header)
+            if encoding is None:
+                return response
+            if encoding == "br":
+                compressed = brotli.compress(response.content, quality=getattr(settings, "API_BROTLI_QUALITY", 5))
+            else:
+                compressed = gzip.compress(response.content, compresslevel=getattr(settings, "API_GZIP_LEVEL", 6), mtime=0)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        response.headers["Content-Encoding"] = encoding
+        return response
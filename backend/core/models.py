@@ -1,3 +1,17 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+
+class FirebaseIdentity(models.Model):
+    """Maps a Firebase Auth uid to the Django user backing it."""
+
+    uid = models.CharField(max_length=128, unique=True)
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="firebase_identity")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Firebase identity"
+        verbose_name_plural = "Firebase identities"
+
+    def __str__(self):
+        return f"{self.uid} -> {self.user_id}"
@@ -0,0 +1,31 @@
+"""DRF renderer and parser backed by core.encoding (orjson when available).
+
+Drop-in replacements for rest_framework's JSONRenderer/JSONParser, enabled
+through REST_FRAMEWORK's DEFAULT_RENDERER_CLASSES/DEFAULT_PARSER_CLASSES.
+"""
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+
+from . import encoding
+
+
+class FastJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+    format = "json"
+    charset = None  # JSON is always UTF-8 (RFC 8259); same as DRF's JSONRenderer
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return encoding.dumps(data)
+
+
+class FastJSONParser(BaseParser):
+    media_type = "application/json"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return encoding.loads(stream.read())
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
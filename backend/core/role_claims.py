@@ -0,0 +1,69 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from .firestore_client import get_firebase_auth_client
+from .roles import claims_current, mark_claims_stale, mark_claims_version, new_claims_version
+
+logger = logging.getLogger(__name__)
+
+
+def build_role_claims(role, existing=None):
+    """Merge role claims into a user's existing custom claims."""
+    claims = dict(existing or {})
+    claims["role"] = role
+    claims["admin"] = role == "admin"
+    return claims
+
+
+def sync_role_claims(uid: str, role):
+    """Mirror a Firestore role into the user's Firebase custom claims.
+
+    Returns True when the claims were changed. Tokens pick the new claims up on
+    their next refresh (at most an hour), after which admin checks need no
+    Firestore read. Each push stamps a new role_version, and tokens carrying
+    an older one are checked against Firestore instead (core.roles).
+    """
+    fb_auth = get_firebase_auth_client()
+    user = fb_auth.get_user(uid)
+    current = user.custom_claims or {}
+    claims = build_role_claims(role, current)
+    if claims == current and claims_current(uid, current):
+        return False
+    version = claims["role_version"] = new_claims_version()
+    # Existing tokens stop being trusted now, whether or not the push succeeds
+    mark_claims_version(uid, version, pushed=False)
+    fb_auth.set_custom_user_claims(uid, claims)
+    mark_claims_version(uid, version, pushed=True)
+    return True
+
+
+def sync_many(roles: dict, workers: int = 8, batch_size: int = 100, dry_run: bool = False):
+    """Push claims for a uid -> role mapping in parallel batches.
+
+    Returns a summary dict with updated/unchanged/failed counts and failures.
+    """
+    summary = {"updated": 0, "unchanged": 0, "failed": 0, "errors": {}}
+    items = list(roles.items())
+
+    def _one(item):
+        uid, role = item
+        if dry_run:
+            return uid, False, None
+        try:
+            return uid, sync_role_claims(uid, role), None
+        except Exception as exc:
+            mark_claims_stale(uid)
+            return uid, False, exc
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for start in range(0, len(items), max(1, batch_size)):
+            batch = items[start:start + batch_size]
+            for uid, changed, exc in pool.map(_one, batch):
+                if exc is not None:
+                    summary["failed"] += 1
+                    summary["errors"][uid] = str(exc)
+                elif changed:
+                    summary["updated"] += 1
+                else:
+                    summary["unchanged"] += 1
+    return summary
@@ -0,0 +1,106 @@
+import secrets
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .firestore_client import get_user_role
+
+
+# Roles are cached in Django's cache framework so that, with a shared backend
+# (REDIS_URL), a role change made by one process or management command is seen
+# by every worker immediately. With the default local-memory cache the TTL
+# bounds how long other processes can serve a stale role.
+_KEY_PREFIX = "quickserve:user_role:"
+# Role claims carry a role_version (see core.role_claims). After a role change
+# the version current tokens must carry is kept here; tokens with any other
+# version fall back to user_roles.
+_CLAIMS_KEY_PREFIX = "quickserve:role_claims_version:"
+# Firebase ID tokens live an hour: once claims were pushed, tokens minted
+# before the push are all expired after this long
+_TOKEN_LIFETIME = 3600
+_NO_ROLE = ""  # cached marker for "no user_roles document"
+_REQUEST_ATTR = "_quickserve_role"
+_stats = {"hits": 0, "misses": 0, "request_hits": 0, "claim_hits": 0, "invalidations": 0}
+
+
+def _key(uid: str) -> str:
+    return f"{_KEY_PREFIX}{uid}"
+
+
+def _ttl():
+    return getattr(settings, "ROLE_CACHE_TTL", 60)
+
+
+def new_claims_version() -> str:
+    # Random rather than a timestamp: two changes in one tick must still differ
+    return secrets.token_hex(6)
+
+
+def mark_claims_version(uid: str, version, pushed: bool):
+    """Only trust role claims carrying `version` for `uid` from now on. Until
+    the claims push succeeds (pushed=False) the mark does not expire."""
+    cache.set(f"{_CLAIMS_KEY_PREFIX}{uid}", version, _TOKEN_LIFETIME if pushed else None)
+
+
+def mark_claims_stale(uid: str):
+    """Stop trusting the user's current role claims (a role was written
+    without, or failed, the claims push)."""
+    mark_claims_version(uid, new_claims_version(), pushed=False)
+
+
+def claims_current(uid: str, claims: dict) -> bool:
+    """Whether `claims` reflect the user's latest role change."""
+    version = cache.get(f"{_CLAIMS_KEY_PREFIX}{uid}")
+    return version is None or claims.get("role_version") == version
+
+
+def get_role(uid: str):
+    """Return the role string stored in `user_roles/<uid>`, or None."""
+    if not uid:
+        return None
+    cached = cache.get(_key(uid))
+    if cached is not None:
+        _stats["hits"] += 1
+        return cached or None
+    _stats["misses"] += 1
+    doc = get_user_role(uid)
+    role = (doc or {}).get("role") or None
+    cache.set(_key(uid), role or _NO_ROLE, _ttl())
+    return role
+
+
+def request_role(request):
+    """Role of the authenticated Firebase user, memoized on the request."""
+    if hasattr(request, _REQUEST_ATTR):
+        _stats["request_hits"] += 1
+        return getattr(request, _REQUEST_ATTR)
+    user = getattr(request, "user", None)
+    uid = getattr(user, "firebase_uid", None) if user and user.is_authenticated else None
+    role = None
+    if uid:
+        # Claims written by core.role_claims are trusted first; the Firestore
+        # read is a fallback for tokens that predate the sync or the user's
+        # latest role change.
+        claims = getattr(user, "firebase_claims", None) or {}
+        if getattr(settings, "ROLE_CLAIMS_TRUSTED", True) and isinstance(claims.get("role"), str) and claims_current(uid, claims):
+            role = claims["role"]
+            _stats["claim_hits"] += 1
+        else:
+            role = get_role(uid)
+    setattr(request, _REQUEST_ATTR, role)
+    return role
+
+
+def prime_role(uid: str, role):
+    """Record a role that was just written so the next read needs no Firestore call."""
+    cache.set(_key(uid), role or _NO_ROLE, _ttl())
+    _stats["invalidations"] += 1
+
+
+def invalidate_role(uid: str):
+    cache.delete(_key(uid))
+    _stats["invalidations"] += 1
+
+
+def role_cache_stats():
+    return {"ttl": _ttl(), **_stats}
@@ -0,0 +1,153 @@
+"""Single-flight coalescing for hot reads.
+
+When many callers ask for the same key at once (a cold cache after a deploy,
+a CDN expiry), only the first one runs the underlying call; the rest wait for
+it and share its result or exception. Nothing is cached once the call ends.
+"""
+import asyncio
+import functools
+import os
+import threading
+
+
+def _copy_result(value):
+    # Followers get their own containers so nobody mutates a shared result;
+    # leaf values (strings, numbers, timestamps) are immutable or treated as such
+    if isinstance(value, dict):
+        return {k: _copy_result(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_result(v) for v in value)
+    return value
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls per key across threads (sync code) and per
+    event loop (async code)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # key -> _Call
+        self._tasks = {}  # (loop id, key) -> asyncio.Task
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return _copy_result(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def ado(self, key, fn):
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        self.calls += 1
+        task = self._tasks.get(task_key)
+        leader = task is None
+        if leader:
+            # Run the call as its own task so a cancelled caller never cancels
+            # the shared call for everyone else
+            task = self._tasks[task_key] = loop.create_task(fn())
+            task.add_done_callback(functools.partial(self._task_done, task_key))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+        result = await asyncio.shield(task)
+        return result if leader else _copy_result(result)
+
+    def _task_done(self, task_key, task):
+        self._tasks.pop(task_key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+
+    def stats(self):
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "in_flight": len(self._calls) + len(self._tasks),
+        }
+
+
+# Shared by the Firestore read helpers in core.firestore_client and
+# core.firestore_async; keys include the helper's module and name.
+firestore_flight = SingleFlight()
+
+
+def _reset_after_fork():
+    # In-flight calls belong to the parent's threads; a child must not wait on them
+    firestore_flight._lock = threading.Lock()
+    firestore_flight._calls = {}
+    firestore_flight._tasks = {}
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _call_key(func, args, kwargs):
+    key = (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError as exc:
+        raise TypeError(f"{func.__qualname__}() is coalesced; its arguments must be hashable (pass tuples, not lists)") from exc
+    return key
+
+
+def coalesce(func):
+    """Decorate a read helper so concurrent identical calls share one execution.
+
+    Works for plain and async functions; arguments must be hashable. The
+    undecorated helper stays reachable as `func.__wrapped__` for callers that
+    need a read that starts after their own write.
+    """
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            return await firestore_flight.ado(_call_key(func, args, kwargs), lambda: func(*args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return firestore_flight.do(_call_key(func, args, kwargs), lambda: func(*args, **kwargs))
+    return wrapper
+
+
+def singleflight_stats():
+    return firestore_flight.stats()
@@ -0,0 +1,157 @@
+import csv
+
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
+
+from . import encoding
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+CSV_CONTENT_TYPE = "text/csv; charset=utf-8"
+
+# Items are encoded one at a time and flushed in chunks of roughly this size,
+# so memory stays bounded by one chunk plus the document being encoded.
+CHUNK_SIZE = 64 * 1024
+_DONE = object()
+
+
+def stream_format(request):
+    """Return "json" or "ndjson" when the client asked for a streamed body, else None.
+
+    Streaming is requested with `?stream=1` (JSON array), `?stream=ndjson`, or an
+    `Accept: application/x-ndjson` header.
+    """
+    accept = request.META.get("HTTP_ACCEPT", "")
+    if NDJSON_CONTENT_TYPE in accept:
+        return "ndjson"
+    flag = (request.GET.get("stream") or "").lower()
+    if flag == "ndjson":
+        return "ndjson"
+    if flag in {"1", "true", "yes", "json"}:
+        return "json"
+    return None
+
+
+def _encode(item):
+    return encoding.dumps(item).decode("utf-8")
+
+
+def json_array_chunks(items, chunk_size: int = CHUNK_SIZE):
+    """Yield a JSON array encoding of `items` as byte chunks."""
+    buf = ["["]
+    size = 1
+    first = True
+    for item in items:
+        piece = _encode(item) if first else "," + _encode(item)
+        first = False
+        buf.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield "".join(buf).encode("utf-8")
+            buf, size = [], 0
+    buf.append("]")
+    yield "".join(buf).encode("utf-8")
+
+
+def ndjson_chunks(items, chunk_size: int = CHUNK_SIZE):
+    """Yield newline-delimited JSON, one document per line, as byte chunks."""
+    buf = []
+    size = 0
+    for item in items:
+        line = _encode(item) + "\n"
+        buf.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield "".join(buf).encode("utf-8")
+            buf, size = [], 0
+    if buf:
+        yield "".join(buf).encode("utf-8")
+
+
+class _Echo:
+    # csv.writer target that hands each formatted row back instead of storing it
+    def write(self, value):
+        return value
+
+
+def csv_cell(value, escape_formulas: bool = False):
+    """A CSV cell for a document value: booleans as true/false, timestamps as
+    ISO 8601 and nested values as JSON. With `escape_formulas`, text that a
+    spreadsheet would evaluate (leading =, +, -, @) is prefixed with a quote.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        if escape_formulas and value[:1] in ("=", "+", "-", "@", "\t", "\r"):
+            return "'" + value
+        return value
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, (dict, list)):
+        return _encode(value)
+    return encoding.default(value)
+
+
+def csv_chunks(items, columns, chunk_size: int = CHUNK_SIZE, escape_formulas: bool = True):
+    """Yield a CSV encoding of `items` (a header row, then one row per item
+    with the values of `columns`) as byte chunks."""
+    writer = csv.writer(_Echo())
+    buf = [writer.writerow(columns)]
+    size = len(buf[0])
+    for item in items:
+        line = writer.writerow([csv_cell(item.get(column), escape_formulas) for column in columns])
+        buf.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield "".join(buf).encode("utf-8")
+            buf, size = [], 0
+    if buf:
+        yield "".join(buf).encode("utf-8")
+
+
+def streaming_csv_response(items, columns):
+    """Wrap an iterable of dicts in a streamed CSV body with the given columns."""
+    response = StreamingHttpResponse(csv_chunks(items, columns), content_type=CSV_CONTENT_TYPE)
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def streaming_json_response(items, fmt: str = "json"):
+    """Wrap an iterable of dicts in a StreamingHttpResponse without materializing it."""
+    if fmt == "ndjson":
+        response = StreamingHttpResponse(ndjson_chunks(items), content_type=NDJSON_CONTENT_TYPE)
+    else:
+        response = StreamingHttpResponse(json_array_chunks(items), content_type="application/json")
+    # Tell reverse proxies (nginx) not to buffer the whole body before sending it on
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def aiter_chunks(chunks):
+    """Iterate sync byte `chunks` from async code, one chunk per worker-thread hop.
+
+    Under ASGI, Django serves a sync streaming body by running
+    sync_to_async(list) over it, which holds the whole body in memory before
+    the first byte goes out. Chunks pulled through here are sent as they are
+    produced, and a client that disconnects stops the underlying reads.
+    """
+    iterator = iter(chunks)
+    next_chunk = sync_to_async(next, thread_sensitive=False)
+    try:
+        while True:
+            chunk = await next_chunk(iterator, _DONE)
+            if chunk is _DONE:
+                return
+            yield chunk
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=False)()
+
+
+def async_streaming(response):
+    """Switch a sync StreamingHttpResponse to an async body (see aiter_chunks)."""
+    if getattr(response, "streaming", False) and not response.is_async:
+        response.streaming_content = aiter_chunks(response.streaming_content)
+    return response
@@ -0,0 +1,283 @@
+"""An in-memory stand-in for the parts of the Firestore client the helpers use.
+
+Supports documents, batches (atomic, with update_time preconditions),
+get_all, transactions (applied immediately; patch firestore.transactional
+with `passthrough_transactional`), and queries with where/select/order_by/
+limit/start_after, including Firestore's rule that order_by drops documents
+missing the field. Field transforms (Increment, SERVER_TIMESTAMP) are applied.
+"""
+import functools
+import itertools
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from django.test import SimpleTestCase
+from google.api_core.exceptions import FailedPrecondition, NotFound
+
+_OPS = {
+    "==": lambda a, b: a == b,
+    "in": lambda a, b: a in b,
+    ">": lambda a, b: a is not None and a > b,
+    ">=": lambda a, b: a is not None and a >= b,
+    "<": lambda a, b: a is not None and a < b,
+    "<=": lambda a, b: a is not None and a <= b,
+}
+_MISSING = object()
+
+
+def passthrough_transactional(fn):
+    return fn
+
+
+def _apply(current: dict, data: dict) -> dict:
+    result = dict(current)
+    for key, value in data.items():
+        kind = type(value).__name__
+        if kind == "Increment":
+            result[key] = (result.get(key) or 0) + value.value
+        elif kind == "Sentinel":
+            result[key] = datetime.now(timezone.utc)
+        else:
+            result[key] = value
+    return result
+
+
+class FakeSnapshot:
+    def __init__(self, ref, data, create_time=None, update_time=None, fields=None):
+        self.reference = ref
+        self.id = ref.id
+        self.exists = data is not None
+        self.create_time = create_time
+        self.update_time = update_time
+        self._data = data
+        self._fields = fields
+
+    def to_dict(self):
+        if self._data is None:
+            return None
+        if self._fields is None:
+            return dict(self._data)
+        return {k: v for k, v in self._data.items() if k in self._fields}
+
+
+class FakeDocumentRef:
+    def __init__(self, db, collection: str, doc_id: str):
+        self._db = db
+        self.collection = collection
+        self.id = doc_id
+        self.path = f"{collection}/{doc_id}"
+        self.parent = collection
+
+    def get(self, transaction=None):
+        if transaction is not None:
+            self._db.transaction_reads.append(self)
+        entry = self._db.docs.get((self.collection, self.id))
+        if entry is None:
+            return FakeSnapshot(self, None)
+        data, created, updated = entry
+        return FakeSnapshot(self, data, created, updated)
+
+    def set(self, data, merge=False):
+        self._db._write(self, "set", data, merge=merge)
+
+    def update(self, data, option=None):
+        self._db._write(self, "update", data, option=option)
+
+    def delete(self):
+        self._db._write(self, "delete", None)
+
+
+class FakeQuery:
+    def __init__(self, db, collection, filters=(), orders=(), fields=None, limit=None, cursor=None):
+        self._db = db
+        self._collection = collection
+        self._filters = filters
+        self._orders = orders
+        self._fields = fields
+        self._limit = limit
+        self._cursor = cursor
+
+    def _copy(self, **changes):
+        state = dict(filters=self._filters, orders=self._orders, fields=self._fields, limit=self._limit, cursor=self._cursor)
+        state.update(changes)
+        return FakeQuery(self._db, self._collection, **state)
+
+    def document(self, doc_id=None):
+        return FakeDocumentRef(self._db, self._collection, doc_id or self._db.new_id())
+
+    def add(self, data):
+        ref = self.document()
+        ref.set(data)
+        return self._db.now(), ref
+
+    def where(self, field, op, value):
+        return self._copy(filters=self._filters + ((field, op, value),))
+
+    def select(self, fields):
+        return self._copy(fields=tuple(fields))
+
+    def order_by(self, field, direction="ASCENDING"):
+        return self._copy(orders=self._orders + ((field, direction),))
+
+    def limit(self, count):
+        return self._copy(limit=count)
+
+    def start_after(self, cursor):
+        return self._copy(cursor=dict(cursor))
+
+    def _value(self, doc_id, data, field):
+        return doc_id if field == "__name__" else data.get(field, _MISSING)
+
+    def _compare(self, a, b):
+        for field, direction in self._orders:
+            x, y = a[field], b[field]
+            if x != y:
+                result = -1 if x < y else 1
+                return -result if direction == "DESCENDING" else result
+        return 0
+
+    def stream(self, transaction=None):
+        rows = []
+        for (collection, doc_id), (data, created, updated) in sorted(self._db.docs.items()):
+            if collection != self._collection:
+                continue
+            if not all(_OPS[op](data.get(field), value) for field, op, value in self._filters):
+                continue
+            keys = {field: self._value(doc_id, data, field) for field, _ in self._orders}
+            if any(value is _MISSING for value in keys.values()):
+                continue  # Firestore leaves out documents without an order_by field
+            rows.append((keys, doc_id, data, created, updated))
+        rows.sort(key=functools.cmp_to_key(lambda a, b: self._compare(a[0], b[0])))
+        if self._cursor is not None:
+            cursor = {field: self._cursor.get(field) for field, _ in self._orders}
+            rows = [row for row in rows if self._compare(row[0], cursor) > 0]
+        if self._limit is not None:
+            rows = rows[:self._limit]
+        self._db.queries += 1
+        for _, doc_id, data, created, updated in rows:
+            yield FakeSnapshot(FakeDocumentRef(self._db, self._collection, doc_id), data, created, updated, self._fields)
+
+    def get(self, transaction=None):
+        return list(self.stream())
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self._db = db
+        self._ops = []
+
+    def set(self, ref, data, merge=False):
+        self._ops.append((ref, "set", data, {"merge": merge}))
+
+    def update(self, ref, data, option=None):
+        self._ops.append((ref, "update", data, {"option": option}))
+
+    def delete(self, ref):
+        self._ops.append((ref, "delete", None, {}))
+
+    def commit(self):
+        self._db.commits.append(len(self._ops))
+        error = self._db.commit_errors.pop(0) if self._db.commit_errors else None
+        if error is not None:
+            raise error
+        # All or nothing, like a real batch
+        for ref, kind, _, extra in self._ops:
+            self._db._check(ref, kind, extra.get("option"))
+        for ref, kind, data, extra in self._ops:
+            self._db._write(ref, kind, data, merge=extra.get("merge", False), checked=True)
+        return []
+
+
+class FakeTransaction:
+    def __init__(self, db):
+        self._db = db
+
+    def get(self, ref_or_query):
+        self._db.transaction_reads.append(ref_or_query)
+        if isinstance(ref_or_query, FakeDocumentRef):
+            return ref_or_query.get()
+        return ref_or_query.stream()
+
+    def set(self, ref, data, merge=False):
+        ref.set(data, merge=merge)
+
+    def update(self, ref, data):
+        ref.update(data)
+
+
+class FakeFirestore:
+    def __init__(self):
+        self.docs = {}  # (collection, id) -> (data, create_time, update_time)
+        self.commits = []  # size of every committed batch
+        self.commit_errors = []  # outcome of the next batch commits: an exception to raise, or None
+        self.get_all_calls = 0
+        self.queries = 0
+        self.transaction_reads = []
+        self._ids = itertools.count(1)
+        self._clock = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def now(self):
+        self._clock += timedelta(microseconds=1)
+        return self._clock
+
+    def new_id(self):
+        return f"auto{next(self._ids):06d}"
+
+    def collection(self, name):
+        return FakeQuery(self, name)
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+    def write_option(self, last_update_time=None):
+        return {"last_update_time": last_update_time}
+
+    def get_all(self, refs):
+        self.get_all_calls += 1
+        return [ref.get() for ref in refs]
+
+    def seed(self, collection, doc_id, data):
+        self.docs[(collection, doc_id)] = (dict(data), self.now(), self.now())
+
+    def data(self, collection, doc_id):
+        entry = self.docs.get((collection, doc_id))
+        return None if entry is None else entry[0]
+
+    def _check(self, ref, kind, option=None):
+        entry = self.docs.get((ref.collection, ref.id))
+        if kind == "update" and entry is None:
+            raise NotFound(f"No document to update: {ref.path}")
+        if option and option.get("last_update_time") is not None and entry[2] != option["last_update_time"]:
+            raise FailedPrecondition(f"{ref.path} changed since it was read")
+
+    def _write(self, ref, kind, data, merge=False, option=None, checked=False):
+        if not checked:
+            self._check(ref, kind, option)
+        key = (ref.collection, ref.id)
+        entry = self.docs.get(key)
+        if kind == "delete":
+            self.docs.pop(key, None)
+            return
+        current = entry[0] if entry and (merge or kind == "update") else {}
+        created = entry[1] if entry else self.now()
+        self.docs[key] = (_apply(current, data), created, self.now())
+
+
+class FirestoreTestCase(SimpleTestCase):
+    """Runs each test against a fresh FakeFirestore (self.db)."""
+
+    client_modules = ("core.firestore_client",)
+
+    def setUp(self):
+        super().setUp()
+        self.db = FakeFirestore()
+        for module in self.client_modules:
+            patcher = mock.patch(f"{module}.get_firestore_client", return_value=self.db)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch("firebase_admin.firestore.transactional", passthrough_transactional)
+        patcher.start()
+        self.addCleanup(patcher.stop)
@@ -0,0 +1,153 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from core import analytics
+from core.analytics import AnalyticsNotReady, BookingFrame
+
+
+def _booking(i, status="confirmed", price=100, service="s1", day="2026-03-02", created=None):
+    return {
+        "id": f"b{i}",
+        "total_price": price,
+        "status": status,
+        "service_id": service,
+        "service_title": service.upper(),
+        "booking_date": day,
+        "created_at": created or f"{day}T09:00:00.{i:06d}Z",
+    }
+
+
+BOOKINGS = [
+    _booking(1, "pending", 100, "s1", "2026-03-02"),  # Monday
+    _booking(2, "confirmed", 200, "s1", "2026-03-08"),  # Sunday, same week
+    _booking(3, "cancelled", 400, "s2", "2026-03-09"),  # next Monday
+    _booking(4, "completed", 50, "s2", "2026-04-01"),
+    _booking(5, "no-show", 10, "s3", "2026-04-01"),
+    {**_booking(6, "confirmed", "n/a", "s3"), "booking_date": None},
+]
+
+
+class BookingFrameAggregateTests(SimpleTestCase):
+    def setUp(self):
+        self.frame = BookingFrame.build(BOOKINGS)
+
+    def test_totals_exclude_cancelled_revenue_and_count_undated(self):
+        totals = self.frame.aggregate()["totals"]
+        self.assertEqual(totals, {"bookings": 6, "revenue": 360.0, "undated": 1})
+
+    def test_by_status_includes_other(self):
+        by_status = {row["status"]: row for row in self.frame.aggregate()["by_status"]}
+        self.assertEqual(by_status["cancelled"], {"status": "cancelled", "bookings": 1, "revenue": 0.0})
+        self.assertEqual(by_status["confirmed"]["bookings"], 2)
+        self.assertEqual(by_status["other"], {"status": "other", "bookings": 1, "revenue": 10.0})
+
+    def test_by_service_ranked_by_revenue_and_limited_by_top(self):
+        by_service = self.frame.aggregate(top=2)["by_service"]
+        self.assertEqual([row["service_id"] for row in by_service], ["s1", "s2"])
+        self.assertEqual(by_service[0], {"service_id": "s1", "service_title": "S1", "bookings": 2, "revenue": 300.0})
+
+    def test_day_series_fills_gaps(self):
+        series = self.frame.aggregate(date_to="2026-03-04")["series"]
+        self.assertEqual([row["period"] for row in series], ["2026-03-02"])
+        series = self.frame.aggregate(date_from="2026-03-07", date_to="2026-03-09")["series"]
+        self.assertEqual(
+            [(row["period"], row["bookings"]) for row in series],
+            [("2026-03-08", 1), ("2026-03-09", 1)],
+        )
+
+    def test_week_buckets_start_on_monday(self):
+        series = self.frame.aggregate(bucket="week", date_to="2026-03-31")["series"]
+        self.assertEqual(
+            [(row["period"], row["bookings"], row["revenue"]) for row in series],
+            [("2026-03-02", 2, 300.0), ("2026-03-09", 1, 0.0)],
+        )
+
+    def test_month_buckets(self):
+        series = self.frame.aggregate(bucket="month")["series"]
+        self.assertEqual([(row["period"], row["bookings"]) for row in series], [("2026-03", 3), ("2026-04", 2)])
+
+    def test_status_and_service_filters(self):
+        result = self.frame.aggregate(statuses=("pending", "confirmed"), service_id="s1")
+        self.assertEqual(result["totals"]["bookings"], 2)
+        self.assertEqual(self.frame.aggregate(service_id="unknown")["totals"]["bookings"], 0)
+
+    def test_created_at_date_field(self):
+        result = self.frame.aggregate(date_field="created_at", date_from="2026-04-01")
+        self.assertEqual(result["totals"]["bookings"], 2)
+
+    def test_extend_skips_rows_at_the_watermark(self):
+        newest = self.frame.newest
+        again = [b for b in BOOKINGS if b["created_at"] == newest]
+        extended = self.frame.extend(again + [_booking(7, created="2026-05-01T00:00:00Z")])
+        self.assertEqual(len(extended), len(BOOKINGS) + 1)
+        self.assertEqual(extended.newest, "2026-05-01T00:00:00Z")
+
+
+@override_settings(ANALYTICS_REFRESH=60, ANALYTICS_FULL_REFRESH=900)
+class BookingAnalyticsLoadingTests(SimpleTestCase):
+    def setUp(self):
+        for name, value in (("_frame", None), ("_loading", None), ("_failed_at", None)):
+            patcher = mock.patch.object(analytics, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        analytics._results.clear()
+
+    def _wait(self):
+        thread = analytics._loading
+        if thread is not None:
+            thread.join(5)
+
+    def test_first_request_starts_a_background_load_and_is_told_to_retry(self):
+        with mock.patch.object(analytics, "_load_full", return_value=BookingFrame.build(BOOKINGS)) as load:
+            with self.assertRaises(AnalyticsNotReady) as raised:
+                analytics.booking_analytics()
+            self.assertEqual(raised.exception.retry_after, analytics.RETRY_AFTER)
+            self._wait()
+            self.assertEqual(analytics.booking_analytics()["totals"]["bookings"], 6)
+        load.assert_called_once()
+
+    def test_failed_load_is_not_retried_immediately(self):
+        with mock.patch.object(analytics, "_load_full", side_effect=RuntimeError("boom")) as load:
+            with self.assertLogs("core.analytics", "WARNING"):
+                with self.assertRaises(AnalyticsNotReady):
+                    analytics.booking_analytics()
+                self._wait()
+            with self.assertRaises(AnalyticsNotReady):
+                analytics.booking_analytics()
+            self._wait()
+        load.assert_called_once()
+
+    def test_forced_refresh_is_rate_limited(self):
+        analytics._frame = BookingFrame.build(BOOKINGS)
+        with mock.patch.object(analytics, "_load_full", return_value=BookingFrame.build(BOOKINGS)) as load:
+            self.assertFalse(analytics.request_full_refresh())
+            analytics._frame.full_loaded_at -= 61
+            self.assertTrue(analytics.request_full_refresh())
+            self._wait()
+        load.assert_called_once()
+
+    def _aged_frame(self, seconds):
+        frame = BookingFrame.build(BOOKINGS)
+        frame.loaded_at -= seconds
+        frame.full_loaded_at -= seconds
+        analytics._frame = frame
+
+    @override_settings(ANALYTICS_FULL_REFRESH=0)
+    def test_periodic_full_reloads_are_off_by_default(self):
+        self._aged_frame(86400)
+        with mock.patch.object(analytics, "_load_full") as full, \
+                mock.patch.object(analytics, "_load_new", return_value=BookingFrame.build(BOOKINGS)) as new:
+            analytics.booking_analytics()
+            self._wait()
+        full.assert_not_called()
+        new.assert_called_once()
+
+    def test_periodic_full_reload_when_configured(self):
+        self._aged_frame(901)
+        with mock.patch.object(analytics, "_load_full", return_value=BookingFrame.build(BOOKINGS)) as full, \
+                mock.patch.object(analytics, "_load_new") as new:
+            analytics.booking_analytics()
+            self._wait()
+        full.assert_called_once()
+        new.assert_not_called()
@@ -0,0 +1,27 @@
+from django.test import SimpleTestCase
+
+from core.apps import is_server_process
+
+
+class ServerProcessTests(SimpleTestCase):
+    def test_server_processes(self):
+        for argv, environ in (
+            (["manage.py", "runserver"], {"RUN_MAIN": "true"}),
+            (["manage.py", "runserver", "--noreload"], {}),
+            (["/venv/bin/uvicorn", "backend.asgi:application"], {}),
+            (["/venv/lib/python3.12/site-packages/uvicorn/__main__.py", "backend.asgi:application"], {}),
+            (["/venv/bin/daphne", "backend.asgi:application"], {}),
+        ):
+            with self.subTest(argv=argv):
+                self.assertTrue(is_server_process(argv, environ))
+
+    def test_commands_and_forking_masters_do_not_warm_up(self):
+        for argv in (
+            ["manage.py", "migrate"],
+            ["manage.py", "shell"],
+            ["manage.py", "runserver"],  # autoreloader parent
+            ["/venv/bin/gunicorn", "backend.wsgi", "--preload"],
+            [],
+        ):
+            with self.subTest(argv=argv):
+                self.assertFalse(is_server_process(argv, {}))
@@ -0,0 +1,68 @@
+import asyncio
+import gzip
+import threading
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from core import async_views
+from core.middleware import acompress_sequence
+from core.streaming import aiter_chunks, async_streaming
+
+
+class AsyncStreamingTests(SimpleTestCase):
+    def test_chunks_are_pulled_one_at_a_time(self):
+        produced = []
+
+        def chunks():
+            for i in range(3):
+                produced.append(i)
+                yield b"x%d" % i
+
+        async def first_chunk():
+            stream = aiter_chunks(chunks())
+            chunk = await stream.__anext__()
+            seen = list(produced)
+            await stream.aclose()
+            return chunk, seen
+
+        self.assertEqual(asyncio.run(first_chunk()), (b"x0", [0]))
+
+    def test_sync_streaming_response_becomes_async(self):
+        response = async_streaming(StreamingHttpResponse(iter([b"a", b"b"])))
+        self.assertTrue(response.is_async)
+
+        async def body():
+            return [chunk async for chunk in response]
+
+        self.assertEqual(asyncio.run(body()), [b"a", b"b"])
+        plain = HttpResponse(b"{}")
+        self.assertIs(async_streaming(plain), plain)
+
+    def test_async_gzip_round_trips(self):
+        async def source():
+            for chunk in (b"[1,", b"2,", b"3]"):
+                yield chunk
+
+        async def compressed():
+            return b"".join([chunk async for chunk in acompress_sequence(source())])
+
+        self.assertEqual(gzip.decompress(asyncio.run(compressed())), b"[1,2,3]")
+
+
+class DelegateTests(SimpleTestCase):
+    def test_delegated_views_run_concurrently(self):
+        # Both calls must be inside the view at the same time; on the shared
+        # thread-sensitive executor the second would wait for the first
+        barrier = threading.Barrier(2, timeout=2)
+
+        def view(request):
+            barrier.wait()
+            return StreamingHttpResponse(iter([b"ok"]))
+
+        async def run():
+            request = RequestFactory().get("/api/admin/bookings/?stream=1")
+            return await asyncio.gather(async_views._delegate(view)(request), async_views._delegate(view)(request))
+
+        responses = asyncio.run(run())
+        self.assertTrue(all(response.is_async for response in responses))
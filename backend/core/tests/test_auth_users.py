@@ -0,0 +1,66 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from core import firestore_client
+
+
+def _user(uid):
+    return SimpleNamespace(uid=uid, email=f"{uid}@example.com", display_name=uid, user_metadata=SimpleNamespace(creation_timestamp=None))
+
+
+class FakeAuth:
+    """list_users over `total` users; `gate` (if set) holds every call after the first."""
+
+    def __init__(self, total, gate=None):
+        self.users = [_user(f"u{i}") for i in range(total)]
+        self.calls = []
+        self.gate = gate
+
+    def list_users(self, page_token=None, max_results=1000):
+        self.calls.append(page_token)
+        if self.gate is not None and page_token is not None:
+            self.gate.wait(5)
+        start = int(page_token or 0)
+        end = start + max_results
+        return SimpleNamespace(users=self.users[start:end], next_page_token=str(end) if end < len(self.users) else None)
+
+
+class IterAuthUserPagesTests(SimpleTestCase):
+    def _patch(self, auth):
+        patcher = mock.patch.object(firestore_client, "get_firebase_auth_client", return_value=auth)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_walks_every_page(self):
+        auth = FakeAuth(5)
+        self._patch(auth)
+        pages = list(firestore_client.iter_auth_user_pages(page_size=2))
+        self.assertEqual([len(records) for records, _ in pages], [2, 2, 1])
+        self.assertEqual([token for _, token in pages], ["2", "4", None])
+
+    def test_no_prefetch_once_the_limit_is_covered(self):
+        auth = FakeAuth(10)
+        self._patch(auth)
+        users = list(firestore_client.iter_auth_users(limit=3))
+        self.assertEqual([u["id"] for u in users], ["u0", "u1", "u2"])
+        self.assertEqual(auth.calls, [None])
+
+        auth.calls.clear()
+        pages = list(firestore_client.iter_auth_user_pages(page_size=2, limit=3))
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(auth.calls, [None, "2"])
+
+    def test_early_exit_does_not_wait_for_the_prefetch(self):
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        auth = FakeAuth(10, gate=gate)
+        self._patch(auth)
+        pages = firestore_client.iter_auth_user_pages(page_size=2)
+        next(pages)
+        started = time.monotonic()
+        pages.close()
+        self.assertLess(time.monotonic() - started, 1)
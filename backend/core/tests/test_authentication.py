@@ -0,0 +1,42 @@
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from core import authentication
+
+
+@mock.patch("firebase_admin.auth.verify_id_token")
+class VerifyIdTokenCachedTests(SimpleTestCase):
+    def setUp(self):
+        authentication._token_cache.clear()
+        self.addCleanup(authentication._token_cache.clear)
+
+    def _claims(self):
+        return {"uid": "u1", "exp": time.time() + 3600}
+
+    @override_settings(FIREBASE_CHECK_REVOKED=False)
+    def test_caches_until_expiry(self, verify):
+        verify.return_value = self._claims()
+        authentication.verify_id_token_cached("token")
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 3000):
+            authentication.verify_id_token_cached("token")
+        verify.assert_called_once_with("token", check_revoked=False)
+
+    @override_settings(FIREBASE_CHECK_REVOKED=True, FIREBASE_REVOKED_TOKEN_CACHE_TTL=60)
+    def test_revocation_checks_use_a_short_ttl(self, verify):
+        verify.return_value = self._claims()
+        authentication.verify_id_token_cached("token")
+        authentication.verify_id_token_cached("token")
+        self.assertEqual(verify.call_count, 1)
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+            authentication.verify_id_token_cached("token")
+        self.assertEqual(verify.call_count, 2)
+        verify.assert_called_with("token", check_revoked=True)
+
+    @override_settings(FIREBASE_CHECK_REVOKED=True, FIREBASE_REVOKED_TOKEN_CACHE_TTL=0)
+    def test_zero_ttl_checks_every_request(self, verify):
+        verify.return_value = self._claims()
+        authentication.verify_id_token_cached("token")
+        authentication.verify_id_token_cached("token")
+        self.assertEqual(verify.call_count, 2)
@@ -0,0 +1,60 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import views
+from core.firestore_client import GET_ALL_CHUNK_SIZE, get_bookings
+from core.tests.fakes import FirestoreTestCase
+
+
+class GetManyTests(FirestoreTestCase):
+    def test_chunks_ids_and_returns_only_existing_documents(self):
+        for i in range(0, 250, 2):
+            self.db.seed("bookings", f"b{i:03d}", {"status": "pending"})
+        ids = [f"b{i:03d}" for i in range(250)] + ["b000", "", "a/b", None]
+
+        found = get_bookings(ids)
+
+        self.assertEqual(self.db.get_all_calls, -(-250 // GET_ALL_CHUNK_SIZE))
+        self.assertEqual(sorted(found), [f"b{i:03d}" for i in range(0, 250, 2)])
+        self.assertEqual(found["b010"], {"status": "pending", "id": "b010"})
+
+
+@override_settings(CATALOG_MIRROR=False)
+class BatchViewTests(FirestoreTestCase):
+    def _get(self, view, query, admin=False):
+        request = APIRequestFactory().get(f"/api/batch/{query}")
+        force_authenticate(request, user=User(username="ana"))
+        with mock.patch.object(views, "_is_request_admin", return_value=admin):
+            return view(request)
+
+    def test_services_in_request_order_with_missing_ids(self):
+        self.db.seed("services", "s1", {"title": "One"})
+        self.db.seed("services", "s2", {"title": "Two"})
+
+        response = self._get(views.services_batch, "?ids=s2,missing,s1&ids=s2")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["id"] for item in response.data["results"]], ["s2", "s1"])
+        self.assertEqual(response.data["missing"], ["missing"])
+        self.assertEqual(self.db.get_all_calls, 1)
+
+    def test_ids_are_required_and_bounded(self):
+        self.assertEqual(self._get(views.services_batch, "").status_code, 400)
+        too_many = ",".join(f"s{i}" for i in range(views.MAX_BATCH_IDS + 1))
+        self.assertEqual(self._get(views.services_batch, f"?ids={too_many}").status_code, 400)
+
+    def test_admin_profiles_batch_joins_roles(self):
+        self.db.seed("user_profiles", "u1", {"name": "Ana"})
+        self.db.seed("user_profiles", "u2", {"name": "Ben"})
+        self.db.seed("user_roles", "u1", {"role": "admin"})
+
+        response = self._get(views.admin_profiles_batch, "?ids=u2,u1,u3", admin=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(p["id"], p["roles"]) for p in response.data["results"]], [("u2", []), ("u1", ["admin"])])
+        self.assertEqual(response.data["missing"], ["u3"])
+        self.assertEqual(self.db.get_all_calls, 2)  # one for profiles, one for roles
+        self.assertEqual(self._get(views.admin_profiles_batch, "?ids=u1").status_code, 403)
@@ -0,0 +1,96 @@
+import itertools
+import json
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import views
+from core.exports import booking_filters
+from core.firestore_client import BOOKING_SORTS
+from core.tests.fakes import FirestoreTestCase
+
+
+class BookingFilterParamsTests(SimpleTestCase):
+    def test_filters_and_default_sorts(self):
+        self.assertEqual(booking_filters({}), ((), "-created_at"))
+        self.assertEqual(
+            booking_filters({"status": "pending", "service_id": "s1", "booking_date": "2026-03-02"}),
+            ((("status", "==", "pending"), ("service_id", "==", "s1"), ("booking_date", "==", "2026-03-02")), "-created_at"),
+        )
+        self.assertEqual(booking_filters({"status": "pending, confirmed,pending"})[0], (("status", "in", ("pending", "confirmed")),))
+        # A range must be the first sort key, so it defaults to sorting by booking_date
+        self.assertEqual(
+            booking_filters({"booking_date_from": "2026-03-01", "booking_date_to": "2026-03-31"}),
+            ((("booking_date", ">=", "2026-03-01"), ("booking_date", "<=", "2026-03-31")), "booking_date"),
+        )
+
+    def test_bad_input_raises_value_error(self):
+        for params in (
+            {"status": "lost"},
+            {"booking_date": "tomorrow"},
+            {"booking_date": "2026-03-02", "booking_date_from": "2026-03-01"},
+            {"booking_date_from": "2026-03-01", "sort": "-created_at"},
+            {"sort": "price"},
+        ):
+            with self.subTest(params=params), self.assertRaises(ValueError):
+                booking_filters(params)
+
+    def test_every_filter_and_sort_combination_has_a_composite_index(self):
+        path = Path(settings.BASE_DIR).parent / "firestore.indexes.json"
+        indexes = {
+            tuple((field["fieldPath"], field["order"]) for field in index["fields"])
+            for index in json.loads(path.read_text())["indexes"]
+            if index["collectionGroup"] == "bookings"
+        }
+        choices = {
+            "status": (None, "pending", "pending,confirmed"),
+            "service_id": (None, "s1"),
+            "user_id": (None, "u1"),
+            "booking_date": (None, "2026-03-02"),
+            "booking_date_from": (None, "2026-03-01"),
+        }
+        for values in itertools.product(*choices.values()):
+            for sort in BOOKING_SORTS:
+                params = {k: v for k, v in zip(choices, values) if v is not None}
+                params["sort"] = sort
+                try:
+                    filters, sort = booking_filters(params)
+                except ValueError:
+                    continue
+                order_field, direction = BOOKING_SORTS[sort]
+                # Equality filters are merged from one (field, sort field) index each
+                for field, op, _ in filters:
+                    if field != order_field:
+                        with self.subTest(params=params, field=field):
+                            self.assertIn(((field, "ASCENDING"), (order_field, direction)), indexes)
+
+
+class AdminBookingsFilterTests(FirestoreTestCase):
+    def _get(self, query):
+        request = APIRequestFactory().get(f"/api/admin/bookings/{query}")
+        force_authenticate(request, user=User(username="admin"))
+        with mock.patch.object(views, "_is_request_admin", return_value=True):
+            return views.admin_bookings(request)
+
+    def test_pending_bookings_for_a_day_newest_first(self):
+        rows = [
+            ("b1", "pending", "2026-03-02", "01"), ("b2", "confirmed", "2026-03-02", "02"),
+            ("b3", "pending", "2026-03-03", "03"), ("b4", "pending", "2026-03-02", "04"),
+        ]
+        for doc_id, status, day, minute in rows:
+            self.db.seed("bookings", doc_id, {"status": status, "booking_date": day, "created_at": f"2026-03-01T00:{minute}:00Z"})
+
+        response = self._get("?status=pending&booking_date=2026-03-02")
+        self.assertEqual([b["id"] for b in response.data], ["b4", "b1"])
+
+        response = self._get("?booking_date_from=2026-03-02&booking_date_to=2026-03-03&sort=-booking_date&page_size=2")
+        self.assertEqual([b["id"] for b in response.data["results"]], ["b3", "b4"])
+        self.assertIsNotNone(response.data["next_page_token"])
+
+    def test_bad_filters_are_bad_requests(self):
+        self.assertEqual(self._get("?status=lost").status_code, 400)
+        self.assertEqual(self._get("?booking_date_from=2026-03-01&sort=created_at").status_code, 400)
@@ -0,0 +1,78 @@
+from firebase_admin import firestore
+
+from core import firestore_client as fc
+from core.tests.fakes import FakeDocumentRef, FirestoreTestCase
+
+
+def _increments(delta):
+    return {k: v.value for k, v in delta.items() if k != "updated_at"}
+
+
+class StatsDeltaTests(FirestoreTestCase):
+    def test_create_counts_total_and_new_status(self):
+        self.assertEqual(_increments(fc._stats_delta(None, "pending", firestore)), {"total": 1, "pending": 1})
+
+    def test_update_moves_between_buckets(self):
+        delta = fc._stats_delta("pending", "confirmed", firestore, count_total=False)
+        self.assertEqual(_increments(delta), {"pending": -1, "confirmed": 1})
+
+    def test_leaving_the_tracked_statuses_only_decrements(self):
+        delta = fc._stats_delta("confirmed", None, firestore, count_total=False)
+        self.assertEqual(_increments(delta), {"confirmed": -1})
+
+    def test_untracked_statuses_are_ignored(self):
+        self.assertEqual(_increments(fc._stats_delta("archived", "weird", firestore, count_total=False)), {})
+
+
+class BookingStatsTests(FirestoreTestCase):
+    def _stats_doc(self, uid):
+        return self.db.data("user_booking_stats", uid)
+
+    def test_increments_before_first_count_are_not_trusted(self):
+        # A pre-existing user: bookings exist but no counters document
+        self.db.seed("bookings", "old1", {"user_id": "u1", "status": "completed"})
+        self.db.seed("bookings", "old2", {"user_id": "u1", "status": "pending"})
+        created = fc.create_booking({"user_id": "u1", "status": "pending"})
+
+        self.assertEqual(self._stats_doc("u1")["total"], 1)  # partial document
+        self.assertIsNone(fc.get_booking_stats("u1"))
+
+        stats = fc.rebuild_booking_stats("u1")
+        self.assertEqual(stats, {"total": 3, "pending": 2, "confirmed": 0, "completed": 1, "cancelled": 0})
+        self.assertTrue(self._stats_doc("u1")["initialized"])
+        self.assertEqual(fc.get_booking_stats("u1"), stats)
+
+        fc.update_booking(created["id"], {"status": "cancelled"})
+        self.assertEqual(fc.get_booking_stats("u1"), {"total": 3, "pending": 1, "confirmed": 0, "completed": 1, "cancelled": 1})
+
+    def test_rebuild_reads_counters_before_counting(self):
+        # Reading the counters document first puts it in the transaction's read
+        # set, so a concurrent increment can't be overwritten by the count
+        fc.rebuild_booking_stats("u1")
+        reads = self.db.transaction_reads
+        self.assertIsInstance(reads[0], FakeDocumentRef)
+        self.assertEqual(reads[0].path, "user_booking_stats/u1")
+        self.assertEqual(len(reads), 2)
+
+    def test_create_then_update_keeps_counts_exact(self):
+        fc.rebuild_booking_stats("u1")
+        booking = fc.create_booking({"user_id": "u1", "status": "pending"})
+        fc.update_booking(booking["id"], {"status": "confirmed"})
+        fc.update_booking(booking["id"], {"address": "elsewhere"})
+        self.assertEqual(fc.get_booking_stats("u1"), {"total": 1, "pending": 0, "confirmed": 1, "completed": 0, "cancelled": 0})
+
+    def test_bulk_status_changes_move_counts(self):
+        fc.rebuild_booking_stats("u1")
+        ids = [fc.create_booking({"user_id": "u1", "status": "pending"})["id"] for _ in range(3)]
+        results = fc.bulk_update_bookings({i: {"status": "completed"} for i in ids[:2]})
+        self.assertEqual(results, {ids[0]: None, ids[1]: None})
+        self.assertEqual(fc.get_booking_stats("u1"), {"total": 3, "pending": 1, "confirmed": 0, "completed": 2, "cancelled": 0})
+
+    def test_rebuild_all_recounts_every_user(self):
+        self.db.seed("bookings", "a", {"user_id": "u1", "status": "pending"})
+        self.db.seed("bookings", "b", {"user_id": "u2", "status": "cancelled"})
+        self.db.seed("bookings", "c", {"status": "pending"})
+        self.db.seed("user_booking_stats", "u2", {"total": 5, "cancelled": -2})  # stale partial doc
+        self.assertEqual(fc.rebuild_all_booking_stats(workers=2), 2)
+        self.assertEqual(fc.get_booking_stats("u1")["pending"], 1)
+        self.assertEqual(fc.get_booking_stats("u2"), {"total": 1, "pending": 0, "confirmed": 0, "completed": 0, "cancelled": 1})
@@ -0,0 +1,50 @@
+from unittest import mock
+
+from rest_framework.test import APIRequestFactory
+
+from core import catalog, views
+from core.catalog_mirror import categories_mirror, services_mirror
+from core.tests.fakes import FirestoreTestCase
+
+
+class BootstrapTests(FirestoreTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch("core.catalog.ensure_catalog_mirror")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        catalog.invalidate_catalog()
+        self.addCleanup(catalog.invalidate_catalog)
+        self.db.seed("services", "s1", {"title": "Plumbing", "is_active": True})
+        self.db.seed("services", "s2", {"title": "Retired", "is_active": False})
+        self.db.seed("categories", "c1", {"name": "Home"})
+
+    def _get(self):
+        return views.bootstrap(APIRequestFactory().get("/api/bootstrap/"))
+
+    def _mirror(self, mirror, docs):
+        mirror._docs = {doc["id"]: doc for doc in docs}
+        mirror._ordered = None
+        self.addCleanup(setattr, mirror, "_docs", {})
+        self.addCleanup(setattr, mirror, "_ordered", [])
+        for name, value in (("_ready", True), ("_watch", object())):
+            patcher = mock.patch.object(mirror, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_mirrored_sources_skip_the_fanout_pool(self):
+        self._mirror(services_mirror, [{"id": "s1", "title": "Plumbing"}])
+        self._mirror(categories_mirror, [{"id": "c1", "name": "Home"}])
+        with mock.patch.object(views, "gather") as gather:
+            response = self._get()
+        gather.assert_not_called()
+        self.assertEqual([s["id"] for s in response.data["services"]], ["s1"])
+        self.assertEqual([c["id"] for c in response.data["categories"]], ["c1"])
+
+    def test_only_unmirrored_sources_are_fanned_out(self):
+        self._mirror(categories_mirror, [{"id": "c1", "name": "Home"}])
+        with mock.patch.object(views, "gather", wraps=views.gather) as gather:
+            response = self._get()
+        self.assertEqual(list(gather.call_args.args[0]), ["services"])
+        self.assertEqual([s["id"] for s in response.data["services"]], ["s1"])
+        self.assertEqual([c["id"] for c in response.data["categories"]], ["c1"])
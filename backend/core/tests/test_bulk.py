@@ -0,0 +1,128 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from google.api_core.exceptions import Aborted
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import views
+
+from core.firestore_client import (
+    MAX_BATCH_WRITES,
+    bulk_set_user_roles,
+    bulk_update_bookings,
+    bulk_write_services,
+    get_booking_stats,
+    rebuild_booking_stats,
+)
+from core.tests.fakes import FirestoreTestCase
+
+
+class BulkViewValidationTests(FirestoreTestCase):
+    def _post(self, view, data):
+        request = APIRequestFactory().post("/api/admin/bulk/", data, format="json")
+        force_authenticate(request, user=User(username="admin"))
+        with mock.patch.object(views, "_is_request_admin", return_value=True):
+            return view(request)
+
+    def test_non_object_update_is_a_bad_request(self):
+        self.db.seed("bookings", "b002", {"user_id": "u1", "status": "pending"})
+
+        for view in (views.admin_bookings_bulk, views.admin_services_bulk):
+            response = self._post(view, {"operations": [{"id": "b002", "op": "update", "update": "notadict"}]})
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("b002", response.data["detail"])
+        self.assertEqual(self.db.commits, [])
+
+    def test_non_object_operation_is_a_bad_request(self):
+        response = self._post(views.admin_bookings_bulk, {"operations": ["b002"]})
+
+        self.assertEqual(response.status_code, 400)
+
+
+class BulkWriteServicesTests(FirestoreTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(1001):
+            self.db.seed("services", f"s{i:04d}", {"title": f"Service {i}", "price": 10})
+        patcher = mock.patch("core.catalog.invalidate_catalog")
+        self.invalidate = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _operations(self):
+        ops = [("update", f"s{i:04d}", {"price": 20}) for i in range(1000)]
+        return ops + [("delete", "s1000", None), ("update", "missing", {"price": 1})]
+
+    def test_writes_in_chunks_of_max_batch_writes(self):
+        results = bulk_write_services(self._operations())
+
+        self.assertEqual(self.db.commits, [MAX_BATCH_WRITES, MAX_BATCH_WRITES, 1])
+        self.assertEqual(results["missing"], "not_found")
+        self.assertEqual(sum(outcome is None for outcome in results.values()), 1001)
+        self.assertEqual(self.db.data("services", "s0999")["price"], 20)
+        self.assertIsNone(self.db.data("services", "s1000"))
+        self.invalidate.assert_called_once()
+
+    def test_failed_batch_is_reported_per_item_and_leaves_its_chunk_untouched(self):
+        self.db.commit_errors = [None, Aborted("contention")]
+
+        results = bulk_write_services(self._operations())
+
+        self.assertEqual({results[f"s{i:04d}"] for i in range(500, 1000)}, {"error: Aborted"})
+        self.assertEqual({results[f"s{i:04d}"] for i in range(500)}, {None})
+        self.assertIsNone(results["s1000"])
+        self.assertEqual(self.db.data("services", "s0499")["price"], 20)
+        self.assertEqual(self.db.data("services", "s0500")["price"], 10)
+
+
+class BulkUpdateBookingsTests(FirestoreTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(300):
+            self.db.seed("bookings", f"b{i:03d}", {"user_id": f"u{i % 2}", "status": "pending"})
+        for uid in ("u0", "u1"):
+            rebuild_booking_stats(uid)
+        self.db.commits.clear()
+
+    def test_chunks_leave_room_for_the_stats_writes(self):
+        updates = {f"b{i:03d}": {"status": "confirmed"} for i in range(300)}
+        updates["missing"] = {"status": "confirmed"}
+        updates["bad/id"] = {"status": "confirmed"}
+
+        results = bulk_update_bookings(updates)
+
+        # 250 bookings + 2 stats docs, then 50 + 2
+        self.assertEqual(self.db.commits, [252, 52])
+        self.assertEqual(results["missing"], "not_found")
+        self.assertEqual(results["bad/id"], "not_found")
+        self.assertEqual(sum(outcome is None for outcome in results.values()), 300)
+        self.assertEqual(get_booking_stats("u0")["confirmed"], 150)
+        self.assertEqual(get_booking_stats("u0")["pending"], 0)
+
+    def test_failed_batch_falls_back_to_one_transaction_per_booking(self):
+        self.db.commit_errors = [Aborted("conflict")]
+        updates = {f"b{i:03d}": {"status": "cancelled"} for i in range(300)}
+
+        results = bulk_update_bookings(updates)
+
+        self.assertEqual(set(results.values()), {None})
+        self.assertEqual(self.db.data("bookings", "b000")["status"], "cancelled")
+        self.assertEqual(get_booking_stats("u1")["cancelled"], 150)
+        self.assertEqual(get_booking_stats("u1")["pending"], 0)
+
+
+class BulkSetUserRolesTests(FirestoreTestCase):
+    def test_failed_chunk_is_reported_and_not_cached(self):
+        roles = {f"u{i:03d}": "admin" for i in range(501)}
+        roles["bad/uid"] = "admin"
+        self.db.commit_errors = [Aborted("contention")]
+
+        with mock.patch("core.roles.prime_role") as prime:
+            results, claim_errors = bulk_set_user_roles(roles, sync_claims=False)
+
+        self.assertEqual(self.db.commits, [500, 1])
+        self.assertEqual({results[f"u{i:03d}"] for i in range(500)}, {"error: Aborted"})
+        self.assertIsNone(results["u500"])
+        self.assertEqual(results["bad/uid"], "not_found")
+        self.assertEqual(claim_errors, {})
+        prime.assert_called_once_with("u500", "admin")
+        self.assertIsNone(self.db.data("user_roles", "u000"))
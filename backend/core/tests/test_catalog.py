@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import SimpleTestCase
+
+from core import catalog
+from core.singleflight import firestore_flight
+
+
+class ReadThroughTests(SimpleTestCase):
+    def setUp(self):
+        catalog.invalidate_catalog()
+        self.addCleanup(catalog.invalidate_catalog)
+
+    def test_concurrent_misses_load_once(self):
+        calls = []
+        release = threading.Event()
+
+        def loader():
+            calls.append(1)
+            release.wait(5)
+            return [{"id": "s1"}]
+
+        with ThreadPoolExecutor(8) as pool:
+            futures = [pool.submit(catalog._read_through, ("services", 50, None), loader) for _ in range(8)]
+            while not calls:
+                time.sleep(0.001)
+            time.sleep(0.05)  # let the other callers join the flight
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [[{"id": "s1"}]] * 8)
+        self.assertEqual(firestore_flight.stats()["in_flight"], 0)
+        # Cached now
+        self.assertEqual(catalog._read_through(("services", 50, None), lambda: self.fail("loaded twice")), [{"id": "s1"}])
+
+    def test_async_misses_load_once(self):
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return None
+
+        async def run():
+            return await asyncio.gather(*(catalog._read_through_async(("service", "gone"), loader) for _ in range(5)))
+
+        self.assertEqual(asyncio.run(run()), [None] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(catalog._read_through(("service", "gone"), lambda: self.fail("miss not cached")))
+
+    def test_load_during_invalidation_is_not_cached(self):
+        def loader():
+            catalog.invalidate_catalog()
+            return [{"id": "stale"}]
+
+        self.assertEqual(catalog._read_through(("categories", 200), loader), [{"id": "stale"}])
+        self.assertEqual(catalog._read_through(("categories", 200), lambda: [{"id": "fresh"}]), [{"id": "fresh"}])
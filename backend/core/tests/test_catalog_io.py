@@ -0,0 +1,146 @@
+import io
+from unittest import mock
+
+from django.test import SimpleTestCase
+from google.api_core.exceptions import PermissionDenied, ServiceUnavailable
+
+from core.catalog_io import clean_row, export_rows, import_rows, read_rows
+from core.tests.fakes import FirestoreTestCase
+
+
+class CleanRowTests(SimpleTestCase):
+    def test_service_values_are_normalized(self):
+        doc_id, data = clean_row("services", {
+            "id": " s1 ", "title": " Plumbing ", "price": "12.50", "duration": 60,
+            "is_active": "no", "category": "", "unknown": "dropped",
+        })
+        self.assertEqual(doc_id, "s1")
+        self.assertEqual(data, {"title": "Plumbing", "price": 12.5, "duration": "60", "is_active": False})
+        self.assertEqual(clean_row("services", '{"title": "A", "price": "10"}')[1], {"title": "A", "price": 10, "is_active": True})
+
+    def test_invalid_rows(self):
+        cases = {
+            "'title' is required": {"price": 1},
+            "'price' is required": {"title": "A"},
+            "'price' must be a non-negative number": {"title": "A", "price": -1},
+            "'price' must be a number, got 'ten'": {"title": "A", "price": "ten"},
+            "'is_active' must be true or false": {"title": "A", "price": 1, "is_active": "maybe"},
+            "'title' must be a string": {"title": ["A"], "price": 1},
+            "Invalid document id 'a/b'": {"id": "a/b", "title": "A", "price": 1},
+            "Row must be a JSON object": "[1, 2]",
+            "Invalid JSON": "{not json",
+        }
+        for message, raw in cases.items():
+            with self.subTest(message=message), self.assertRaisesMessage(ValueError, message):
+                clean_row("services", raw)
+        for price in ("nan", "inf", True):
+            with self.subTest(price=price), self.assertRaises(ValueError):
+                clean_row("services", {"title": "A", "price": price})
+        with self.assertRaisesMessage(ValueError, "'name' is required"):
+            clean_row("categories", {"id": "c1"})
+
+    def test_rows_without_an_id_get_a_stable_content_id(self):
+        first = clean_row("categories", {"name": "Home"})[0]
+        self.assertEqual(first, clean_row("categories", '{"name": "Home", "extra": 1}')[0])
+        self.assertNotEqual(first, clean_row("categories", {"name": "Garden"})[0])
+        self.assertEqual(len(first), 20)
+
+
+CSV = """id,title,price,is_active
+s1,Plumbing,100,true
+,Cleaning,50,
+s3,,10,
+s4,Painting,-5,
+s5,Roofing,300,false
+"""
+
+
+class ImportRowsTests(FirestoreTestCase):
+    client_modules = ("core.catalog_io", "core.firestore_client")
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch("core.catalog.invalidate_catalog")
+        self.invalidate = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _import(self, text=CSV, fmt="csv", **kwargs):
+        self.invalid = []
+        self.checkpoints = []
+        kwargs.setdefault("workers", 1)
+        return import_rows(
+            "services", read_rows(io.StringIO(text), fmt), batch_size=2,
+            on_invalid=lambda line, message: self.invalid.append((line, message)),
+            on_checkpoint=self.checkpoints.append, **kwargs,
+        )
+
+    def _services(self):
+        return {doc_id: data for (collection, doc_id), (data, _, _) in self.db.docs.items() if collection == "services"}
+
+    def test_valid_rows_are_written_and_invalid_ones_reported_by_line(self):
+        summary = self._import()
+
+        self.assertEqual(summary, {"read": 5, "skipped": 0, "invalid": 2, "written": 3})
+        self.assertEqual(self.invalid, [(4, "'title' is required"), (5, "'price' must be a non-negative number")])
+        self.assertEqual(self.db.commits, [2, 1])
+        self.assertEqual(self.checkpoints, [2, 5, 5])
+        services = self._services()
+        self.assertEqual(services["s1"], {"title": "Plumbing", "price": 100, "is_active": True})
+        self.assertFalse(services["s5"]["is_active"])
+        self.invalidate.assert_called_once()
+
+    def test_reimport_upserts_instead_of_duplicating(self):
+        self._import()
+        self._import(workers=4)
+        self.assertEqual(len(self._services()), 3)
+
+    def test_merge_keeps_fields_outside_the_file(self):
+        self.db.seed("services", "s1", {"title": "Old", "price": 1, "description": "kept"})
+        self._import(merge=True)
+        self.assertEqual(self._services()["s1"]["description"], "kept")
+        self._import()
+        self.assertNotIn("description", self._services()["s1"])
+
+    def test_skip_resumes_after_a_checkpoint(self):
+        summary = self._import(skip=4)
+        self.assertEqual(summary["skipped"], 4)
+        self.assertEqual(sorted(self._services()), ["s5"])
+
+    def test_max_errors_aborts(self):
+        with self.assertRaisesMessage(ValueError, "Aborted after 2 invalid rows"):
+            self._import(max_errors=1)
+
+    def test_dry_run_writes_nothing(self):
+        summary = self._import(dry_run=True)
+        self.assertEqual(summary["written"], 3)
+        self.assertEqual(self.db.commits, [])
+        self.assertEqual(self.checkpoints, [])
+        self.invalidate.assert_not_called()
+
+    def test_transient_commit_errors_are_retried(self):
+        self.db.commit_errors = [ServiceUnavailable("busy")]
+        with mock.patch("core.catalog_io.time.sleep") as sleep:
+            summary = self._import()
+        self.assertEqual(summary["written"], 3)
+        self.assertEqual(self.db.commits, [2, 2, 1])
+        sleep.assert_called_once()
+
+    def test_permanent_commit_errors_stop_the_import(self):
+        self.db.commit_errors = [PermissionDenied("no")]
+        with self.assertRaises(PermissionDenied):
+            self._import()
+        self.assertEqual(self._services(), {})
+
+    def test_export_reimports_as_is(self):
+        self._import()
+        exported = {}
+        for fmt in ("csv", "jsonl"):
+            out = io.StringIO()
+            self.assertEqual(export_rows(out, "services", fmt), 3)
+            exported[fmt] = out.getvalue()
+        before = self._services()
+        for fmt, text in exported.items():
+            with self.subTest(fmt=fmt):
+                self.db.docs.clear()
+                self.assertEqual(self._import(text, fmt)["invalid"], 0)
+                self.assertEqual(self._services(), before)
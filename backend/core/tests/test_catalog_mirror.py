@@ -0,0 +1,145 @@
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from core import catalog_mirror, views
+from core.catalog_mirror import CollectionMirror, _name_key
+
+
+def _change(kind, doc_id, data=None):
+    document = SimpleNamespace(id=doc_id, to_dict=lambda: dict(data or {}))
+    return SimpleNamespace(type=SimpleNamespace(name=kind), document=document)
+
+
+class CollectionMirrorTests(SimpleTestCase):
+    def setUp(self):
+        self.mirror = CollectionMirror("categories", sort_key=_name_key, include=lambda item: item.get("name") is not None)
+
+    def test_applies_added_modified_and_removed_changes(self):
+        self.mirror._on_snapshot(None, [
+            _change("ADDED", "c1", {"name": "Plumbing"}),
+            _change("ADDED", "c2", {"name": "Cleaning"}),
+            _change("ADDED", "c3", {}),  # no name: left out of list()
+        ], None)
+        self.assertEqual([item["id"] for item in self.mirror.list(10)], ["c2", "c1"])
+
+        self.mirror._on_snapshot(None, [_change("MODIFIED", "c2", {"name": "Yard work"})], None)
+        self.mirror._on_snapshot(None, [_change("REMOVED", "c1")], None)
+        self.assertEqual(self.mirror.list(10), [{"name": "Yard work", "id": "c2"}])
+        self.assertIsNone(self.mirror.get("c1"))
+        self.assertEqual(self.mirror.get("c3"), {"id": "c3"})
+
+    def test_sorts_once_per_burst_of_events(self):
+        for i in range(5):
+            self.mirror._on_snapshot(None, [_change("ADDED", f"c{i}", {"name": f"n{4 - i}"})], None)
+        self.assertIsNone(self.mirror._ordered)
+        first = self.mirror.list(2)
+        self.assertEqual([item["name"] for item in first], ["n0", "n1"])
+        ordered = self.mirror._ordered
+        self.mirror.list(5, fields=("name",))
+        self.assertIs(self.mirror._ordered, ordered)
+
+    def test_list_returns_copies(self):
+        self.mirror._on_snapshot(None, [_change("ADDED", "c1", {"name": "Plumbing"})], None)
+        self.mirror.list(1)[0]["name"] = "changed"
+        self.assertEqual(self.mirror.list(1)[0]["name"], "Plumbing")
+
+
+class CatalogMirrorHealthTests(SimpleTestCase):
+    def test_health_hides_error_details(self):
+        with mock.patch.object(catalog_mirror, "get_firestore_client", side_effect=RuntimeError("secret path /etc/sa.json")):
+            with self.assertLogs("core.catalog_mirror", "WARNING"):
+                self.assertFalse(catalog_mirror.start_catalog_mirror())
+        self.addCleanup(lambda: [setattr(m, "_error", None) for m in catalog_mirror._MIRRORS])
+
+        health = catalog_mirror.catalog_mirror_health()
+        self.assertEqual(health, {"state": "down", "age_seconds": None})
+        self.assertEqual(catalog_mirror.catalog_mirror_status()["services"]["error"], "RuntimeError")
+
+
+class FakeWatch:
+    def __init__(self, callback):
+        self.callback = callback
+        self.is_active = True
+
+    def unsubscribe(self):
+        self.is_active = False
+
+
+class FakeListenerClient:
+    def __init__(self):
+        self.watches = []
+
+    def collection(self, name):
+        return SimpleNamespace(on_snapshot=lambda callback: self._listen(name, callback))
+
+    def _listen(self, name, callback):
+        watch = FakeWatch(callback)
+        self.watches.append((name, watch))
+        return watch
+
+    def deliver(self):
+        for name, watch in self.watches:
+            if watch.is_active:
+                watch.callback(None, [_change("ADDED", f"{name}-1", {"name": "A"})], None)
+
+
+@override_settings(CATALOG_MIRROR=True, CATALOG_MIRROR_RETRY=30)
+class CatalogMirrorReconnectTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = FakeListenerClient()
+        mirrors = (CollectionMirror("services"), CollectionMirror("categories", sort_key=_name_key))
+        for name, value in (("_MIRRORS", mirrors), ("_start_pid", None), ("_last_start_attempt", None),
+                            ("get_firestore_client", lambda: self.client)):
+            patcher = mock.patch.object(catalog_mirror, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.mirrors = mirrors
+
+    def _ensure(self):
+        catalog_mirror.ensure_catalog_mirror()
+        # Wait for the background subscription to finish
+        with catalog_mirror._start_lock:
+            pass
+
+    def _status(self):
+        return json.loads(views.status(RequestFactory().get("/api/status/")).content)["catalog_mirror"]
+
+    def test_status_reports_starting_then_ready(self):
+        self._ensure()
+        self.assertEqual(self._status(), {"state": "starting", "age_seconds": None})
+
+        self.client.deliver()
+
+        status = self._status()
+        self.assertEqual(status["state"], "ready")
+        self.assertIsInstance(status["age_seconds"], float)
+
+    def test_closed_listener_is_reported_down_and_resubscribed_after_the_retry_delay(self):
+        self._ensure()
+        self.client.deliver()
+        self.client.watches[0][1].is_active = False
+
+        self.assertFalse(self.mirrors[0].healthy)
+        self.assertEqual(self._status()["state"], "down")
+
+        # Within CATALOG_MIRROR_RETRY of the last attempt nothing is retried
+        self._ensure()
+        self.assertEqual(self.mirrors[0].subscriptions, 1)
+
+        catalog_mirror._last_start_attempt -= 31
+        self._ensure()
+        self.assertEqual([m.subscriptions for m in self.mirrors], [2, 1])
+        self.client.deliver()
+        self.assertEqual(self._status()["state"], "ready")
+        self.assertEqual(self.mirrors[0].list(10), [{"name": "A", "id": "services-1"}])
+
+    @override_settings(CATALOG_MIRROR=False)
+    def test_disabled_mirror_never_subscribes(self):
+        self._ensure()
+
+        self.assertEqual(self.client.watches, [])
+        self.assertEqual(self._status()["state"], "disabled")
@@ -0,0 +1,61 @@
+from django.contrib.auth.models import User
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import views
+from core.catalog import invalidate_catalog
+from core.tests.fakes import FirestoreTestCase
+
+
+@override_settings(CATALOG_MIRROR=False, HTTP_CACHE_CONTROL={"service_detail": "public, max-age=60", "me": "private, no-cache"})
+class ConditionalGetTests(FirestoreTestCase):
+    def setUp(self):
+        super().setUp()
+        invalidate_catalog()
+        self.addCleanup(invalidate_catalog)
+
+    def _service(self, **headers):
+        request = APIRequestFactory().get("/api/services/s1/", **headers)
+        return views.service_detail(request, "s1")
+
+    def _me(self, **headers):
+        user = User(username="ana", email="ana@example.com")
+        user.firebase_uid = "u1"
+        request = APIRequestFactory().get("/api/me/", **headers)
+        force_authenticate(request, user=user)
+        return views.me(request)
+
+    def test_matching_etag_gets_304_until_the_resource_changes(self):
+        self.db.seed("services", "s1", {"title": "Cleaning", "price": 40})
+        first = self._service()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first["Cache-Control"], "public, max-age=60")
+        etag = first["ETag"]
+
+        for validator in (etag, "W/" + etag, f'"other", {etag}'):
+            with self.subTest(validator=validator):
+                response = self._service(HTTP_IF_NONE_MATCH=validator)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b"")
+                self.assertEqual(response["ETag"], etag)
+
+        self.db.seed("services", "s1", {"title": "Cleaning", "price": 45})
+        invalidate_catalog()
+        changed = self._service(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], etag)
+
+    def test_missing_resources_carry_no_validators(self):
+        response = self._service()
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_profile_last_modified_and_private_caching(self):
+        self.db.seed("user_profiles", "u1", {"name": "Ana", "updated_at": "2026-01-01T10:00:00+00:00"})
+        first = self._me()
+        self.assertEqual(first["Last-Modified"], "Thu, 01 Jan 2026 10:00:00 GMT")
+        self.assertEqual(first["Cache-Control"], "private, no-cache")
+        self.assertIn("Authorization", first["Vary"])
+
+        self.assertEqual(self._me(HTTP_IF_MODIFIED_SINCE="Thu, 01 Jan 2026 10:00:00 GMT").status_code, 304)
+        self.assertEqual(self._me(HTTP_IF_MODIFIED_SINCE="Thu, 01 Jan 2026 09:00:00 GMT").status_code, 200)
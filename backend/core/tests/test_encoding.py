@@ -0,0 +1,46 @@
+from django.http import HttpResponse, HttpResponseNotModified
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+
+from core import encoding
+from core.middleware import APICompressionMiddleware
+
+
+class DefaultEncoderTests(SimpleTestCase):
+    def test_lazy_translations_encode_as_text(self):
+        self.assertEqual(encoding.loads(encoding.dumps({"detail": gettext_lazy("Not found.")})), {"detail": "Not found."})
+
+
+@override_settings(API_COMPRESSION_MIN_SIZE=1024)
+class CompressionETagTests(SimpleTestCase):
+    def _process(self, response, path="/api/services/"):
+        request = RequestFactory().get(path, HTTP_ACCEPT_ENCODING="gzip")
+        return APICompressionMiddleware(lambda r: response).process_response(request, response)
+
+    def test_304_carries_the_same_weak_etag_as_the_compressed_200(self):
+        full = HttpResponse(b"x" * 4096)
+        full["ETag"] = '"abc"'
+        not_modified = HttpResponseNotModified()
+        not_modified["ETag"] = '"abc"'
+
+        full = self._process(full)
+        not_modified = self._process(not_modified)
+
+        self.assertEqual(full["Content-Encoding"], "gzip")
+        self.assertEqual(full["ETag"], 'W/"abc"')
+        self.assertEqual(not_modified["ETag"], 'W/"abc"')
+
+    def test_small_uncompressed_bodies_also_get_weak_etags(self):
+        response = HttpResponse(b"{}")
+        response["ETag"] = '"abc"'
+
+        response = self._process(response)
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response["ETag"], 'W/"abc"')
+
+    def test_non_api_paths_are_untouched(self):
+        response = HttpResponseNotModified()
+        response["ETag"] = '"abc"'
+
+        self.assertEqual(self._process(response, path="/static/app.js")["ETag"], '"abc"')
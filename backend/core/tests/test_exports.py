@@ -0,0 +1,21 @@
+import csv
+import io
+
+from core.exports import BOOKING_EXPORT_COLUMNS, booking_export_chunks
+from core.tests.fakes import FirestoreTestCase
+
+
+class BookingExportTests(FirestoreTestCase):
+    def test_every_default_column_is_filled_for_a_created_booking(self):
+        # The fields POST /api/bookings/ writes
+        self.db.seed("bookings", "b1", {
+            "user_id": "u1", "service_id": "s1", "booking_date": "2026-03-02", "booking_time": "09:00",
+            "address": "1 Main St", "total_price": 40, "status": "pending", "service_title": "Cleaning",
+            "created_at": "2026-03-01T08:00:00Z",
+        })
+
+        body = b"".join(booking_export_chunks("csv")).decode("utf-8")
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(tuple(rows[0]), BOOKING_EXPORT_COLUMNS)
+        self.assertEqual([column for column, value in rows[0].items() if value == ""], [])
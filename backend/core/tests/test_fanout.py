@@ -0,0 +1,55 @@
+import threading
+
+from django.test import SimpleTestCase, override_settings
+
+from core import fanout
+
+
+@override_settings(FANOUT_MAX_WORKERS=4)
+class GatherTimeoutTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        self._reset()
+        self.addCleanup(self._reset)
+
+    def _reset(self):
+        if fanout._executor is not None:
+            fanout._executor.shutdown(wait=False)
+        fanout._executor = None
+        fanout._overdue.clear()
+        fanout._stats.update(timeouts=0, recycled=0)
+
+    def _hang(self):
+        self.release.wait(10)
+        return "late"
+
+    def test_partial_results_when_a_source_times_out(self):
+        outcome = fanout.gather({"slow": self._hang, "fast": lambda: 1}, timeout=0.05)
+
+        self.assertEqual(outcome.get("fast"), 1)
+        self.assertEqual(outcome.failed, ["slow"])
+        self.assertIsInstance(outcome.errors["slow"], TimeoutError)
+        self.assertEqual(fanout.fanout_stats(), {"timeouts": 1, "recycled": 0, "overdue": 1})
+
+    def test_overdue_calls_holding_half_the_pool_replace_it(self):
+        first = fanout._get_executor()
+        fanout.gather({"a": self._hang, "b": self._hang}, timeout=0.05)
+
+        self.assertEqual(fanout.fanout_stats()["recycled"], 1)
+        self.assertIsNot(fanout._get_executor(), first)
+        # A full pool's worth of concurrent work runs despite the stuck calls
+        barrier = threading.Barrier(4, timeout=2)
+        outcome = fanout.gather({n: barrier.wait for n in range(4)}, timeout=2)
+        self.assertEqual(outcome.errors, {})
+
+    def test_overdue_calls_that_finish_free_their_slot(self):
+        fanout.gather({"slow": self._hang}, timeout=0.05)
+        self.release.set()
+        for _ in range(100):
+            if not fanout._overdue:
+                break
+            threading.Event().wait(0.01)
+
+        self.assertEqual(fanout.fanout_stats()["overdue"], 0)
@@ -0,0 +1,34 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from core.identity import _identity_cache, resolve_user
+from core.models import FirebaseIdentity
+
+
+class ResolveUserTests(TestCase):
+    def setUp(self):
+        _identity_cache.clear()
+        self.addCleanup(_identity_cache.clear)
+
+    def test_creates_user_and_identity_on_first_sight(self):
+        user = resolve_user("uid-1", "ana@example.com")
+        self.assertEqual(user.email, "ana@example.com")
+        self.assertEqual(user.username, "ana")
+        self.assertEqual(FirebaseIdentity.objects.get(uid="uid-1").user_id, user.pk)
+        self.assertEqual(resolve_user("uid-1", "ana@example.com").pk, user.pk)
+
+    def test_links_legacy_user_by_email(self):
+        legacy = get_user_model().objects.create(username="ana", email="ana@example.com")
+        self.assertEqual(resolve_user("uid-1", "ana@example.com").pk, legacy.pk)
+
+    def test_email_already_mapped_to_another_uid_gets_a_new_user(self):
+        # e.g. the Firebase account was deleted and recreated with the same email
+        first = resolve_user("uid-old", "ana@example.com")
+        _identity_cache.clear()
+        second = resolve_user("uid-new", "ana@example.com")
+
+        self.assertNotEqual(first.pk, second.pk)
+        self.assertEqual(second.email, "ana@example.com")
+        self.assertEqual(second.username, "uid-new")  # "ana" is taken
+        self.assertEqual(FirebaseIdentity.objects.get(uid="uid-old").user_id, first.pk)
+        self.assertEqual(FirebaseIdentity.objects.get(uid="uid-new").user_id, second.pk)
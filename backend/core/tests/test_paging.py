@@ -0,0 +1,111 @@
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import views
+from core.firestore_client import _paged_query, decode_page_token, encode_page_token
+from core.tests.fakes import FirestoreTestCase
+
+
+def _token(value):
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+
+class PageTokenTests(SimpleTestCase):
+    def test_round_trip_keeps_timestamps(self):
+        created = datetime(2026, 3, 1, 9, 30, 0, 123456, tzinfo=timezone.utc)
+        cursor = {"__name__": "b1", "created_at": created}
+        token = encode_page_token(cursor)
+        self.assertNotIn("=", token)
+        self.assertEqual(decode_page_token(token, "created_at"), cursor)
+
+    def test_invalid_tokens_raise_value_error(self):
+        for token in ("!!!", "e30", _token([1, 2]), _token({"created_at": 1}),
+                      _token({"__name__": "b1", "t": {"$ts": "yesterday"}}),
+                      _token({"__name__": "b1", "t": {"$ts": 5}})):
+            with self.subTest(token=token), self.assertRaisesMessage(ValueError, "Invalid page token"):
+                decode_page_token(token)
+
+    def test_tokens_must_match_the_query_ordering(self):
+        cases = [
+            (_token({"__name__": 5}), None),
+            (_token({"__name__": ""}), None),
+            (_token({"__name__": ["b1"]}), None),
+            (_token({"__name__": "b1", "price": 5}), None),
+            (_token({"__name__": "b1"}), "created_at"),
+            (_token({"__name__": "b1", "price": 5}), "created_at"),
+            (_token({"__name__": "b1", "created_at": 1, "extra": 2}), "created_at"),
+        ]
+        for token, order_field in cases:
+            with self.subTest(token=token, order_field=order_field), self.assertRaisesMessage(ValueError, "Invalid page token"):
+                decode_page_token(token, order_field)
+
+
+class PageTokenViewTests(FirestoreTestCase):
+    def _get(self, view, path, user=None):
+        request = APIRequestFactory().get(path)
+        if user:
+            force_authenticate(request, user=user)
+        return view(request)
+
+    def test_forged_tokens_are_bad_requests(self):
+        self.db.seed("services", "s1", {"title": "A"})
+        self.db.seed("bookings", "b1", {"user_id": "u1"})
+        user = User(username="ana")
+        user.firebase_uid = "u1"
+        forged = _token({"__name__": 5, "x": 1})
+
+        response = self._get(views.services_list, f"/api/services/?page_token={forged}")
+        self.assertEqual(response.status_code, 400)
+        response = self._get(views.bookings, f"/api/bookings/?page_token={forged}", user)
+        self.assertEqual(response.status_code, 400)
+        with mock.patch.object(views, "_is_request_admin", return_value=True):
+            response = self._get(views.admin_bookings, f"/api/admin/bookings/?page_token={forged}", user)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.db.queries, 0)
+
+
+class PagedQueryTests(FirestoreTestCase):
+    def _walk(self, query, **kwargs):
+        pages, token = [], None
+        while True:
+            items, token = _paged_query(query, page_size=2, page_token=token, **kwargs)
+            pages.append([item["id"] for item in items])
+            if token is None:
+                return pages
+
+    def test_ties_on_the_order_field_break_on_document_id(self):
+        for doc_id, rank in (("d", 1), ("a", 1), ("c", 1), ("b", 0), ("e", 2)):
+            self.db.seed("services", doc_id, {"rank": rank})
+        self.assertEqual(self._walk(self.db.collection("services"), order_field="rank"), [["b", "a"], ["c", "d"], ["e"]])
+        self.assertEqual(
+            self._walk(self.db.collection("services"), order_field="rank", direction="DESCENDING"),
+            [["e", "d"], ["c", "a"], ["b"]],
+        )
+
+    def test_timestamp_cursor_round_trips(self):
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(5):
+            self.db.seed("bookings", f"b{i}", {"created_at": start + timedelta(minutes=i % 3)})
+        pages = self._walk(self.db.collection("bookings"), order_field="created_at")
+        self.assertEqual(pages, [["b0", "b3"], ["b1", "b4"], ["b2"]])
+
+    def test_last_full_page_has_no_token(self):
+        for i in range(4):
+            self.db.seed("services", f"s{i}", {})
+        self.assertEqual(self._walk(self.db.collection("services")), [["s0", "s1"], ["s2", "s3"]])
+
+    def test_fields_projection_keeps_the_order_field(self):
+        self.db.seed("services", "s1", {"title": "A", "price": 5, "secret": "x"})
+        items, _ = _paged_query(self.db.collection("services"), 10, fields=("title",), order_field="price")
+        self.assertEqual(items, [{"title": "A", "price": 5, "id": "s1"}])
+
+    def test_invalid_token_is_rejected_before_querying(self):
+        with self.assertRaises(ValueError):
+            _paged_query(self.db.collection("services"), 10, page_token="!!!")
+        self.assertEqual(self.db.queries, 0)
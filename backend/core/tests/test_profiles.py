@@ -0,0 +1,34 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import views
+from core.tests.fakes import FirestoreTestCase
+
+
+class MeUpdateTests(FirestoreTestCase):
+    def _put(self, data):
+        user = User(username="ana", email="ana@example.com")
+        user.firebase_uid = "u1"
+        request = APIRequestFactory().put("/api/me/", data, format="json")
+        force_authenticate(request, user=user)
+        return views.me(request)
+
+    def test_put_writes_without_reading_the_profile_first(self):
+        self.db.seed("user_profiles", "u1", {"name": "Ana", "address": "1 Main St", "updated_at": "2026-01-01T00:00:00+00:00"})
+
+        with mock.patch.object(views, "get_profile") as get_profile:
+            response = self._put({"phone": "555-0100", "role": "admin"})
+
+        get_profile.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["id"], "u1")
+        self.assertEqual(response.data["phone"], "555-0100")
+        self.assertEqual(response.data["email"], "ana@example.com")
+        self.assertNotIn("role", response.data)
+        stored = self.db.data("user_profiles", "u1")
+        self.assertNotIn("role", stored)
+        self.assertEqual(stored["phone"], "555-0100")
+        self.assertEqual(stored["name"], "Ana")
+        self.assertEqual(stored["updated_at"], response.data["updated_at"])
@@ -0,0 +1,48 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import views
+from core.catalog import invalidate_catalog
+from core.tests.fakes import FirestoreTestCase
+
+
+@override_settings(CATALOG_MIRROR=False)
+class FieldProjectionTests(FirestoreTestCase):
+    def setUp(self):
+        super().setUp()
+        invalidate_catalog()
+        self.addCleanup(invalidate_catalog)
+        self.db.seed("services", "s1", {"title": "Cleaning", "price": 40, "description": "x" * 5000})
+        self.db.seed("bookings", "b1", {"user_id": "u1", "status": "pending", "address": "1 Main St", "created_at": "2026-01-01T00:00:00Z"})
+        self.user = User(username="ana")
+        self.user.firebase_uid = "u1"
+
+    def _get(self, view, path):
+        request = APIRequestFactory().get(path)
+        force_authenticate(request, user=self.user)
+        with mock.patch.object(views, "_is_request_admin", return_value=True):
+            return view(request)
+
+    def test_services_list_returns_only_the_requested_fields(self):
+        response = self._get(views.services_list, "/api/services/?fields=title,id")
+        self.assertEqual(response.data, [{"title": "Cleaning", "id": "s1"}])
+
+        response = self._get(views.services_list, "/api/services/?fields=title&page_size=10")
+        self.assertEqual(response.data["results"], [{"title": "Cleaning", "id": "s1"}])
+
+    def test_bookings_listings_are_projected(self):
+        response = self._get(views.bookings, "/api/bookings/?fields=status")
+        self.assertEqual(response.data, [{"status": "pending", "id": "b1"}])
+
+        # The sort field is kept so the next page's cursor can be built
+        response = self._get(views.admin_bookings, "/api/admin/bookings/?fields=status&page_size=10")
+        self.assertEqual(response.data["results"], [{"status": "pending", "created_at": "2026-01-01T00:00:00Z", "id": "b1"}])
+
+    def test_invalid_field_names_are_rejected(self):
+        for view, path in ((views.services_list, "/api/services/"), (views.bookings, "/api/bookings/"),
+                           (views.admin_bookings, "/api/admin/bookings/")):
+            with self.subTest(path=path):
+                self.assertEqual(self._get(view, f"{path}?fields=title,a.b").status_code, 400)
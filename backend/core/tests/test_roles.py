@@ -0,0 +1,138 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import firestore_client, views
+from core.firestore_client import bulk_set_user_roles, set_user_role
+from core.role_claims import sync_many
+from core.roles import request_role
+from core.tests.fakes import FirestoreTestCase
+
+
+class FakeAuth:
+    def __init__(self):
+        self.claims = {}
+        self.fail = None  # exception raised by set_custom_user_claims
+
+    def get_user(self, uid):
+        return SimpleNamespace(uid=uid, custom_claims=dict(self.claims.get(uid, {})))
+
+    def set_custom_user_claims(self, uid, claims):
+        if self.fail is not None:
+            raise self.fail
+        self.claims[uid] = dict(claims)
+
+
+class RoleClaimsTests(FirestoreTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.auth = FakeAuth()
+        patcher = mock.patch("core.role_claims.get_firebase_auth_client", return_value=self.auth)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _request(self, claims):
+        user = SimpleNamespace(is_authenticated=True, firebase_uid="u1", firebase_claims=dict(claims))
+        return SimpleNamespace(user=user)
+
+    def _token(self):
+        """Claims of a token minted now."""
+        return dict(self.auth.claims.get("u1", {}))
+
+    def test_promotion_is_trusted_from_fresh_claims(self):
+        set_user_role("u1", "admin")
+        token = self._token()
+        self.assertEqual(token["role"], "admin")
+        self.assertTrue(token["admin"])
+        self.assertIn("role_version", token)
+
+        cache.delete("quickserve:user_role:u1")  # no role cache to fall back on
+        with mock.patch("core.roles.get_user_role") as read:
+            self.assertEqual(request_role(self._request(token)), "admin")
+            self.assertTrue(views._is_request_admin(self._request(token)))
+        read.assert_not_called()
+
+    def test_demotion_distrusts_tokens_minted_before_it(self):
+        set_user_role("u1", "admin")
+        old_token = self._token()
+        set_user_role("u1", "user")
+
+        self.assertEqual(request_role(self._request(old_token)), "user")
+        self.assertFalse(views._is_request_admin(self._request(old_token)))
+        self.assertEqual(request_role(self._request(self._token())), "user")
+
+    def test_failed_sync_falls_back_to_firestore(self):
+        set_user_role("u1", "admin")
+        old_token = self._token()
+        self.auth.fail = RuntimeError("auth down")
+        with self.assertLogs("core.firestore_client", "WARNING"):
+            doc = set_user_role("u1", "user")
+
+        self.assertEqual(doc["role"], "user")
+        self.assertTrue(self._token()["admin"])  # claims push failed
+        self.assertFalse(views._is_request_admin(self._request(old_token)))
+        self.assertEqual(request_role(self._request(old_token)), "user")
+
+        # A later successful sync (e.g. manage.py sync_role_claims) restores trust
+        self.auth.fail = None
+        summary = sync_many({"u1": "user"})
+        self.assertEqual(summary["updated"], 1)
+        with mock.patch("core.roles.get_user_role") as read:
+            cache.delete("quickserve:user_role:u1")
+            self.assertEqual(request_role(self._request(self._token())), "user")
+        read.assert_not_called()
+
+    def test_writes_without_a_claims_sync_distrust_old_claims(self):
+        set_user_role("u1", "admin")
+        old_token = self._token()
+        bulk_set_user_roles({"u1": "user"}, sync_claims=False)
+        self.assertFalse(views._is_request_admin(self._request(old_token)))
+
+    def test_claims_without_a_recorded_change_are_trusted(self):
+        # Tokens issued before role versions existed
+        with mock.patch("core.roles.get_user_role") as read:
+            self.assertEqual(request_role(self._request({"role": "admin", "admin": True})), "admin")
+        read.assert_not_called()
+
+    def test_unchanged_claims_are_not_pushed_again(self):
+        set_user_role("u1", "admin")
+        self.assertEqual(sync_many({"u1": "admin"})["unchanged"], 1)
+
+
+class RoleCacheTests(FirestoreTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.db.seed("user_roles", "u1", {"role": "admin"})
+        patcher = mock.patch("core.roles.get_user_role", wraps=firestore_client.get_user_role)
+        self.read = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _whoami(self):
+        user = User(username="ana")
+        user.firebase_uid = "u1"  # a token without role claims
+        request = APIRequestFactory().get("/api/whoami/")
+        force_authenticate(request, user=user)
+        return views.whoami(request).data
+
+    def test_one_read_per_request_then_none_while_cached(self):
+        first = self._whoami()
+        self.assertEqual((first["role"], first["is_admin"]), ("admin", True))
+        self.assertEqual(self.read.call_count, 1)  # role and admin check share it
+
+        self._whoami()
+        self.assertEqual(self.read.call_count, 1)
+
+    def test_role_writes_update_the_cache(self):
+        self._whoami()
+        set_user_role("u1", "user", sync_claims=False)
+
+        again = self._whoami()
+        self.assertEqual((again["role"], again["is_admin"]), ("user", False))
+        self.assertEqual(self.read.call_count, 1)
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import SimpleTestCase
+
+from core.singleflight import SingleFlight, coalesce, firestore_flight
+
+
+class SingleFlightTests(SimpleTestCase):
+    def setUp(self):
+        self.flight = SingleFlight()
+
+    def _concurrently(self, n, fn):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def leader():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return fn()
+
+        with ThreadPoolExecutor(n) as pool:
+            futures = [pool.submit(self.flight.do, "key", leader)]
+            started.wait(5)
+            futures += [pool.submit(self.flight.do, "key", leader) for _ in range(n - 1)]
+            while self.flight.coalesced < n - 1:
+                time.sleep(0.001)
+            release.set()
+        return calls, futures
+
+    def test_concurrent_calls_share_one_execution(self):
+        calls, futures = self._concurrently(4, lambda: {"items": [1, 2]})
+        results = [future.result() for future in futures]
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"items": [1, 2]}] * 4)
+        # Followers get their own copies
+        self.assertIsNot(results[0]["items"], results[1]["items"])
+        self.assertEqual(self.flight.stats(), {"calls": 4, "executions": 1, "coalesced": 3, "errors": 0, "in_flight": 0})
+
+    def test_errors_are_shared(self):
+        def fail():
+            raise LookupError("down")
+
+        calls, futures = self._concurrently(3, fail)
+        for future in futures:
+            self.assertRaises(LookupError, future.result)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.flight.errors, 1)
+
+    def test_nothing_is_cached_after_the_call(self):
+        values = iter([1, 2])
+        self.assertEqual(self.flight.do("key", lambda: next(values)), 1)
+        self.assertEqual(self.flight.do("key", lambda: next(values)), 2)
+
+    def test_async_calls_share_one_task(self):
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return ["a"]
+
+        async def run():
+            return await asyncio.gather(*(self.flight.ado("key", load) for _ in range(3)))
+
+        self.assertEqual(asyncio.run(run()), [["a"]] * 3)
+        self.assertEqual(len(calls), 1)
+
+
+@coalesce
+def _lookup(ids, fields=None):
+    return list(ids)
+
+
+class CoalesceTests(SimpleTestCase):
+    def test_hashable_args(self):
+        self.assertEqual(_lookup(("a", "b"), fields=("x",)), ["a", "b"])
+        self.assertEqual(_lookup.__wrapped__(["a"]), ["a"])
+
+    def test_unhashable_args_raise_type_error_naming_the_helper(self):
+        calls = firestore_flight.calls
+        with self.assertRaisesRegex(TypeError, r"_lookup\(\) is coalesced; its arguments must be hashable"):
+            _lookup(["a", "b"])
+        with self.assertRaises(TypeError):
+            _lookup(("a",), fields=["x"])
+        self.assertEqual(firestore_flight.calls, calls)
@@ -0,0 +1,62 @@
+import json
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import RequestFactory, SimpleTestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import views
+from core.streaming import json_array_chunks, ndjson_chunks, stream_format
+from core.tests.fakes import FirestoreTestCase
+
+
+class ChunkEncoderTests(SimpleTestCase):
+    def test_json_array_is_emitted_before_the_source_is_exhausted(self):
+        pulled = []
+
+        def source():
+            for i in range(100):
+                pulled.append(i)
+                yield {"id": f"b{i}", "note": "x" * 50}
+
+        chunks = json_array_chunks(source(), chunk_size=1024)
+        first = next(chunks)
+        self.assertLess(len(pulled), 100)
+        body = first + b"".join(chunks)
+        self.assertEqual([item["id"] for item in json.loads(body)], [f"b{i}" for i in range(100)])
+
+    def test_empty_sources(self):
+        self.assertEqual(json.loads(b"".join(json_array_chunks(iter(())))), [])
+        self.assertEqual(b"".join(ndjson_chunks(iter(()))), b"")
+
+    def test_ndjson_has_one_document_per_line(self):
+        body = b"".join(ndjson_chunks(({"id": i} for i in range(3)), chunk_size=8))
+        self.assertEqual([json.loads(line) for line in body.splitlines()], [{"id": 0}, {"id": 1}, {"id": 2}])
+
+    def test_stream_format(self):
+        factory = RequestFactory()
+        self.assertIsNone(stream_format(factory.get("/")))
+        self.assertEqual(stream_format(factory.get("/?stream=1")), "json")
+        self.assertEqual(stream_format(factory.get("/?stream=ndjson")), "ndjson")
+        self.assertEqual(stream_format(factory.get("/", HTTP_ACCEPT="application/x-ndjson")), "ndjson")
+
+
+class AdminBookingsStreamTests(FirestoreTestCase):
+    def _get(self, query):
+        request = APIRequestFactory().get(f"/api/admin/bookings/{query}")
+        force_authenticate(request, user=User(username="admin"))
+        with mock.patch.object(views, "_is_request_admin", return_value=True):
+            return views.admin_bookings(request)
+
+    def test_streams_every_booking_across_cursor_pages(self):
+        for i in range(1203):
+            self.db.seed("bookings", f"b{i:04d}", {"status": "pending", "created_at": f"2026-01-01T00:00:00.{i:06d}Z"})
+
+        response = self._get("?stream=ndjson")
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(self.db.queries, 0)  # nothing is read until the body is consumed
+        ids = [json.loads(line)["id"] for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(ids, [f"b{i:04d}" for i in reversed(range(1203))])
+        self.assertEqual(self.db.queries, 3)
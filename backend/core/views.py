@@ -1,4 +1,4 @@
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.contrib.auth import get_user_model
 from rest_framework.decorators import api_view, permission_classes, parser_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -9,32 +9,62 @@ from django.conf import settings
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
 import os
+import re
 import uuid
+from datetime import date
 from .serializers import RegisterSerializer
+from .streaming import CSV_CONTENT_TYPE, NDJSON_CONTENT_TYPE, stream_format, streaming_json_response
+from .analytics import (
+	BUCKETS as ANALYTICS_BUCKETS,
+	DATE_FIELDS as ANALYTICS_DATE_FIELDS,
+	STATUSES as ANALYTICS_STATUSES,
+	AnalyticsNotReady,
+	analytics_stats,
+	booking_analytics,
+	request_full_refresh,
+)
+from .conditional import conditional_response
+from .exports import BOOKING_EXPORT_COLUMNS, EXPORT_FORMATS, booking_export_chunks, booking_filters, export_filename
+from .fanout import FanoutResult, fanout_stats, gather
+from .firestore_async import get_async_client_stats
+from .catalog import list_services, get_service, get_services, list_categories, catalog_cache_stats, mirrored
+from .catalog_mirror import catalog_mirror_health, catalog_mirror_status
 from .firestore_client import (
-	list_services,
-	get_service,
+	list_services_page,
 	create_service,
 	update_service,
 	delete_service,
 	list_bookings_for_user,
+	list_bookings_for_user_page,
 	create_booking,
 	get_booking,
 	update_booking,
 	list_all_bookings,
+	list_all_bookings_page,
 	get_profile,
+	get_profiles,
 	upsert_profile,
 	list_profiles,
 	list_profiles_map,
-	get_user_role,
 	set_user_role,
-	list_categories,
 	create_category,
+	get_booking_stats,
+	rebuild_booking_stats,
 	list_auth_users,
+	iter_auth_users,
+	iter_all_bookings,
 	list_roles_map,
+	get_user_roles,
+	get_client_stats,
+	bulk_update_bookings,
+	bulk_write_services,
+	bulk_set_user_roles,
 )
 from rest_framework.decorators import authentication_classes
-from .authentication import FirebaseAuthentication
+from .authentication import FirebaseAuthentication, token_cache_stats
+from .identity import identity_cache_stats
+from .roles import claims_current, request_role, role_cache_stats
+from .singleflight import singleflight_stats
 
 
 def status(request):
@@ -42,15 +72,49 @@ def status(request):
 	return JsonResponse({
 		"status": "ok",
 		"message": "Hello from Django backend",
+		"catalog_mirror": catalog_mirror_health(),
 	})
 
 
+@api_view(["GET"])
+def bootstrap(request):
+	"""Everything the first page paint needs in one response: status, active
+	services and categories. The sources are fetched concurrently and the whole
+	body shares one ETag, so a warm reload is a single 304.
+	"""
+	sources = {"services": list_services, "categories": list_categories}
+	# Mirrored collections are plain memory reads: run them here and keep the
+	# fan-out pool for sources that actually go to Firestore
+	inline = {name: fn for name, fn in sources.items() if mirrored(name)}
+	remote = {name: fn for name, fn in sources.items() if name not in inline}
+	gathered = gather(remote) if remote else FanoutResult()
+	for name, fn in inline.items():
+		try:
+			gathered.results[name] = fn()
+		except Exception as exc:
+			gathered.errors[name] = exc
+	if len(gathered.errors) == 2:
+		return Response({"detail": "Failed to load catalog", "failed_sources": gathered.failed}, status=drf_status.HTTP_503_SERVICE_UNAVAILABLE)
+	data = {
+		"status": "ok",
+		"message": "Hello from Django backend",
+		"services": [s for s in gathered.get("services", []) if s.get("is_active", True) is not False],
+		"categories": gathered.get("categories", []),
+	}
+	if gathered.partial:
+		# Don't hand out validators for an incomplete body
+		response = Response(data)
+		response["X-Partial-Result"] = ",".join(gathered.failed)
+		return response
+	return conditional_response(request, Response(data), "bootstrap")
+
+
 @api_view(["GET"])
 def whoami(request):
 	"""Return basic auth context and admin status to help debug deployments."""
 	user = getattr(request, "user", None)
 	uid = getattr(user, "firebase_uid", None) if user and user.is_authenticated else None
-	role = get_user_role(uid) if uid else None
+	role = request_role(request) if uid else None
 	return Response({
 		"authenticated": bool(user and user.is_authenticated),
 		"email": getattr(user, "email", None) if user else None,
@@ -58,7 +122,7 @@ def whoami(request):
 		"is_staff": bool(getattr(user, "is_staff", False)) if user else False,
 		"is_superuser": bool(getattr(user, "is_superuser", False)) if user else False,
 		"is_admin": _is_request_admin(request),
-		"role": (role or {}).get("role") if role else None,
+		"role": role,
 	})
  
 
@@ -82,10 +146,11 @@ def _is_request_admin(request) -> bool:
 				bootstrap = []
 			if uid in bootstrap:
 				return True
-		# Firebase custom claims support (e.g., { admin: true } or role/roles)
+		# Firebase custom claims support (e.g., { admin: true } or role/roles),
+		# unless the user's role changed since these claims were pushed
 		try:
 			claims = getattr(request.user, "firebase_claims", None)
-			if claims:
+			if claims and claims_current(uid, claims):
 				if bool(claims.get("admin")):
 					return True
 				role_claim = claims.get("role")
@@ -96,13 +161,107 @@ def _is_request_admin(request) -> bool:
 					return True
 		except Exception:
 			pass
-		# Firebase role check
-		role = get_user_role(uid) if uid else None
-		return bool(role and role.get("role") == "admin")
+		# Firebase role check: synced role claim first, then the cached Firestore role
+		return bool(uid and request_role(request) == "admin")
 	except Exception:
 		return False
 
 
+def _page_params(request, default_size: int):
+	"""Return (page_size, page_token) when the client asked for cursor paging, else None.
+	Raises ValueError for a non-numeric page_size.
+	"""
+	# Works for both DRF requests and the plain HttpRequest seen by core.async_views
+	params = getattr(request, "query_params", request.GET)
+	if "page_size" not in params and "page_token" not in params:
+		return None
+	try:
+		page_size = int(params.get("page_size") or default_size)
+	except (TypeError, ValueError):
+		raise ValueError("page_size must be an integer")
+	if page_size < 1:
+		raise ValueError("page_size must be positive")
+	return page_size, (params.get("page_token") or None)
+
+
+_FIELD_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _field_params(request):
+	"""Return the `?fields=a,b` projection as a tuple, or None for whole documents.
+	Raises ValueError for names that are not plain top-level field names.
+	"""
+	params = getattr(request, "query_params", request.GET)
+	raw = params.get("fields")
+	if not raw:
+		return None
+	fields = []
+	for name in (part.strip() for part in raw.split(",")):
+		if not name or name == "id":
+			continue  # the id is always returned
+		if not _FIELD_NAME.match(name):
+			raise ValueError(f"Invalid field name: {name!r}")
+		fields.append(name)
+	return tuple(dict.fromkeys(fields))
+
+
+def _booking_filter_params(request):
+	"""Return (filters, sort) for the admin bookings listing (see exports.booking_filters).
+	Raises ValueError for bad input.
+	"""
+	return booking_filters(getattr(request, "query_params", request.GET))
+
+
+# Upper bound on ids accepted by the batch endpoints in one request
+MAX_BATCH_IDS = 500
+
+
+def _batch_ids(request):
+	"""Return the ids from `?ids=a,b,c` (or repeated `ids=`) in request order.
+	Raises ValueError when none are given or there are more than MAX_BATCH_IDS.
+	"""
+	params = getattr(request, "query_params", request.GET)
+	ids = []
+	for value in params.getlist("ids"):
+		ids.extend(part.strip() for part in value.split(",") if part.strip())
+	ids = list(dict.fromkeys(ids))
+	if not ids:
+		raise ValueError("'ids' is required")
+	if len(ids) > MAX_BATCH_IDS:
+		raise ValueError(f"At most {MAX_BATCH_IDS} ids per request")
+	return ids
+
+
+def _paged_response(fetch, paging):
+	"""Call fetch(page_size, page_token) and wrap the page as {results, next_page_token}."""
+	try:
+		items, next_token = fetch(*paging)
+	except ValueError as exc:
+		return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+	return Response({"results": items, "next_page_token": next_token})
+
+
+@api_view(["GET"])
+def admin_metrics(request):
+	"""Per-process counters for the shared Firestore client and caches (admin only)."""
+	if not request.user or not request.user.is_authenticated:
+		return Response({"detail": "Authentication required"}, status=drf_status.HTTP_401_UNAUTHORIZED)
+	if not _is_request_admin(request):
+		return Response({"detail": "Admin privileges required"}, status=drf_status.HTTP_403_FORBIDDEN)
+	return Response({
+		"firestore_client": get_client_stats(),
+		"firestore_async_client": get_async_client_stats(),
+		"token_cache": token_cache_stats(),
+		"identity_cache": identity_cache_stats(),
+		"role_cache": role_cache_stats(),
+		"catalog_cache": catalog_cache_stats(),
+		"catalog_mirror": catalog_mirror_status(),
+		"singleflight": singleflight_stats(),
+		"fanout": fanout_stats(),
+		"booking_analytics": analytics_stats(),
+	})
+
+
 @api_view(["POST"])
 @permission_classes([AllowAny])
 def register(request):
@@ -121,8 +280,16 @@ def services_list(request):
 	"""
 	if request.method == "GET":
 		try:
-			data = list_services()
-			return Response(data)
+			paging = _page_params(request, default_size=50)
+			fields = _field_params(request)
+		except ValueError as exc:
+			return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+		try:
+			if paging:
+				response = _paged_response(lambda size, token: list_services_page(size, token, fields=fields), paging)
+			else:
+				response = Response(list_services(fields=fields))
+			return conditional_response(request, response, "services")
 		except Exception as exc:
 			# Graceful degradation: log and return empty list + error hint instead of 500
 			return Response({"services": [], "error": f"Failed to load services: {exc.__class__.__name__}"}, status=drf_status.HTTP_200_OK)
@@ -153,13 +320,29 @@ def services_list(request):
 	return Response(created, status=drf_status.HTTP_201_CREATED)
 
 
+@api_view(["GET"])
+def services_batch(request):
+	"""GET ?ids=a,b,c: several services in one round trip (public).
+	Returns {results: [...in request order], missing: [ids not found]}.
+	"""
+	try:
+		ids = _batch_ids(request)
+	except ValueError as exc:
+		return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+	found = get_services(ids)
+	return Response({
+		"results": [found[i] for i in ids if i in found],
+		"missing": [i for i in ids if i not in found],
+	})
+
+
 @api_view(["GET", "PUT", "DELETE"])
 def service_detail(request, service_id: str):
 	if request.method == "GET":
 		service = get_service(service_id)
 		if not service:
 			return Response({"detail": "Not found"}, status=drf_status.HTTP_404_NOT_FOUND)
-		return Response(service)
+		return conditional_response(request, Response(service), "service_detail")
 
 	# PUT/DELETE require admin
 	if not request.user or not request.user.is_authenticated:
@@ -169,10 +352,14 @@ def service_detail(request, service_id: str):
 
 	if request.method == "PUT":
 		payload = request.data or {}
+		# The catalog copy is the prior state, so the response needs no re-read
+		current = get_service(service_id)
+		if not current:
+			return Response({"detail": "Not found"}, status=drf_status.HTTP_404_NOT_FOUND)
 		updated = update_service(service_id, {
 			k: v for k, v in payload.items()
-			if k in {"title", "price", "category", "description", "duration", "image_url", "is_active"}
-		})
+			if k in SERVICE_FIELDS
+		}, current=current)
 		if not updated:
 			return Response({"detail": "Not found"}, status=drf_status.HTTP_404_NOT_FOUND)
 		return Response(updated)
@@ -192,7 +379,14 @@ def bookings(request):
 
 	user_uid = getattr(request.user, "firebase_uid", None)
 	if request.method == "GET":
-		data = list_bookings_for_user(user_uid)
+		try:
+			paging = _page_params(request, default_size=100)
+			fields = _field_params(request)
+		except ValueError as exc:
+			return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+		if paging:
+			return _paged_response(lambda size, token: list_bookings_for_user_page(user_uid, size, token, fields=fields), paging)
+		data = list_bookings_for_user(user_uid, fields=fields)
 		return Response(data)
 
 	# POST create booking
@@ -250,15 +444,19 @@ def booking_detail(request, booking_id: str):
 			update["status"] = "cancelled"
 		if not update:
 			return Response({"detail": "No updatable fields provided"}, status=drf_status.HTTP_400_BAD_REQUEST)
-		updated = update_booking(booking_id, update)
+		updated = update_booking(booking_id, update, current=b)
+		if not updated:
+			return Response({"detail": "Not found"}, status=drf_status.HTTP_404_NOT_FOUND)
 		return Response(updated)
 
 	# Admin can update status and address/time
 	if is_admin:
-		update = {k: v for k, v in payload.items() if k in {"status", "booking_date", "booking_time", "address", "total_price"}}
+		update = {k: v for k, v in payload.items() if k in ADMIN_BOOKING_FIELDS}
 		if not update:
 			return Response({"detail": "No updatable fields provided"}, status=drf_status.HTTP_400_BAD_REQUEST)
-		updated = update_booking(booking_id, update)
+		updated = update_booking(booking_id, update, current=b)
+		if not updated:
+			return Response({"detail": "Not found"}, status=drf_status.HTTP_404_NOT_FOUND)
 		return Response(updated)
 
 	return Response({"detail": "Forbidden"}, status=drf_status.HTTP_403_FORBIDDEN)
@@ -270,10 +468,257 @@ def admin_bookings(request):
 		return Response({"detail": "Authentication required"}, status=drf_status.HTTP_401_UNAUTHORIZED)
 	if not _is_request_admin(request):
 		return Response({"detail": "Admin privileges required"}, status=drf_status.HTTP_403_FORBIDDEN)
-	data = list_all_bookings()
+	try:
+		fields = _field_params(request)
+		filters, sort = _booking_filter_params(request)
+	except ValueError as exc:
+		return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+	query = {"fields": fields, "filters": filters, "sort": sort}
+	fmt = stream_format(request)
+	if fmt:
+		# Encode documents as they arrive instead of buffering the whole collection
+		return streaming_json_response(iter_all_bookings(**query), fmt)
+	try:
+		paging = _page_params(request, default_size=100)
+	except ValueError as exc:
+		return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+	if paging:
+		return _paged_response(lambda size, token: list_all_bookings_page(size, token, **query), paging)
+	data = list_all_bookings(**query)
 	return Response(data)
 
 
+@api_view(["GET"])
+def admin_bookings_export(request):
+	"""GET: every matching booking as a streamed download (admin only).
+
+	?output=csv (default) or ndjson; the admin listing's filters apply
+	(status, service_id, user_id, booking_date or booking_date_from/_to, sort)
+	and ?fields= picks the columns. Unlike the listing there is no cap.
+	"""
+	if not request.user or not request.user.is_authenticated:
+		return Response({"detail": "Authentication required"}, status=drf_status.HTTP_401_UNAUTHORIZED)
+	if not _is_request_admin(request):
+		return Response({"detail": "Admin privileges required"}, status=drf_status.HTTP_403_FORBIDDEN)
+	# Not ?format=, which DRF reserves for picking a renderer
+	fmt = (request.query_params.get("output") or "csv").lower()
+	if fmt not in EXPORT_FORMATS:
+		return Response({"detail": f"output must be one of: {', '.join(EXPORT_FORMATS)}"}, status=drf_status.HTTP_400_BAD_REQUEST)
+	try:
+		fields = _field_params(request)
+		filters, sort = _booking_filter_params(request)
+	except ValueError as exc:
+		return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+	columns = ("id",) + fields if fields else BOOKING_EXPORT_COLUMNS
+
+	content_type = CSV_CONTENT_TYPE if fmt == "csv" else NDJSON_CONTENT_TYPE
+	response = StreamingHttpResponse(booking_export_chunks(fmt, filters, sort, columns), content_type=content_type)
+	response["Content-Disposition"] = f'attachment; filename="{export_filename(fmt, filters)}"'
+	response["Cache-Control"] = "no-store"
+	# Tell reverse proxies (nginx) not to buffer the whole body before sending it on
+	response["X-Accel-Buffering"] = "no"
+	return response
+
+
+# Largest by_service list /api/admin/analytics/bookings/ returns
+MAX_ANALYTICS_TOP = 200
+
+
+def _analytics_params(request):
+	"""Return booking_analytics() keyword arguments from the query string.
+	Raises ValueError for bad input.
+	"""
+	params = request.query_params
+	query = {
+		"date_field": params.get("date_field") or "booking_date",
+		"bucket": params.get("bucket") or "day",
+		"service_id": params.get("service_id") or None,
+	}
+	if query["date_field"] not in ANALYTICS_DATE_FIELDS:
+		raise ValueError(f"date_field must be one of: {', '.join(ANALYTICS_DATE_FIELDS)}")
+	if query["bucket"] not in ANALYTICS_BUCKETS:
+		raise ValueError(f"bucket must be one of: {', '.join(ANALYTICS_BUCKETS)}")
+	for name in ("date_from", "date_to"):
+		value = params.get(name)
+		try:
+			query[name] = date.fromisoformat(value).isoformat() if value else None
+		except ValueError:
+			raise ValueError(f"{name} must be a YYYY-MM-DD date")
+	statuses = [s.strip() for s in (params.get("status") or "").split(",") if s.strip()]
+	for value in statuses:
+		if value not in ANALYTICS_STATUSES:
+			raise ValueError(f"Unknown status: {value!r}")
+	query["statuses"] = tuple(dict.fromkeys(statuses)) or None
+	try:
+		query["top"] = int(params.get("top") or 20)
+	except ValueError:
+		raise ValueError("top must be an integer")
+	if not 0 <= query["top"] <= MAX_ANALYTICS_TOP:
+		raise ValueError(f"top must be between 0 and {MAX_ANALYTICS_TOP}")
+	return query
+
+
+@api_view(["GET"])
+def admin_booking_analytics(request):
+	"""GET: booking volume and revenue in total, per status, per service and
+	per day/week/month (admin only). See core.analytics.
+
+	Query: date_field (booking_date or created_at), date_from/date_to
+	(inclusive, on date_field), bucket (day, week, month), status
+	(comma-separated), service_id, top (services listed, default 20) and
+	refresh=1 to start a full reload in the background (at most once per
+	ANALYTICS_REFRESH seconds). Answers 503 with Retry-After until this
+	process has loaded the bookings once.
+	"""
+	if not request.user or not request.user.is_authenticated:
+		return Response({"detail": "Authentication required"}, status=drf_status.HTTP_401_UNAUTHORIZED)
+	if not _is_request_admin(request):
+		return Response({"detail": "Admin privileges required"}, status=drf_status.HTTP_403_FORBIDDEN)
+	try:
+		query = _analytics_params(request)
+	except ValueError as exc:
+		return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+	refreshing = request.query_params.get("refresh") in {"1", "true", "yes"} and request_full_refresh()
+	try:
+		data = booking_analytics(**query)
+	except AnalyticsNotReady as exc:
+		response = Response({"detail": "Bookings are still loading; retry shortly"}, status=drf_status.HTTP_503_SERVICE_UNAVAILABLE)
+		response["Retry-After"] = str(exc.retry_after)
+		return response
+	if refreshing:
+		data = {**data, "refreshing": True}
+	response = Response(data)
+	response["Cache-Control"] = "private, no-cache"
+	return response
+
+
+# Upper bound on operations accepted by the bulk endpoints in one request
+MAX_BULK_OPERATIONS = 1000
+ADMIN_BOOKING_FIELDS = {"status", "booking_date", "booking_time", "address", "total_price"}
+SERVICE_FIELDS = {"title", "price", "category", "description", "duration", "image_url", "is_active"}
+
+
+def _bulk_operations(request):
+	"""Return the request's operations as a list of dicts, each with an `id`.
+
+	Accepts {"operations": [{"id": ..., ...}, ...]} or the shorthand
+	{"ids": [...], <shared fields>} which applies the shared fields to every id.
+	Raises ValueError for malformed bodies (an operation or its `update` that is
+	not an object), duplicate ids or too many operations.
+	"""
+	payload = request.data or {}
+	operations = payload.get("operations")
+	if operations is None and isinstance(payload.get("ids"), list):
+		shared = {k: v for k, v in payload.items() if k != "ids"}
+		operations = [{**shared, "id": i} for i in payload["ids"]]
+	if not isinstance(operations, list) or not operations:
+		raise ValueError("'operations' (or 'ids') must be a non-empty list")
+	if len(operations) > MAX_BULK_OPERATIONS:
+		raise ValueError(f"At most {MAX_BULK_OPERATIONS} operations per request")
+	seen = set()
+	for op in operations:
+		if not isinstance(op, dict) or not isinstance(op.get("id"), str) or not op["id"]:
+			raise ValueError("Every operation needs a string 'id'")
+		if op["id"] in seen:
+			raise ValueError(f"Duplicate id: {op['id']}")
+		if "update" in op and not isinstance(op["update"], dict):
+			raise ValueError(f"'update' must be an object: {op['id']}")
+		seen.add(op["id"])
+	return operations
+
+
+def _bulk_response(ids, results, extra=None):
+	"""Per-item outcome in request order, plus totals."""
+	rows = []
+	for i in ids:
+		error = results.get(i)
+		rows.append({"id": i, "ok": True} if error is None else {"id": i, "ok": False, "error": error})
+	succeeded = sum(1 for row in rows if row["ok"])
+	return Response({"results": rows, "succeeded": succeeded, "failed": len(rows) - succeeded, **(extra or {})})
+
+
+@api_view(["POST"])
+def admin_bookings_bulk(request):
+	"""POST {"operations": [{"id", "update": {...}}]} or {"ids": [...], "update": {...}}.
+	Same fields as an admin booking_detail PATCH, written in batches.
+	"""
+	if not request.user or not request.user.is_authenticated:
+		return Response({"detail": "Authentication required"}, status=drf_status.HTTP_401_UNAUTHORIZED)
+	if not _is_request_admin(request):
+		return Response({"detail": "Admin privileges required"}, status=drf_status.HTTP_403_FORBIDDEN)
+	try:
+		operations = _bulk_operations(request)
+	except ValueError as exc:
+		return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+	results, updates = {}, {}
+	for op in operations:
+		update = {k: v for k, v in (op.get("update") or {}).items() if k in ADMIN_BOOKING_FIELDS}
+		if update:
+			updates[op["id"]] = update
+		else:
+			results[op["id"]] = "no_updatable_fields"
+	if updates:
+		results.update(bulk_update_bookings(updates))
+	return _bulk_response([op["id"] for op in operations], results)
+
+
+@api_view(["POST"])
+def admin_services_bulk(request):
+	"""POST {"operations": [{"op": "delete", "id"}, {"op": "update", "id", "update": {...}}]}
+	or {"ids": [...], "op": "delete"}. Written in batches; the catalog is invalidated once.
+	"""
+	if not request.user or not request.user.is_authenticated:
+		return Response({"detail": "Authentication required"}, status=drf_status.HTTP_401_UNAUTHORIZED)
+	if not _is_request_admin(request):
+		return Response({"detail": "Admin privileges required"}, status=drf_status.HTTP_403_FORBIDDEN)
+	try:
+		operations = _bulk_operations(request)
+	except ValueError as exc:
+		return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+	results, writes = {}, []
+	for op in operations:
+		kind = op.get("op")
+		update = {k: v for k, v in (op.get("update") or {}).items() if k in SERVICE_FIELDS}
+		if kind == "delete":
+			writes.append(("delete", op["id"], None))
+		elif kind == "update" and update:
+			writes.append(("update", op["id"], update))
+		elif kind == "update":
+			results[op["id"]] = "no_updatable_fields"
+		else:
+			results[op["id"]] = "unknown_op"
+	if writes:
+		results.update(bulk_write_services(writes))
+	return _bulk_response([op["id"] for op in operations], results)
+
+
+@api_view(["POST"])
+def admin_roles_bulk(request):
+	"""POST {"operations": [{"id": uid, "role": "admin"|"user"}]} or {"ids": [...], "role": ...}."""
+	if not request.user or not request.user.is_authenticated:
+		return Response({"detail": "Authentication required"}, status=drf_status.HTTP_401_UNAUTHORIZED)
+	if not _is_request_admin(request):
+		return Response({"detail": "Admin privileges required"}, status=drf_status.HTTP_403_FORBIDDEN)
+	try:
+		operations = _bulk_operations(request)
+	except ValueError as exc:
+		return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+	results, roles = {}, {}
+	for op in operations:
+		if op.get("role") in {"admin", "user"}:
+			roles[op["id"]] = op["role"]
+		else:
+			results[op["id"]] = "invalid_role"
+	claim_errors = {}
+	if roles:
+		written, claim_errors = bulk_set_user_roles(roles)
+		results.update(written)
+	return _bulk_response([op["id"] for op in operations], results, {"claim_errors": claim_errors})
+
+
 @api_view(["GET", "PUT"])
 def me(request):
 	if not request.user or not request.user.is_authenticated:
@@ -285,7 +730,8 @@ def me(request):
 		email = getattr(request.user, "email", None)
 		if email:
 			prof.setdefault("email", email)
-		return Response(prof)
+		# Per-user body: never let a shared cache answer for another token
+		return conditional_response(request, Response(prof), "me", last_modified=prof.get("updated_at"), vary=["Authorization"])
 
 	# PUT update
 	payload = request.data or {}
@@ -293,7 +739,12 @@ def me(request):
 	update = {k: v for k, v in payload.items() if k in allowed}
 	if not update:
 		return Response({"detail": "No updatable fields provided"}, status=drf_status.HTTP_400_BAD_REQUEST)
+	# One write, no read: the response holds the written fields (plus id and
+	# updated_at); clients that need the rest already have it from GET
 	saved = upsert_profile(uid, update)
+	email = getattr(request.user, "email", None)
+	if email:
+		saved.setdefault("email", email)
 	return Response(saved)
 
 
@@ -302,11 +753,11 @@ def me_stats(request):
 	if not request.user or not request.user.is_authenticated:
 		return Response({"detail": "Authentication required"}, status=drf_status.HTTP_401_UNAUTHORIZED)
 	uid = getattr(request.user, "firebase_uid", None)
-	bookings = list_bookings_for_user(uid, limit=1000)
-	total = len(bookings)
-	completed = len([b for b in bookings if b.get("status") == "completed"])
-	pending = len([b for b in bookings if b.get("status") == "pending"])
-	return Response({"total": total, "completed": completed, "pending": pending})
+	# One document read; the counters are built on first use for older accounts
+	stats = get_booking_stats(uid)
+	if stats is None:
+		stats = rebuild_booking_stats(uid)
+	return Response(stats)
 
 
 @api_view(["GET"])
@@ -316,19 +767,41 @@ def admin_users(request):
 	if not _is_request_admin(request):
 		return Response({"detail": "Admin privileges required"}, status=drf_status.HTTP_403_FORBIDDEN)
 
-	# Fetch auth users and merge with profile and role info so all accounts appear
-	auth_users = list_auth_users()
-	profiles_map = list_profiles_map()
-	roles_map = list_roles_map()
-
-	enriched = []
+	# Fetch auth users and merge with profile and role info so all accounts appear.
+	# The sources are independent, so they are fetched concurrently.
+	fmt = stream_format(request)
+	sources = {"profiles": list_profiles_map, "roles": list_roles_map}
+	if not fmt:
+		sources["auth_users"] = list_auth_users
+	gathered = gather(sources, timeout=getattr(settings, "ADMIN_USERS_SOURCE_TIMEOUT", 15))
+	if len(gathered.errors) == len(sources):
+		return Response({"detail": "Failed to load users", "failed_sources": gathered.failed}, status=drf_status.HTTP_503_SERVICE_UNAVAILABLE)
+
+	profiles_map = gathered.get("profiles", {})
+	roles_map = gathered.get("roles", {})
+	if fmt:
+		# Streamed rows follow the Firebase Auth listing order (no created_at sort)
+		response = streaming_json_response(_merge_admin_users(iter_auth_users(limit=1000000), profiles_map, roles_map), fmt)
+	else:
+		enriched = list(_merge_admin_users(gathered.get("auth_users", []), profiles_map, roles_map))
+		# Sort by created_at desc when available
+		enriched.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+		response = Response(enriched)
+	if gathered.partial:
+		# Let the admin UI flag incomplete data instead of failing the whole page
+		response["X-Partial-Result"] = ",".join(gathered.failed)
+	return response
+
+
+def _merge_admin_users(auth_users, profiles_map, roles_map):
+	"""Yield admin user rows: auth users enriched with profile/role data, then orphan profiles."""
 	seen = set()
 	for u in auth_users:
 		uid2 = u.get("id")
 		p = profiles_map.get(uid2, {})
 		role_val = roles_map.get(uid2)
 		roles = [role_val] if role_val else []
-		enriched.append({
+		yield {
 			"id": uid2,
 			"name": (p.get("name") or u.get("name") or "").strip(),
 			"email": (p.get("email") or u.get("email") or "").strip(),
@@ -336,7 +809,7 @@ def admin_users(request):
 			"address": p.get("address"),
 			"created_at": p.get("created_at") or u.get("created_at"),
 			"roles": roles,
-		})
+		}
 		seen.add(uid2)
 
 	# Include any profile docs without a corresponding auth user (edge cases)
@@ -345,7 +818,7 @@ def admin_users(request):
 			continue
 		role_val = roles_map.get(pid)
 		roles = [role_val] if role_val else []
-		enriched.append({
+		yield {
 			"id": p.get("id"),
 			"name": p.get("name", ""),
 			"email": p.get("email", ""),
@@ -353,11 +826,38 @@ def admin_users(request):
 			"address": p.get("address"),
 			"created_at": p.get("created_at"),
 			"roles": roles,
-		})
+		}
+
 
-	# Sort by created_at desc when available
-	enriched.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-	return Response(enriched)
+@api_view(["GET"])
+def admin_profiles_batch(request):
+	"""GET ?ids=uid1,uid2: profiles with their roles for several users (admin only).
+	Profiles and roles are each fetched with one batched read, concurrently.
+	"""
+	if not request.user or not request.user.is_authenticated:
+		return Response({"detail": "Authentication required"}, status=drf_status.HTTP_401_UNAUTHORIZED)
+	if not _is_request_admin(request):
+		return Response({"detail": "Admin privileges required"}, status=drf_status.HTTP_403_FORBIDDEN)
+	try:
+		ids = _batch_ids(request)
+	except ValueError as exc:
+		return Response({"detail": str(exc)}, status=drf_status.HTTP_400_BAD_REQUEST)
+
+	gathered = gather({"profiles": lambda: get_profiles(ids), "roles": lambda: get_user_roles(ids)})
+	if "profiles" in gathered.errors:
+		return Response({"detail": "Failed to load profiles"}, status=drf_status.HTTP_503_SERVICE_UNAVAILABLE)
+	profiles = gathered.get("profiles", {})
+	roles = gathered.get("roles", {})
+	results = []
+	for uid in ids:
+		if uid not in profiles:
+			continue
+		role_val = (roles.get(uid) or {}).get("role")
+		results.append({**profiles[uid], "roles": [role_val] if role_val else []})
+	response = Response({"results": results, "missing": [i for i in ids if i not in profiles]})
+	if gathered.partial:
+		response["X-Partial-Result"] = ",".join(gathered.failed)
+	return response
 
 
 @api_view(["POST"])
@@ -382,7 +882,7 @@ def categories(request):
 	POST: create a category (admin only) with JSON { name }
 	"""
 	if request.method == "GET":
-		return Response(list_categories())
+		return conditional_response(request, Response(list_categories()), "categories")
 
 	# POST admin only
 	if not request.user or not request.user.is_authenticated:
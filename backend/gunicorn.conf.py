@@ -0,0 +1,13 @@
+# Loaded automatically by `gunicorn` started from this directory (see Procfile).
+
+
+def post_worker_init(worker):
+    # Warm the Firestore client in each worker, after fork. CoreConfig.ready()
+    # skips gunicorn because with --preload it runs in the master, and a
+    # channel opened there would be inherited by every worker.
+    from django.conf import settings
+
+    if getattr(settings, "FIRESTORE_WARMUP", True):
+        from core.apps import start_firestore_warmup
+
+        start_firestore_warmup()
@@ -26,19 +26,16 @@ const Index = () => {
   const [bookingTime, setBookingTime] = useState("");
   const [bookingAddress, setBookingAddress] = useState("");
   const [backendStatus, setBackendStatus] = useState<string | null>(null);
-  useEffect(() => {
-    api.get('/api/status/')
-      .then((data) => setBackendStatus(String((data as any)?.status ?? "unknown")))
-      .catch(() => setBackendStatus("offline"));
-  }, []);
-
   const [services, setServices] = useState<any[]>([]);
   useEffect(() => {
+    // Status and services arrive together from /api/bootstrap/ (one request, 304 on reload)
     const load = async () => {
       try {
-        const data = await api.get<any[]>("/api/services/");
-        setServices(Array.isArray(data) ? data.slice(0, 6) : []); // featured: first 6
+        const data = await api.get<any>("/api/bootstrap/");
+        setBackendStatus(String(data?.status ?? "unknown"));
+        setServices(Array.isArray(data?.services) ? data.services.slice(0, 6) : []); // featured: first 6
       } catch {
+        setBackendStatus("offline");
         setServices([]);
       }
     };
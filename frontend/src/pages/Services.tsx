@@ -36,8 +36,9 @@ const Services = () => {
 
   const loadServices = async () => {
     try {
-      const data = await api.get<any[]>("/api/services/");
-      setServices(data || []);
+      // Shares the /api/bootstrap/ response (and its HTTP cache entry) with the home page
+      const data = await api.get<any>("/api/bootstrap/");
+      setServices(Array.isArray(data?.services) ? data.services : []);
     } catch (e) {
       // eslint-disable-next-line no-console
       console.warn("Failed to load services", e);
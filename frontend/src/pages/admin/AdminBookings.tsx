@@ -41,11 +41,13 @@ const AdminBookings = () => {
       loadBookings();
     });
     return () => unsub();
-  }, []);
+  }, [statusFilter]);
 
   const loadBookings = async () => {
     try {
-      const data = await api.get<Booking[]>("/api/admin/bookings/", true);
+      // Status is filtered by the server so older bookings are not cut off by the listing limit
+      const params = statusFilter === "all" ? "" : `?status=${encodeURIComponent(statusFilter)}`;
+      const data = await api.get<Booking[]>(`/api/admin/bookings/${params}`, true);
       setBookings(data);
     } catch (e) {
       // eslint-disable-next-line no-console